@@ -4,12 +4,17 @@ This module provides classes for creating LangGraph-based agents that can handle
 travel planning queries using various tools and LLM providers.
 """
 
+import hashlib
+import threading
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, MessagesState, END, START
 from langgraph.prebuilt import ToolNode, tools_condition
 
+from utils.call_memo import memoize_tool
+from utils.metrics import instrument_tool, timed
 from utils.model_loaders import ModelLoader
 from prompt_library.prompt import get_budget_aware_system_prompt
 
@@ -77,6 +82,10 @@ class GraphBuilder:  # pylint: disable=too-many-instance-attributes
         # compiled graph cache
         self.graph = None
 
+        # rendered topology cache: (png bytes, etag)
+        self._graph_png: Optional[Tuple[bytes, str]] = None
+        self._graph_png_lock = threading.Lock()
+
     # ---- Model / LLM helpers ----
     @property
     def model_loader(self) -> ModelLoader:
@@ -116,14 +125,19 @@ class GraphBuilder:  # pylint: disable=too-many-instance-attributes
     def _collect_tools(self) -> List:
         """
         Flatten all tool lists from tool containers into a single list.
+
+        Async tool calls are routed through the active call memo, so identical
+        calls made by the plans of one batch reach the external APIs once.
+        Every tool call is timed under its tool name.
         """
-        return [
+        tools = [
             *self.weather_tools.weather_tool_list,
             *self.place_search_tools.place_search_tool_list,
             *self.calculator_tools.calculator_tool_list,
             *self.currency_converter_tools.currency_converter_tool_list,
             *self.distance_calculator_tools.distance_tool_list,
         ]
+        return [instrument_tool(memoize_tool(tool)) for tool in tools]
 
     # ---- Agent logic ----
     def _compose_input(self, user_messages: List[str]) -> List[str]:
@@ -139,7 +153,18 @@ class GraphBuilder:  # pylint: disable=too-many-instance-attributes
         """
         user_messages = state["messages"]
         llm_input = self._compose_input(user_messages)
-        response = self.llm_with_tools.invoke(llm_input)
+        with timed("llm", "agent"):
+            response = self.llm_with_tools.invoke(llm_input)
+        return {"messages": [response]}
+
+    async def aagent_function(self, state: MessagesState):
+        """
+        Async variant of agent_function, used when the graph runs via ainvoke.
+        """
+        user_messages = state["messages"]
+        llm_input = self._compose_input(user_messages)
+        with timed("llm", "agent"):
+            response = await self.llm_with_tools.ainvoke(llm_input)
         return {"messages": [response]}
 
     # ---- Graph construction ----
@@ -151,7 +176,10 @@ class GraphBuilder:  # pylint: disable=too-many-instance-attributes
             return self.graph
 
         graph_builder = StateGraph(MessagesState)
-        graph_builder.add_node("agent", self.agent_function)
+        graph_builder.add_node(
+            "agent",
+            RunnableLambda(self.agent_function, afunc=self.aagent_function),
+        )
         graph_builder.add_node("tools", ToolNode(tools=self.tools))
 
         graph_builder.add_edge(START, "agent")
@@ -162,5 +190,20 @@ class GraphBuilder:  # pylint: disable=too-many-instance-attributes
         self.graph = graph_builder.compile()
         return self.graph
 
+    def render_graph_png(self) -> Tuple[bytes, str]:
+        """
+        Render the compiled graph topology as a Mermaid PNG, once per builder.
+
+        Returns:
+            tuple: PNG bytes and a strong ETag derived from their content
+        """
+        if self._graph_png is None:
+            with self._graph_png_lock:
+                if self._graph_png is None:
+                    png = self.build_graph().get_graph().draw_mermaid_png()
+                    etag = f'"{hashlib.sha256(png).hexdigest()[:32]}"'
+                    self._graph_png = (png, etag)
+        return self._graph_png
+
     def __call__(self) -> StateGraph:
         return self.build_graph()
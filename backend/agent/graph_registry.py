@@ -0,0 +1,191 @@
+"""Graph registry module for reusing compiled travel planning agents.
+
+Building a GraphBuilder is expensive: it creates every tool instance, loads the
+IATA airport data, instantiates the LLM client, binds the tools and compiles
+the StateGraph. This module keeps one compiled graph per budget preference and
+model configuration for the lifetime of the process, so requests only pay that
+cost once. The registry is cleared whenever reload_config() is called.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from agent.agentic_workflow import GraphBuilder
+from utils.config_loaders import (
+    ConfigLoaderError,
+    load_config,
+    register_reload_callback,
+)
+from utils.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+BUDGET_PREFERENCES = ("cheapest", "budget_friendly", "luxurious")
+DEFAULT_BUDGET_PREFERENCE = "budget_friendly"
+
+
+def normalize_budget_preference(
+    budget_preference: Optional[str], default: Optional[str] = None
+) -> str:
+    """
+    Map a budget preference onto one of BUDGET_PREFERENCES.
+
+    Case, surrounding whitespace and "-"/" " separators are ignored, so
+    "Budget Friendly" becomes "budget_friendly".
+
+    Args:
+        budget_preference: The value sent by the client
+        default: Returned for unknown values; when None they raise instead
+
+    Raises:
+        ValueError: If the value is unknown and no default is given
+    """
+    normalized = "_".join(
+        (budget_preference or "").strip().lower().replace("-", " ").split()
+    )
+    if normalized in BUDGET_PREFERENCES:
+        return normalized
+    if default is not None:
+        return default
+    raise ValueError(
+        f"Unknown budget preference {budget_preference!r}; "
+        f"expected one of {', '.join(BUDGET_PREFERENCES)}"
+    )
+
+
+@dataclass(frozen=True)
+class GraphKey:
+    """Identifies a compiled graph by budget preference and model configuration.
+
+    Attributes:
+        budget_preference: Travel budget preference the system prompt is built for
+        model_provider: The LLM provider ("groq")
+        model_name: The model name configured for the provider
+    """
+
+    budget_preference: str
+    model_provider: str = "groq"
+    model_name: str = ""
+
+
+def default_graph_factory(key: GraphKey) -> GraphBuilder:
+    """Create a GraphBuilder for the given key using API keys from the environment."""
+    return GraphBuilder(
+        tavily_api_key=os.getenv("TAVILY_API_KEY"),
+        exchange_rate_api_key=os.getenv("EXCHANGE_RATE_API_KEY"),
+        weather_api_key=os.getenv("WEATHER_API_KEY"),
+        weather_base_url=os.getenv("WEATHER_BASE_URL"),
+        openroute_api_key=os.getenv("OPENROUTE_API_KEY"),
+        model_provider=key.model_provider,
+        budget_preference=key.budget_preference,
+    )
+
+
+class GraphRegistry:
+    """Process-wide pool of compiled agent graphs.
+
+    Compiled graphs hold no per-request state (there is no checkpointer), so a
+    single instance can safely serve concurrent invocations. Builds are
+    serialized with a lock so that concurrent first requests for the same key
+    do not each construct their own graph.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[GraphKey], GraphBuilder] = default_graph_factory,
+        model_provider: str = "groq",
+    ):
+        self._factory = factory
+        self.model_provider = model_provider
+        self._builders: Dict[GraphKey, GraphBuilder] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        register_reload_callback(self.invalidate)
+
+    def _model_name(self) -> str:
+        try:
+            return str(load_config()["llm"][self.model_provider]["model_name"])
+        except (ConfigLoaderError, KeyError, TypeError):
+            return ""
+
+    def key_for(self, budget_preference: str) -> GraphKey:
+        """
+        Return the registry key for a budget preference under the current config.
+
+        Raises:
+            ValueError: If the budget preference is not one of BUDGET_PREFERENCES,
+                so arbitrary client input never compiles and caches a graph
+        """
+        return GraphKey(
+            budget_preference=normalize_budget_preference(budget_preference),
+            model_provider=self.model_provider,
+            model_name=self._model_name(),
+        )
+
+    def _build(self, key: GraphKey) -> GraphBuilder:
+        with timed("graph", "build"):
+            builder = self._factory(key)
+            builder()  # compile the StateGraph
+            _ = builder.llm_with_tools  # create the LLM client and bind tools
+        return builder
+
+    def get_builder(self, budget_preference: str) -> GraphBuilder:
+        """Return the cached GraphBuilder for a budget preference, building it if needed."""
+        key = self.key_for(budget_preference)
+        builder = self._builders.get(key)
+        if builder is not None:
+            return builder
+
+        with self._lock:
+            builder = self._builders.get(key)
+            if builder is None:
+                generation = self._generation
+                logger.info("Building agent graph for %s", key)
+                builder = self._build(key)
+                if generation == self._generation:
+                    self._builders[key] = builder
+        return builder
+
+    def get(self, budget_preference: str):
+        """Return the compiled graph for a budget preference."""
+        return self.get_builder(budget_preference)()
+
+    def get_graph_png(self, budget_preference: str) -> Tuple[bytes, str]:
+        """Return the cached Mermaid PNG and ETag for a budget preference's graph."""
+        return self.get_builder(budget_preference).render_graph_png()
+
+    def warm_up(
+        self, budget_preferences: Iterable[str] = BUDGET_PREFERENCES
+    ) -> Dict[str, Optional[str]]:
+        """
+        Build graphs ahead of the first request.
+
+        Failures are logged and reported rather than raised so that a missing
+        API key does not prevent the application from starting.
+
+        Returns:
+            dict: Maps each budget preference to None on success or an error message
+        """
+        results: Dict[str, Optional[str]] = {}
+        for budget_preference in budget_preferences:
+            try:
+                self.get_builder(budget_preference)
+                results[budget_preference] = None
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    "Could not pre-build graph for %s: %s", budget_preference, e
+                )
+                results[budget_preference] = str(e)
+        return results
+
+    def invalidate(self) -> None:
+        """Drop every cached graph so the next request rebuilds from fresh config."""
+        with self._lock:
+            self._generation += 1
+            self._builders.clear()
+
+    def __len__(self) -> int:
+        return len(self._builders)
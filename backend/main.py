@@ -2,28 +2,71 @@
 
 This module provides REST API endpoints for travel planning, including:
 - Travel query processing with budget preferences
+- Streaming travel plans over Server-Sent Events
+- Batch travel planning streamed as NDJSON
+- Per-stage latency as Server-Timing headers and Prometheus metrics
+- Queued travel planning jobs with backpressure
 - Car rental integration
 - Airport distance calculations
 - Word document export functionality
 """
 
+import asyncio
+import json
 import os
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
 
-from airportsdata import load
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel
-
-from agent.agentic_workflow import GraphBuilder
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, field_validator
+
+from agent.graph_registry import (
+    DEFAULT_BUDGET_PREFERENCE,
+    GraphRegistry,
+    normalize_budget_preference,
+)
 from utils.airport_distance_calculator import AirportDistanceCalculator
+from utils.airport_index import get_airport_index
+from utils.call_memo import CallMemo, memoized_call
 from utils.car_rental_service import CarRentalService
+from utils.config_loaders import get_config_value
+from utils.executor import run_blocking, shutdown_executor
+from utils.geocode_cache import get_geocode_cache
+from utils.http_client import close_async_client, close_session
+from utils.job_queue import JobManager, QueueFullError
+from utils.metrics import REGISTRY, observe_request
+from utils.response_cache import ResponseCache, build_cache_key
+from utils.road_estimator import get_road_estimator
+from utils.route_cache import get_route_cache
+from utils.single_flight import SingleFlight
+from utils.snap_cache import get_snap_cache
+from utils.timing import StageTimer
+from utils.weather_cache import get_weather_cache
 from utils.word_document_exporter import WordDocumentExporter
 
 load_dotenv()  # Load environment variables from .env file
 
-app = FastAPI()
+graph_registry = GraphRegistry(model_provider="groq")
+response_cache = ResponseCache.from_config()
+single_flight = SingleFlight()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Pre-build the airport index and agent graphs, release pooled resources on exit."""
+    await run_blocking(get_airport_index)
+    await run_blocking(graph_registry.warm_up)
+    job_manager.start()
+    yield
+    await job_manager.stop()
+    await close_async_client()
+    close_session()
+    shutdown_executor()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 class QueryRequest(BaseModel):
@@ -38,6 +81,21 @@ class QueryRequest(BaseModel):
     endLocationCode: Optional[str] = None  # IATA or city code for destination
     startCity: Optional[str] = None  # City name for origin (optional)
     endCity: Optional[str] = None  # City name for destination (optional)
+    cache_bypass: bool = False  # Neither read nor write the response cache
+    cache_refresh: bool = False  # Recompute and overwrite the cached response
+
+    @field_validator("budget_preference")
+    @classmethod
+    def _normalize_budget_preference(cls, value: str) -> str:
+        """Normalize once so the cache key, graph and prompt use the same value."""
+        return normalize_budget_preference(value, default=DEFAULT_BUDGET_PREFERENCE)
+
+
+class BatchQueryRequest(BaseModel):
+    """Request model for planning several trips in one call."""
+
+    queries: List[QueryRequest]
+    max_concurrency: Optional[int] = None  # Capped by batch.max_concurrency
 
 
 class WordExportRequest(BaseModel):
@@ -47,94 +105,211 @@ class WordExportRequest(BaseModel):
     query_info: Optional[Dict[str, Any]] = None
 
 
-@app.post("/query")
-# pylint: disable=too-many-locals,too-many-branches,too-many-statements
-async def query_travel_agent(query: QueryRequest):
-    """
-    Example request body:
-        {
-            "query": "Plan a trip from New York to London",
-            "startLocationCode": "JFK",
-            "endLocationCode": "LHR"
-        }
-    """
+def _build_enhanced_query(query: QueryRequest, budget_preference: str) -> str:
+    """Compose the user prompt with budget and location context."""
+    # Support both 'query' and 'question' fields
+    user_query = query.query if query.query is not None else query.question
+
+    # Add budget context to the query
+    budget_display = {
+        "cheapest": "ultra budget-friendly",
+        "budget_friendly": "good value for money",
+        "luxurious": "premium luxury",
+    }.get(budget_preference, "good value for money")
+
+    # Add airport context to the query if provided
+    has_location_context = (
+        query.startLocationCode
+        or query.endLocationCode
+        or query.startCity
+        or query.endCity
+    )
+    if has_location_context:
+        context_info = []
+        if query.startLocationCode:
+            context_info.append(f"Starting from airport: {query.startLocationCode}")
+        if query.endLocationCode:
+            context_info.append(f"Destination airport: {query.endLocationCode}")
+        if query.startCity:
+            context_info.append(f"Starting city: {query.startCity}")
+        if query.endCity:
+            context_info.append(f"Destination city: {query.endCity}")
+
+        context_str = ", ".join(context_info)
+        return (
+            f"{user_query}\n\n"
+            f"Budget Preference: I prefer {budget_display} travel options.\n\n"
+            f"Additional Context: {context_str}\n\n"
+            "Please include distance information from airports to attractions "
+            "in your response and tailor all recommendations to my budget preference."
+        )
+    return (
+        f"{user_query}\n\n"
+        f"Budget Preference: I prefer {budget_display} travel options.\n\n"
+        "Please include distance information from airports to attractions "
+        "in your response and tailor all recommendations to my budget preference."
+    )
+
+
+def _build_car_rental_section(query: QueryRequest) -> str:
+    """Search Amadeus transfer offers and format them as a report section."""
+    car_rental_section = "\n\n## Car Rental Options\n"
     try:
-        # Get budget preference from request
-        budget_preference = getattr(query, "budget_preference", "budget_friendly")
-        print(f"Budget preference: {budget_preference}")
+        car_rental_service = CarRentalService()
+        airport_index = get_airport_index()
 
-        # Load API keys from environment variables
-        tavily_api_key = os.getenv("TAVILY_API_KEY")
-        exchange_rate_api_key = os.getenv("EXCHANGE_RATE_API_KEY")
-        weather_api_key = os.getenv("WEATHER_API_KEY")
-        weather_base_url = os.getenv("WEATHER_BASE_URL")
-        openroute_api_key = os.getenv("OPENROUTE_API_KEY")
-
-        # Initialize graph with budget preference and API keys
-        graph = GraphBuilder(
-            tavily_api_key=tavily_api_key,
-            exchange_rate_api_key=exchange_rate_api_key,
-            weather_api_key=weather_api_key,
-            weather_base_url=weather_base_url,
-            openroute_api_key=openroute_api_key,
-            model_provider="groq",
-            budget_preference=budget_preference,
+        # Use codes from request, or try to convert city names, fallback to CCU
+        start_code = (
+            query.startLocationCode or airport_index.best(query.startCity) or "CCU"
         )
-        react_app = graph()
-
-        png_graph = react_app.get_graph().draw_mermaid_png()
-        with open("my_graph.png", "wb") as f:
-            f.write(png_graph)
-
-        print(f"Graph saved as 'my_graph.png' in {os.getcwd()}")
-
-        # Support both 'query' and 'question' fields
-        user_query = query.query if query.query is not None else query.question
-
-        # Add budget context to the query
-        budget_display = {
-            "cheapest": "ultra budget-friendly",
-            "budget_friendly": "good value for money",
-            "luxurious": "premium luxury",
-        }.get(budget_preference, "good value for money")
-
-        # Add airport context to the query if provided
-        has_location_context = (
-            query.startLocationCode
-            or query.endLocationCode
-            or query.startCity
-            or query.endCity
+        end_code = query.endLocationCode or airport_index.best(query.endCity) or "CCU"
+
+        car_rentals = car_rental_service.search_cars(
+            start_location_code=start_code,
+            end_location_code=end_code,
+            transfer_type="HOURLY",
+            start_date_time="2025-10-10T10:00:00",
+            duration="PT9H30M",
+            passengers=1,
         )
-        if has_location_context:
-            context_info = []
-            if query.startLocationCode:
-                context_info.append(f"Starting from airport: {query.startLocationCode}")
-            if query.endLocationCode:
-                context_info.append(f"Destination airport: {query.endLocationCode}")
-            if query.startCity:
-                context_info.append(f"Starting city: {query.startCity}")
-            if query.endCity:
-                context_info.append(f"Destination city: {query.endCity}")
-
-            context_str = ", ".join(context_info)
-            enhanced_query = (
-                f"{user_query}\n\n"
-                f"Budget Preference: I prefer {budget_display} travel options.\n\n"
-                f"Additional Context: {context_str}\n\n"
-                "Please include distance information from airports to attractions "
-                "in your response and tailor all recommendations to my budget preference."
-            )
+        # Handle response according to response.json format
+        if isinstance(car_rentals, dict) and "data" in car_rentals:
+            for offer in car_rentals["data"]:
+                vehicle = offer.get("vehicle", {})
+                provider = offer.get("serviceProvider", {})
+                partner = offer.get("partnerInfo", {}).get("serviceProvider", {})
+                quotation = offer.get("quotation", {})
+                cancellation_rules = offer.get("cancellationRules", [{}])
+                cancellation = cancellation_rules[0].get("ruleDescription", "N/A")
+                desc = vehicle.get("description", "N/A")
+                seats = vehicle.get("seats", [{}])[0].get("count", "N/A")
+                baggages = vehicle.get("baggages", [{}])[0].get("count", "N/A")
+                provider_name = provider.get("name", partner.get("name", "N/A"))
+                price = quotation.get("monetaryAmount", "N/A")
+                currency = quotation.get("currencyCode", "N/A")
+                car_rental_section += (
+                    f"- Vehicle: {desc} | Seats: {seats} | "
+                    f"Baggage: {baggages} | Provider: {provider_name} | "
+                    f"Price: {price} {currency}\n"
+                    f"  Cancellation: {cancellation}\n"
+                )
         else:
-            enhanced_query = (
-                f"{user_query}\n\n"
-                f"Budget Preference: I prefer {budget_display} travel options.\n\n"
-                "Please include distance information from airports to attractions "
-                "in your response and tailor all recommendations to my budget preference."
+            car_rental_section += str(car_rentals) + "\n"
+    except (KeyError, ValueError, TypeError, ConnectionError) as e:
+        car_rental_section += f"Car rental info unavailable: {e}\n"
+    return car_rental_section
+
+
+def _build_distance_section(query: QueryRequest) -> str:
+    """Calculate airport-to-attraction distances and format them as a report section."""
+    distance_section = "\n\n"
+    try:
+        distance_calculator = AirportDistanceCalculator(
+            api_key=os.getenv("OPENROUTE_API_KEY")
+        )
+        mode = get_config_value("road_estimator", "itinerary_mode", default="exact")
+
+        # If airport codes are provided, calculate distances
+        if query.startLocationCode or query.endLocationCode:
+            airport_code = query.startLocationCode or query.endLocationCode
+            destination_city = query.endCity or query.startCity or "the destination"
+
+            distance_section += "### Airport Distance Information\n\n"
+
+            # Find major attractions in the destination city and calculate distances
+            major_attractions = [
+                f"{destination_city} city center",
+                f"downtown {destination_city}",
+                f"main tourist area {destination_city}",
+            ]
+
+            # All attractions are routed from the airport in one matrix request
+            # (or estimated offline when precision isn't needed)
+            distances = distance_calculator.get_airport_to_attraction_distances(
+                airport_code, major_attractions, mode=mode
             )
+            for distance_info in distances:
+                formatted_info = distance_calculator.format_distance_info(distance_info)
+                distance_section += formatted_info + "\n\n"
+
+            # Find nearest airports to destination
+            if query.endCity:
+                nearest_airports = distance_calculator.find_nearest_airports_to_city(
+                    query.endCity, mode=mode
+                )
+                if nearest_airports:
+                    distance_section += f"### Nearest Airports to {query.endCity}\n\n"
+                    for airport in nearest_airports[:3]:
+                        distance = f"{airport['distance_km']} km away"
+                        if airport.get("estimated"):
+                            distance = f"≈ {distance} (estimated)"
+                        airport_info = (
+                            f"Airport: {airport['name']} ({airport['code']}) - "
+                            f"{distance}\n"
+                        )
+                        distance_section += airport_info
+                    distance_section += "\n"
+
+    except (KeyError, ValueError, TypeError, ConnectionError) as e:
+        distance_section += f"Distance information unavailable: {e}\n"
+    return distance_section
 
+
+def _start_enrichment_tasks(
+    query: QueryRequest, timer: StageTimer
+) -> Tuple["asyncio.Task[str]", "asyncio.Task[str]"]:
+    """
+    Schedule the distance and car rental sections as background tasks.
+
+    Both only depend on request fields, so they run while the agent works.
+    Within a batch, requests with the same locations share one computation.
+    """
+    locations = {
+        "startLocationCode": query.startLocationCode,
+        "endLocationCode": query.endLocationCode,
+        "startCity": query.startCity,
+        "endCity": query.endCity,
+    }
+    distance_task = asyncio.create_task(
+        timer.atime(
+            "distance",
+            memoized_call(
+                "distance_section",
+                locations,
+                lambda: run_blocking(_build_distance_section, query),
+            ),
+        )
+    )
+    car_rental_task = asyncio.create_task(
+        timer.atime(
+            "car_rental",
+            memoized_call(
+                "car_rental_section",
+                locations,
+                lambda: run_blocking(_build_car_rental_section, query),
+            ),
+        )
+    )
+    return distance_task, car_rental_task
+
+
+async def _run_travel_plan(query: QueryRequest, timer: StageTimer) -> str:
+    """Run the agent and the enrichments for one request and return the report."""
+    enrichment_tasks = _start_enrichment_tasks(query, timer)
+    try:
+        # Get budget preference from request (normalized by QueryRequest)
+        budget_preference = query.budget_preference
+        print(f"Budget preference: {budget_preference}")
+
+        # Reuse the compiled graph for this budget preference (built off-loop if missing)
+        react_app = await timer.atime(
+            "graph", run_blocking(graph_registry.get, budget_preference)
+        )
+
+        enhanced_query = _build_enhanced_query(query, budget_preference)
         messages = {"messages": [enhanced_query]}
 
-        output = react_app.invoke(messages)
+        output = await timer.atime("agent", react_app.ainvoke(messages))
 
         # If result is dict with messages:
         if isinstance(output, dict) and "messages" in output:
@@ -142,125 +317,411 @@ async def query_travel_agent(query: QueryRequest):
         else:
             final_output = str(output)
 
-        # --- Car Rental Integration ---
-        car_rental_section = "\n\n## Car Rental Options\n"
-        try:
-            car_rental_service = CarRentalService()
-            airports = load("IATA")
-
-            def city_to_iata(city_name):
-                city_name = city_name.lower().strip()
-                for code, data in airports.items():
-                    if data.get("city", "").lower() == city_name:
-                        return code
-                return None
-
-            # Use codes from request, or try to convert city names, fallback to CCU
-            start_code = (
-                query.startLocationCode
-                or (city_to_iata(query.startCity) if query.startCity else None)
-                or "CCU"
-            )
-            end_code = (
-                query.endLocationCode
-                or (city_to_iata(query.endCity) if query.endCity else None)
-                or "CCU"
-            )
-            car_rentals = car_rental_service.search_cars(
-                start_location_code=start_code,
-                end_location_code=end_code,
-                transfer_type="HOURLY",
-                start_date_time="2025-10-10T10:00:00",
-                duration="PT9H30M",
-                passengers=1,
-            )
-            # Handle response according to response.json format
-            if isinstance(car_rentals, dict) and "data" in car_rentals:
-                for offer in car_rentals["data"]:
-                    vehicle = offer.get("vehicle", {})
-                    provider = offer.get("serviceProvider", {})
-                    partner = offer.get("partnerInfo", {}).get("serviceProvider", {})
-                    quotation = offer.get("quotation", {})
-                    cancellation_rules = offer.get("cancellationRules", [{}])
-                    cancellation = cancellation_rules[0].get("ruleDescription", "N/A")
-                    desc = vehicle.get("description", "N/A")
-                    seats = vehicle.get("seats", [{}])[0].get("count", "N/A")
-                    baggages = vehicle.get("baggages", [{}])[0].get("count", "N/A")
-                    provider_name = provider.get("name", partner.get("name", "N/A"))
-                    price = quotation.get("monetaryAmount", "N/A")
-                    currency = quotation.get("currencyCode", "N/A")
-                    car_rental_section += (
-                        f"- Vehicle: {desc} | Seats: {seats} | "
-                        f"Baggage: {baggages} | Provider: {provider_name} | "
-                        f"Price: {price} {currency}\n"
-                        f"  Cancellation: {cancellation}\n"
-                    )
-            else:
-                car_rental_section += str(car_rentals) + "\n"
-        except (KeyError, ValueError, TypeError, ConnectionError) as e:
-            car_rental_section += f"Car rental info unavailable: {e}\n"
-
-        # --- Distance Information Integration ---
-        distance_section = "\n\n"
-        try:
-            distance_calculator = AirportDistanceCalculator(
-                api_key=openroute_api_key
-            )
+        # Join the enrichments that ran alongside the agent
+        distance_section, car_rental_section = await asyncio.gather(*enrichment_tasks)
+
+        # Append distance info to the report
+        final_output += distance_section
 
-            # If airport codes are provided, calculate distances
-            if query.startLocationCode or query.endLocationCode:
-                airport_code = query.startLocationCode or query.endLocationCode
-                destination_city = query.endCity or query.startCity or "the destination"
+        # Append car rental info to the report
+        final_output += car_rental_section
 
-                distance_section += "### Airport Distance Information\n\n"
+        return final_output
+    finally:
+        for task in enrichment_tasks:
+            task.cancel()
 
-                # Find major attractions in the destination city and calculate distances
-                major_attractions = [
-                    f"{destination_city} city center",
-                    f"downtown {destination_city}",
-                    f"main tourist area {destination_city}",
-                ]
 
-                for attraction in major_attractions:
-                    distance_info = (
-                        distance_calculator.get_airport_to_attraction_distance(
-                            airport_code, attraction
-                        )
-                    )
-                    formatted_info = distance_calculator.format_distance_info(
-                        distance_info
-                    )
-                    distance_section += formatted_info + "\n\n"
-
-                # Find nearest airports to destination
-                if query.endCity:
-                    nearest_airports = (
-                        distance_calculator.find_nearest_airports_to_city(query.endCity)
-                    )
-                    if nearest_airports:
-                        distance_section += (
-                            f"### Nearest Airports to {query.endCity}\n\n"
-                        )
-                        for airport in nearest_airports[:3]:
-                            airport_info = (
-                                f"Airport: {airport['name']} ({airport['code']}) - "
-                                f"{airport['distance_km']} km away\n"
-                            )
-                            distance_section += airport_info
-                        distance_section += "\n"
+def _cache_key(query: QueryRequest) -> str:
+    return build_cache_key(
+        query.query if query.query is not None else query.question,
+        query.budget_preference,
+        query.startLocationCode,
+        query.endLocationCode,
+        query.startCity,
+        query.endCity,
+    )
 
-        except (KeyError, ValueError, TypeError, ConnectionError) as e:
-            distance_section += f"Distance information unavailable: {e}\n"
 
-        # Append distance info to the report
-        final_output += distance_section
+async def _answer_query(query: QueryRequest, timer: StageTimer) -> Tuple[str, str]:
+    """
+    Answer a query from the response cache or by running the travel plan.
 
-        # Append car rental info to the report
-        final_output += car_rental_section
+    Returns:
+        tuple: The answer and the cache outcome ("HIT", "MISS", "BYPASS", "REFRESH")
+    """
+    cache_key = _cache_key(query)
+    cached_answer = response_cache.lookup(
+        cache_key, bypass=query.cache_bypass, refresh=query.cache_refresh
+    )
+    if cached_answer is not None:
+        return cached_answer, "HIT"
+
+    # Identical requests already in flight share a single agent run. Binding
+    # the timer lets LLM, tool and external API calls report into it.
+    with timer.stage("plan"), timer.bind():
+        final_output, shared = await single_flight.do(
+            cache_key, lambda: _run_travel_plan(query, timer)
+        )
+    if not shared:
+        response_cache.store(cache_key, final_output, bypass=query.cache_bypass)
+
+    if query.cache_bypass:
+        return final_output, "BYPASS"
+    if query.cache_refresh:
+        return final_output, "REFRESH"
+    return final_output, "MISS"
+
+
+@app.post("/query")
+async def query_travel_agent(query: QueryRequest, response: Response):
+    """
+    Example request body:
+        {
+            "query": "Plan a trip from New York to London",
+            "startLocationCode": "JFK",
+            "endLocationCode": "LHR"
+        }
 
-        return {"answer": final_output}
+    Set "cache_bypass" to skip the response cache, or "cache_refresh" to
+    recompute the plan and replace the cached copy.
+
+    Stage timings are returned in the body and in the Server-Timing header.
+    """
+    timer = StageTimer()
+    try:
+        final_output, cache_status = await _answer_query(query, timer)
+        response.headers["X-Cache"] = cache_status
+        response.headers["Server-Timing"] = timer.server_timing()
+
+        timings = timer.summary()
+        observe_request("query", cache_status.lower(), timings)
+        print(f"Stage timings (ms): {timings}")
+        return {"answer": final_output, "timings": timings}
     except (ValueError, TypeError, ConnectionError, RuntimeError) as e:
-        return JSONResponse(status_code=500, content={"error": str(e)})
+        observe_request("query", "error", timer.summary())
+        return JSONResponse(
+            status_code=500,
+            content={"error": str(e)},
+            headers={"Server-Timing": timer.server_timing()},
+        )
+
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Return hit/miss counters and occupancy of the /query response cache."""
+    return response_cache.stats()
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Return request, LLM, tool and external API latencies for Prometheus."""
+    return Response(content=REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/geocode/stats")
+async def get_geocode_stats():
+    """Return hit/fetch counters and size of the persistent geocode cache."""
+    return get_geocode_cache().stats()
+
+
+@app.get("/weather/stats")
+async def get_weather_stats():
+    """Return fresh/stale/miss counters and size of the shared weather cache."""
+    return await run_blocking(get_weather_cache().stats)
+
+
+@app.get("/routes/stats")
+async def get_route_stats():
+    """Return hit/miss counters of the driving route and fallback estimate caches."""
+    return get_route_cache().stats()
+
+
+@app.get("/routes/snap/stats")
+async def get_snap_stats():
+    """Return hit/miss counters and size of the routable point cache."""
+    return await run_blocking(get_snap_cache().stats)
+
+
+@app.get("/routes/accuracy")
+async def get_route_accuracy():
+    """Compare offline road estimates with the real routes in the route cache."""
+    return await run_blocking(get_road_estimator().accuracy_report, get_route_cache())
+
+
+@app.get("/coalescing/stats")
+async def get_coalescing_stats():
+    """Return how many /query executions ran and how many requests joined them."""
+    return single_flight.stats()
+
+
+async def _stream_batch(
+    queries: List[QueryRequest], max_concurrency: int
+) -> AsyncIterator[str]:
+    """
+    Answer a batch of queries with bounded parallelism and yield NDJSON lines.
+
+    Each result line carries the query's index in the batch and is emitted as
+    soon as that query finishes. A final line reports the batch totals.
+    """
+    memo = CallMemo()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def answer(index: int, query: QueryRequest) -> Dict[str, Any]:
+        async with semaphore:
+            timer = StageTimer()
+            try:
+                with memo.bind():
+                    final_output, cache_status = await _answer_query(query, timer)
+            except (ValueError, TypeError, ConnectionError, RuntimeError) as e:
+                observe_request("batch", "error", timer.summary())
+                return {"index": index, "status": "error", "error": str(e)}
+            observe_request("batch", cache_status.lower(), timer.summary())
+            return {
+                "index": index,
+                "status": "ok",
+                "answer": final_output,
+                "cache": cache_status,
+                "timings": timer.summary(),
+            }
+
+    tasks = [
+        asyncio.create_task(answer(index, query)) for index, query in enumerate(queries)
+    ]
+    try:
+        failed = 0
+        for next_result in asyncio.as_completed(tasks):
+            result = await next_result
+            failed += result["status"] == "error"
+            yield json.dumps(result, default=str) + "\n"
+        yield json.dumps(
+            {
+                "done": True,
+                "completed": len(tasks) - failed,
+                "failed": failed,
+                "tool_calls": memo.stats(),
+            }
+        ) + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@app.post("/query/batch")
+async def batch_travel_agent(batch: BatchQueryRequest):
+    """
+    Plan several trips in one call and stream the results as NDJSON.
+
+    Example request body:
+        {
+            "queries": [
+                {"query": "Plan a trip to Paris", "endCity": "Paris"},
+                {"query": "Plan a trip to Rome", "endCity": "Rome"}
+            ],
+            "max_concurrency": 4
+        }
+
+    Up to max_concurrency queries run at once, and identical tool calls made by
+    different queries in the batch (same city weather, same airport distance)
+    are executed once. Result lines arrive in completion order.
+    """
+    max_queries = int(get_config_value("batch", "max_queries", default=100))
+    if len(batch.queries) > max_queries:
+        return JSONResponse(
+            status_code=400,
+            content={"error": f"A batch may contain at most {max_queries} queries."},
+        )
+
+    max_concurrency = int(get_config_value("batch", "max_concurrency", default=8))
+    if batch.max_concurrency is not None:
+        max_concurrency = min(max_concurrency, batch.max_concurrency)
+    return StreamingResponse(
+        _stream_batch(batch.queries, max(1, max_concurrency)),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _run_job(query: QueryRequest) -> Dict[str, Any]:
+    """Job runner used by the /jobs worker pool."""
+    timer = StageTimer()
+    try:
+        final_output, cache_status = await _answer_query(query, timer)
+    except Exception:
+        observe_request("jobs", "error", timer.summary())
+        raise
+    timings = timer.summary()
+    observe_request("jobs", cache_status.lower(), timings)
+    return {"answer": final_output, "timings": timings}
+
+
+job_manager = JobManager.from_config(_run_job)
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(query: QueryRequest, request: Request):
+    """
+    Queue a travel plan and return immediately with a job id.
+
+    Accepts the same body as /query. Responds 429 with Retry-After when the
+    queue is full; poll GET /jobs/{job_id} for the result.
+    """
+    try:
+        job = job_manager.submit(query)
+    except QueueFullError as e:
+        return JSONResponse(
+            status_code=429,
+            content={"error": str(e)},
+            headers={"Retry-After": str(e.retry_after_seconds)},
+        )
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "status_url": str(request.url_for("get_job", job_id=job.job_id)),
+    }
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Return the status, and once finished the result, of a queued job."""
+    job = job_manager.get(job_id)
+    if job is None:
+        return JSONResponse(
+            status_code=404, content={"error": f"Unknown or expired job {job_id}"}
+        )
+    return job.to_dict()
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _stream_travel_plan(query: QueryRequest) -> AsyncIterator[str]:
+    """
+    Run the agent with LangGraph streaming and yield SSE messages.
+
+    Events: "token" (LLM output of the agent node), "tool_start" and
+    "tool_end" (tool calls and results), "section" (distance and car rental
+    reports), then "done" with the full answer and stage timings, or "error".
+    """
+    timer = StageTimer()
+    with timer.bind():
+        enrichment_tasks = _start_enrichment_tasks(query, timer)
+    try:
+        budget_preference = query.budget_preference
+        react_app = await timer.atime(
+            "graph", run_blocking(graph_registry.get, budget_preference)
+        )
+        messages = {"messages": [_build_enhanced_query(query, budget_preference)]}
+
+        final_output = ""
+        with timer.stage("agent"):
+            async for mode, chunk in react_app.astream(
+                messages, stream_mode=["messages", "updates"]
+            ):
+                if mode == "messages":
+                    message_chunk, metadata = chunk
+                    content = message_chunk.content
+                    if metadata.get("langgraph_node") == "agent" and content:
+                        if isinstance(content, str):
+                            yield _sse_event("token", {"content": content})
+                    continue
+
+                for node, update in chunk.items():
+                    for message in (update or {}).get("messages", []):
+                        if node == "agent":
+                            final_output = message.content
+                            for tool_call in getattr(message, "tool_calls", []):
+                                yield _sse_event(
+                                    "tool_start",
+                                    {
+                                        "id": tool_call.get("id"),
+                                        "name": tool_call.get("name"),
+                                        "args": tool_call.get("args"),
+                                    },
+                                )
+                        elif node == "tools":
+                            yield _sse_event(
+                                "tool_end",
+                                {
+                                    "id": getattr(message, "tool_call_id", None),
+                                    "name": getattr(message, "name", None),
+                                    "content": message.content,
+                                },
+                            )
+
+        distance_section, car_rental_section = await asyncio.gather(*enrichment_tasks)
+        yield _sse_event("section", {"name": "distance", "content": distance_section})
+        yield _sse_event(
+            "section", {"name": "car_rental", "content": car_rental_section}
+        )
+
+        final_output += distance_section + car_rental_section
+        timings = timer.summary()
+        observe_request("query_stream", "ok", timings)
+        yield _sse_event("done", {"answer": final_output, "timings": timings})
+    except (ValueError, TypeError, ConnectionError, RuntimeError) as e:
+        observe_request("query_stream", "error", timer.summary())
+        yield _sse_event("error", {"error": str(e)})
+    finally:
+        for task in enrichment_tasks:
+            task.cancel()
+
+
+@app.post("/query/stream")
+async def stream_travel_agent(query: QueryRequest):
+    """
+    Stream a travel plan as Server-Sent Events.
+
+    Accepts the same body as /query. The first bytes arrive with the first LLM
+    token instead of after the whole agent run.
+    """
+    return StreamingResponse(
+        _stream_travel_plan(query),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in [tag.removeprefix("W/") for tag in candidates]
+
+
+@app.get("/graph.png")
+async def get_graph_png(request: Request, budget_preference: str = "budget_friendly"):
+    """
+    Return the agent graph topology rendered as a Mermaid PNG.
+
+    The image is rendered once per compiled graph and served from memory with
+    an ETag, so clients can revalidate with If-None-Match and receive a 304.
+    """
+    if not get_config_value("graph", "render_png", default=True):
+        return JSONResponse(
+            status_code=404, content={"error": "Graph rendering is disabled."}
+        )
+
+    try:
+        budget_preference = normalize_budget_preference(budget_preference)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+
+    try:
+        png_graph, etag = await run_blocking(
+            graph_registry.get_graph_png, budget_preference
+        )
+    except (ValueError, TypeError, ConnectionError, RuntimeError, OSError) as e:
+        return JSONResponse(
+            status_code=500, content={"error": f"Failed to render graph: {e}"}
+        )
+
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=png_graph, media_type="image/png", headers=headers)
 
 
 @app.post("/export-word")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenRouteService API used by the routing tests.
+
+It serves the geocode, directions, matrix and snap endpoints over real HTTP, so
+both the requests and httpx code paths can be exercised. Road distances are the
+great-circle distance times ROAD_FACTOR, and durations assume 50 km/h.
+
+Usage:
+    with OrsStubServer(places={"Paris": (48.8566, 2.3522)}) as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+"""
+
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from utils.geodesic import distance_km
+
+ROAD_FACTOR = 1.3
+SPEED_KMH = 50
+# Off-road points are this far from their nearest road
+OFFROAD_M = 2000
+
+
+class OrsStubServer:
+    """Threaded HTTP server imitating the OpenRouteService endpoints.
+
+    Attributes:
+        url (str): Base URL to use as OPENROUTE_BASE_URL
+        calls (list): (method, path) of every request received
+        places (dict): Geocoding answers by exact query text
+        unroutable (set): (lat, lon) points the matrix cannot route to
+        offroad (dict): (lat, lon) points OFFROAD_M away from their snapped
+            road point, or with no road at all when mapped to None
+    """
+
+    def __init__(self, places=None, unroutable=None, offroad=None):
+        self.places = dict(places or {})
+        self.unroutable = set(unroutable or ())
+        self.offroad = dict(offroad or {})
+        self.calls = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def paths(self, prefix):
+        """Return the recorded request paths that start with prefix."""
+        return [path for _, path in self.calls if path.startswith(prefix)]
+
+    def _route_km(self, start, end):
+        if tuple(end) in self.unroutable:
+            return None
+        return round(distance_km(start, end) * ROAD_FACTOR, 3)
+
+    def _geocode(self, query):
+        text = parse_qs(query).get("text", [""])[0]
+        coords = self.places.get(text)
+        if coords is None:
+            return {"features": []}
+        return {"features": [{"geometry": {"coordinates": [coords[1], coords[0]]}}]}
+
+    def _matrix(self, body):
+        points = [(lat, lon) for lon, lat in body["locations"]]
+        distances = [
+            [self._route_km(points[s], points[d]) for d in body["destinations"]]
+            for s in body["sources"]
+        ]
+        durations = [
+            [None if km is None else km / SPEED_KMH * 3600 for km in row]
+            for row in distances
+        ]
+        return {"distances": distances, "durations": durations}
+
+    def _snap(self, point, radius_m):
+        """Road point within radius_m of a (lat, lon) point, or None."""
+        if point not in self.offroad:
+            return point
+        snapped = self.offroad[point]
+        return snapped if snapped is not None and radius_m >= OFFROAD_M else None
+
+    def _snap_locations(self, body):
+        snapped = [
+            self._snap((lat, lon), body["radius"]) for lon, lat in body["locations"]
+        ]
+        return {
+            "locations": [
+                None if point is None else {"location": [point[1], point[0]]}
+                for point in snapped
+            ]
+        }
+
+    def _directions(self, body):
+        """GeoJSON route, or an OpenRouteService style error for a 404."""
+        radiuses = body.get("radiuses", [350, 350])
+        start, end = (
+            self._snap((lat, lon), radius)
+            for (lon, lat), radius in zip(body["coordinates"], radiuses)
+        )
+        for i, point in enumerate((start, end)):
+            if point is None:
+                message = (
+                    "Could not find routable point within a radius of "
+                    f"{radiuses[i]:.1f} meters of specified coordinate {i}"
+                )
+                return {"error": {"code": 2010, "message": message}}
+        km = self._route_km(start, end)
+        if km is None:
+            return {"error": {"code": 2009, "message": "Route could not be found"}}
+        segment = {"distance": km * 1000, "duration": km / SPEED_KMH * 3600}
+        geometry = {"coordinates": [[start[1], start[0]], [end[1], end[0]]]}
+        return {
+            "features": [{"geometry": geometry, "properties": {"segments": [segment]}}]
+        }
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Dispatches requests to the stub's endpoint implementations."""
+
+            def _reply(self, payload, status=200):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Serve /geocode/search."""
+                url = urlparse(self.path)
+                stub.calls.append(("GET", url.path))
+                if url.path == "/geocode/search":
+                    self._reply(stub._geocode(url.query))
+                else:
+                    self._reply({"error": "not found"}, 404)
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                """Serve /v2/matrix/*, /v2/directions/* and /v2/snap/*."""
+                path = urlparse(self.path).path
+                stub.calls.append(("POST", path))
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if path.startswith("/v2/matrix/"):
+                    self._reply(stub._matrix(body))
+                elif path.startswith("/v2/snap/"):
+                    self._reply(stub._snap_locations(body))
+                elif path.startswith("/v2/directions/"):
+                    route = stub._directions(body)
+                    self._reply(route, 404 if "error" in route else 200)
+                else:
+                    self._reply({"error": "not found"}, 404)
+
+            def log_message(self, *args):  # keep test output quiet
+                pass
+
+        return Handler
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the city to IATA airport index.
+"""
+
+import os
+import sys
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from utils.airport_index import AirportIndex, fold, get_airport_index
+
+AIRPORTS = {
+    "LHR": {"name": "London Heathrow Airport", "city": "London", "country": "GB"},
+    "LGW": {"name": "London Gatwick Airport", "city": "London", "country": "GB"},
+    "YXU": {"name": "London Airport", "city": "London", "country": "CA"},
+    "PDX": {
+        "name": "Portland International Airport",
+        "city": "Portland",
+        "subd": "Oregon",
+        "country": "US",
+    },
+    "PWM": {
+        "name": "Portland International Jetport Airport",
+        "city": "Portland",
+        "subd": "Maine",
+        "country": "US",
+    },
+    "EGS": {"name": "Egilsstaðir Airport", "city": "Egilsstaðir", "country": "IS"},
+    "GRU": {"name": "Guarulhos International", "city": "Sao Paulo", "country": "BR"},
+    "GOA": {"name": "Genoa Cristoforo Colombo", "city": "Genova", "country": "IT"},
+}
+
+
+def test_fold_removes_case_accents_and_punctuation():
+    """Folding makes spelling variants of a city name identical."""
+    assert fold("São  Paulo") == "sao paulo"
+    assert fold("EGILSSTAÐIR") == fold("Egilsstadir") == "egilsstadir"
+    assert fold("St. John's") == "st john s"
+
+
+def test_lookup_ranks_and_disambiguates():
+    """Primary airports rank first; a country or region narrows the result."""
+    index = AirportIndex(AIRPORTS)
+    assert index.lookup("london") == ["LHR", "LGW", "YXU"]
+    assert index.lookup("London", country="CA") == ["YXU"]
+    assert index.lookup("Portland, Maine") == ["PWM"]
+    assert index.lookup("Portland, ME") == ["PWM"]
+    assert index.lookup("Portland, or") == ["PDX"]
+    assert index.best("sao paulo") == "GRU"
+    assert index.best("Egilsstadir") == "EGS"
+    assert index.best("Atlantis") is None
+
+
+def test_fuzzy_matching_and_code_resolution():
+    """Misspellings of longer names are corrected; exact codes resolve directly."""
+    index = AirportIndex(AIRPORTS)
+    assert index.best("Londn") == "LHR"
+    assert index.lookup("Londn", fuzzy=False) == []
+    assert index.resolve("GOA") == "GOA"
+    assert index.resolve("Goa") is None
+    assert index.resolve("Portlnd") == "PDX"
+    assert index.resolve("PWM") == "PWM"
+    assert index.resolve("pwm") == index.resolve(" pwm ") == "PWM"
+
+
+def test_shared_index_covers_real_airport_data():
+    """The process-wide index resolves cities from the full IATA table."""
+    index = get_airport_index()
+    assert index is get_airport_index()
+    assert index.best("Kolkata") == "CCU"
+    assert index.best("Paris") == "CDG"
+    assert index.best("São Paulo") == "GRU"
+
+
+def test_city_aliases_pick_the_main_airport():
+    """Cities whose main airport is filed under a suburb resolve to it."""
+    index = get_airport_index()
+    assert index.best("Frankfurt") == "FRA"
+    assert index.best("Toronto") == "YYZ"
+    assert index.best("Istanbul") == "IST"
+    assert index.best("Houston") == "IAH"
+    assert index.lookup("Berlin")[0] == "BER"
+    assert "TXL" not in index.lookup("Berlin")
+    assert "ISL" not in index.lookup("Istanbul")
+    assert index.best("Portland, ME") == "PWM"
+    assert index.best("London, CA") == "YXU"
+    assert index.resolve("Goa") == "GOI"
+    assert index.resolve("GOA") == "GOA"
+    assert index.resolve("jfk") == "JFK" and index.resolve(" lhr ") == "LHR"
+
+
+def test_airport_types_are_inferred_from_names():
+    """Types drive the nearest-airport filter."""
+    index = get_airport_index()
+    assert index.airport_type("CDG") == "international"
+    assert index.airport_type("NHT") == "military"
+    assert index.type_matches("LCY", "commercial")
+    assert not index.type_matches("NHT", "commercial")
+    assert index.type_matches("NHT", "any")
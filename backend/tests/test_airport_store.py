@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared column-oriented airport store.
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from utils.airport_index import get_airport_index
+from utils.airport_store import AirportStore, get_airport_store
+
+AIRPORTS = {
+    "CCU": {
+        "icao": "VECC",
+        "name": "Netaji Subhash Chandra Bose International Airport",
+        "city": "Kolkata",
+        "country": "IN",
+        "elevation": 16.0,
+        "lat": 22.6547,
+        "lon": 88.4467,
+    },
+    "IXA": {"name": "Agartala Airport", "city": "Agartala", "country": "IN"},
+}
+
+
+def test_store_behaves_like_the_airport_mapping():
+    """Records round-trip through the columns; missing numbers become None."""
+    store = AirportStore(AIRPORTS)
+
+    assert len(store) == 2 and "CCU" in store and "XXX" not in store
+    assert list(store) == ["CCU", "IXA"]
+    assert store["CCU"]["city"] == "Kolkata"
+    assert store["CCU"]["lat"] == pytest.approx(22.6547)
+    assert store["IXA"]["lat"] is None
+    assert store.get("XXX", {}) == {}
+    assert store.value("CCU", "country") == "IN"
+    assert math.isnan(store.lat[store.row("IXA")])
+    assert store.string_column("country") == ["IN", "IN"]
+
+
+def test_store_is_read_only_and_shared():
+    """Columns cannot be modified and every consumer sees the same instance."""
+    store = get_airport_store()
+    with pytest.raises(ValueError):
+        store.lat[0] = 0.0
+    record = store["JFK"]
+    record["city"] = "Changed"
+    assert store["JFK"]["city"] == "New York"
+    assert get_airport_index().airports is store
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Load test for the async /query pipeline.
+
+The agent graph is replaced by a stub whose ainvoke sleeps to simulate LLM and
+tool latency, so the test measures how many plans a single worker can keep in
+flight. Run this file directly to print a throughput table for larger
+concurrency levels.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+from langchain_core.messages import AIMessage
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+
+AGENT_LATENCY_SECONDS = 0.2
+
+
+class SlowGraph:  # pylint: disable=too-few-public-methods
+    """Compiled-graph stand-in with a fixed async latency."""
+
+    async def ainvoke(self, messages):
+        """Simulate an agent run without blocking the event loop."""
+        await asyncio.sleep(AGENT_LATENCY_SECONDS)
+        return {"messages": messages["messages"] + [AIMessage(content="Plan")]}
+
+
+class StubRegistry:  # pylint: disable=too-few-public-methods
+    """Registry stand-in returning the slow graph."""
+
+    def get(self, _budget_preference):
+        """Return the stub graph."""
+        return SlowGraph()
+
+
+async def _run_load(total_requests: int, concurrency: int) -> float:
+    """Send total_requests plans with at most `concurrency` in flight; return req/s."""
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=main.app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def one_request(i: int) -> None:
+            async with semaphore:
+                response = await client.post(
+                    "/query",
+                    json={"query": f"Plan trip {i}", "cache_bypass": True},
+                    timeout=30,
+                )
+                assert response.status_code == 200
+                assert response.json()["answer"].startswith("Plan")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_request(i) for i in range(total_requests)))
+        elapsed = time.perf_counter() - started
+    return total_requests / elapsed
+
+
+def _patch_main(monkeypatch) -> None:
+    monkeypatch.setattr(main, "graph_registry", StubRegistry())
+    monkeypatch.setattr(main, "_build_car_rental_section", lambda query: "")
+    monkeypatch.setattr(main, "_build_distance_section", lambda query: "")
+
+
+def test_throughput_scales_with_concurrency(monkeypatch):
+    """Eight concurrent plans finish much faster than eight sequential ones."""
+    _patch_main(monkeypatch)
+
+    sequential = asyncio.run(_run_load(total_requests=8, concurrency=1))
+    concurrent = asyncio.run(_run_load(total_requests=8, concurrency=8))
+
+    print(f"sequential: {sequential:.1f} req/s, concurrent: {concurrent:.1f} req/s")
+    assert concurrent > sequential * 4
+
+
+if __name__ == "__main__":
+    main.graph_registry = StubRegistry()
+    setattr(main, "_build_car_rental_section", lambda query: "")
+    setattr(main, "_build_distance_section", lambda query: "")
+
+    print("⚡ Async /query load test")
+    print("=" * 50)
+    for level in (1, 2, 4, 8, 16, 32, 64):
+        throughput = asyncio.run(_run_load(total_requests=level * 4, concurrency=level))
+        print(f"concurrency={level:>3}: {throughput:7.1f} req/s")
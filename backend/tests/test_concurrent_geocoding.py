@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests that the distance tools geocode independent addresses concurrently.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tests.ors_stub import OrsStubServer
+from tools.distance_calculator_tool import DistanceCalculatorTool
+from utils.airport_distance_calculator import AirportDistanceCalculator
+from utils.executor import map_concurrently
+from utils.route_cache import RouteCache
+from utils.snap_cache import SnapCache
+
+DELAY = 0.2
+PLACES = {
+    "Louvre": (48.8606, 2.3376),
+    "Eiffel Tower": (48.8584, 2.2945),
+    "Notre-Dame": (48.8530, 2.3499),
+    "Sacre-Coeur": (48.8867, 2.3431),
+}
+
+
+class SlowGeocoder:
+    """Geocoder that takes DELAY seconds and records the peak concurrency."""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, address):
+        with self._lock:
+            self.calls.append(address)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(DELAY)
+        with self._lock:
+            self.active -= 1
+        return PLACES.get(address)
+
+    async def acall(self, address):
+        self.calls.append(address)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(DELAY)
+        self.active -= 1
+        return PLACES.get(address)
+
+
+def _tools(monkeypatch, geocoder):
+    tool_container = DistanceCalculatorTool(openroute_api_key="test-key")
+    tool_container.route_cache = RouteCache()
+    tool_container.snap_cache = SnapCache(":memory:")
+    monkeypatch.setattr(tool_container, "_get_coordinates_from_address", geocoder)
+    monkeypatch.setattr(
+        tool_container, "_aget_coordinates_from_address", geocoder.acall
+    )
+    return {tool.name: tool for tool in tool_container.distance_tool_list}
+
+
+def test_map_concurrently_keeps_order_and_bound():
+    """Results come back in input order with at most max_concurrency in flight."""
+    geocoder = SlowGeocoder()
+    started = time.perf_counter()
+    results = map_concurrently(geocoder, list(PLACES), max_concurrency=2)
+
+    assert results == list(PLACES.values())
+    assert geocoder.peak == 2
+    assert time.perf_counter() - started < 3 * DELAY
+
+
+def test_between_places_geocodes_both_places_at_once(monkeypatch):
+    """Two places cost one geocode round-trip, sync and async."""
+    geocoder = SlowGeocoder()
+    tool = _tools(monkeypatch, geocoder)["calculate_distance_between_places"]
+    args = {"place1": "Louvre", "place2": "Eiffel Tower", "mode": "estimate"}
+
+    started = time.perf_counter()
+    result = tool.invoke(args)
+    assert time.perf_counter() - started < 1.8 * DELAY
+    started = time.perf_counter()
+    async_result = asyncio.run(tool.ainvoke(args))
+    assert time.perf_counter() - started < 1.8 * DELAY
+
+    assert result.startswith("Distance from Louvre to Eiffel Tower:")
+    assert async_result == result
+    assert geocoder.peak == 2
+
+
+def test_itinerary_tool_geocodes_every_place_once(monkeypatch):
+    """N places are geocoded in parallel, duplicates once, and legs are summed."""
+    geocoder = SlowGeocoder()
+    tool = _tools(monkeypatch, geocoder)["calculate_distances_between_places"]
+    places = ["Louvre", "Eiffel Tower", "Notre-Dame", "Sacre-Coeur", "Louvre"]
+
+    started = time.perf_counter()
+    result = tool.invoke({"places": places, "mode": "estimate"})
+    assert time.perf_counter() - started < 1.8 * DELAY
+    async_result = asyncio.run(tool.ainvoke({"places": places, "mode": "estimate"}))
+
+    assert async_result == result
+    assert sorted(geocoder.calls) == sorted(2 * list(PLACES))
+    lines = result.splitlines()
+    assert lines[0] == "Driving distances through 5 places:"
+    assert lines[1].startswith("1. Louvre to Eiffel Tower: ")
+    assert lines[4].startswith("4. Sacre-Coeur to Louvre: ")
+    assert lines[5].startswith("Total: ") and "offline estimate" in lines[5]
+
+
+def test_itinerary_tool_routes_legs_and_reports_failures(monkeypatch):
+    """Exact legs are routed; unknown places and bad input are reported."""
+    geocoder = SlowGeocoder()
+    with OrsStubServer() as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        tool = _tools(monkeypatch, geocoder)["calculate_distances_between_places"]
+        result = tool.invoke({"places": ["Louvre", "Eiffel Tower", "Notre-Dame"]})
+
+    assert len(ors.paths("/v2/directions/")) == 2
+    assert "offline estimate" not in result
+    assert result.splitlines()[-1].startswith("Total: ")
+    assert tool.invoke({"places": ["Louvre", "Atlantis", "Nowhere"]}) == (
+        "Could not find coordinates for Atlantis, Nowhere"
+    )
+    assert tool.invoke({"places": ["Louvre"]}).startswith("places must list")
+
+
+def test_calculator_geocodes_attractions_concurrently(monkeypatch):
+    """Several attractions cost one geocode round-trip in the calculator."""
+    calculator = AirportDistanceCalculator(api_key="test-key")
+    calculator.route_cache = RouteCache()
+    geocoder = SlowGeocoder()
+    monkeypatch.setattr(calculator, "get_coordinates_from_address", geocoder)
+
+    started = time.perf_counter()
+    results = calculator.get_airport_to_attraction_distances(
+        "CDG", [*PLACES, "Atlantis"], mode="estimate"
+    )
+
+    assert time.perf_counter() - started < 1.8 * DELAY
+    assert [r["success"] for r in results] == [True] * len(PLACES) + [False]
+    assert results[-1]["error"] == "Could not find coordinates for Atlantis"
@@ -6,35 +6,19 @@ Fast offline test script for distance calculation functionality
 
 import os
 import sys
-import math
 
 # Add parent directory to path for local imports
 # pylint: disable=wrong-import-position
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-def calculate_haversine_distance(coord1, coord2):
-    """Calculate straight-line distance using Haversine formula"""
-    lat1, lon1 = coord1
-    lat2, lon2 = coord2
-
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.asin(math.sqrt(a))
+# pylint: disable=import-error,wrong-import-position
+from utils.geodesic import distance_km, pairwise_km
 
-    # Earth's radius in kilometers
-    r = 6371
 
-    distance = r * c
-    return round(distance, 2)
+def calculate_haversine_distance(coord1, coord2):
+    """Calculate straight-line distance using Haversine formula"""
+    return round(distance_km(coord1, coord2), 2)
 
 
 # Test data constants
@@ -105,6 +89,18 @@ def _test_distance_accuracy():
     print(f"🔍 Accuracy: {100 - error:.1f}% (error: {error:.1f}%)")
 
 
+def _test_distance_table():
+    """Test the vectorized airport distance table"""
+    print("\n5️⃣ Testing Airport Distance Table:")
+    codes = list(AIRPORTS)
+    table = pairwise_km(list(AIRPORTS.values()))
+    for i, code in enumerate(codes):
+        for j, other in enumerate(codes):
+            expected = calculate_haversine_distance(AIRPORTS[code], AIRPORTS[other])
+            assert abs(table[i, j] - expected) < 0.01
+    print(f"📊 {len(codes)}x{len(codes)} table matches the pairwise distances")
+
+
 def test_offline_distance_calculations():
     """Test distance calculations without any API calls - runs instantly"""
     print("⚡ Fast Offline Distance Calculator Test")
@@ -114,6 +110,7 @@ def test_offline_distance_calculations():
     _test_airport_city_distances()
     _test_long_distances()
     _test_distance_accuracy()
+    _test_distance_table()
 
     print("\n✅ All offline tests completed in milliseconds!")
     print("💡 For real API testing, run the full test suite.")
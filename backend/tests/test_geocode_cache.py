@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent geocode cache and its use by the distance code paths.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+import requests
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tests.ors_stub import OrsStubServer
+from tools.distance_calculator_tool import DistanceCalculatorTool
+from utils.airport_distance_calculator import AirportDistanceCalculator
+from utils.geocode_cache import GeocodeCache, normalize_address
+
+EIFFEL = (48.8584, 2.2945)
+
+
+def test_answers_survive_a_restart_and_keys_are_normalized(tmp_path):
+    """A new instance on the same file (another worker) reuses the answers."""
+    path = tmp_path / "geocode.sqlite3"
+    first = GeocodeCache(path)
+    assert first.get_or_fetch("Eiffel Tower, Paris", lambda: EIFFEL) == EIFFEL
+
+    second = GeocodeCache(path)
+    fetched = []
+    coords = second.get_or_fetch(
+        "  eiffel   TOWER, paris. ", lambda: fetched.append(1) or (0.0, 0.0)
+    )
+    assert coords == EIFFEL and not fetched
+    assert second.stats()["hits"] == 1 and second.stats()["stored"] == 1
+    assert normalize_address("Paris", "us") != normalize_address("Paris")
+
+
+def test_misses_are_cached_briefly_and_errors_not_at_all(tmp_path):
+    """Not-found answers expire after the negative TTL; failures are retried."""
+    now = [1000.0]
+    cache = GeocodeCache(
+        tmp_path / "geocode.sqlite3",
+        ttl_seconds=3600,
+        negative_ttl_seconds=60,
+        clock=lambda: now[0],
+    )
+    calls = []
+
+    def not_found():
+        calls.append(1)
+
+    assert cache.get_or_fetch("Atlantis", not_found) is None
+    assert cache.get_or_fetch("Atlantis", not_found) is None
+    assert len(calls) == 1 and cache.stats()["negative_hits"] == 1
+
+    now[0] += 61
+    cache.get_or_fetch("Atlantis", not_found)
+    assert len(calls) == 2
+
+    def failing():
+        raise requests.ConnectionError("down")
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            cache.get_or_fetch("Louvre", failing)
+    assert cache.get(normalize_address("Louvre")) is None
+
+
+class ThreadRecordingCache(GeocodeCache):
+    """GeocodeCache that records which threads touch SQLite."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.db_threads = []
+
+    def _get_stored(self, key):
+        self.db_threads.append(threading.get_ident())
+        return super()._get_stored(key)
+
+    def set(self, key, coords):
+        self.db_threads.append(threading.get_ident())
+        super().set(key, coords)
+
+
+def test_async_lookups_keep_sqlite_off_the_event_loop(tmp_path):
+    """Only the in-memory LRU is read on the loop; SQLite runs on the executor."""
+    path = tmp_path / "geocode.sqlite3"
+
+    async def lookup(cache):
+        async def fetch():
+            return EIFFEL
+
+        coords = await cache.aget_or_fetch("Eiffel Tower", fetch)
+        return coords, threading.get_ident()
+
+    first = ThreadRecordingCache(path)
+    assert asyncio.run(lookup(first))[0] == EIFFEL
+    second = ThreadRecordingCache(path)  # another worker: LRU empty, row on disk
+    coords, loop_thread = asyncio.run(lookup(second))
+    memory_hit, _ = asyncio.run(lookup(second))
+
+    assert coords == memory_hit == EIFFEL
+    assert len(first.db_threads) == 2 and len(second.db_threads) == 1
+    assert loop_thread not in first.db_threads + second.db_threads
+    assert second.stats()["hits"] == 2 and second.stats()["fetches"] == 0
+
+
+def test_calculator_and_tool_share_one_geocode(monkeypatch):
+    """The same address is geocoded once across sync, async and both classes."""
+    cache = GeocodeCache(":memory:")
+    with OrsStubServer(places={"Eiffel Tower, Paris": EIFFEL}) as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        calculator = AirportDistanceCalculator(api_key="test-key")
+        tool = DistanceCalculatorTool(openroute_api_key="test-key")
+        calculator.geocode_cache = tool.geocode_cache = cache
+
+        assert calculator.get_coordinates_from_address("Eiffel Tower, Paris") == EIFFEL
+        assert tool._get_coordinates_from_address("eiffel tower, paris") == EIFFEL
+        assert (
+            asyncio.run(tool._aget_coordinates_from_address("Eiffel Tower, Paris"))
+            == EIFFEL
+        )
+
+    assert ors.paths("/geocode/") == ["/geocode/search"]
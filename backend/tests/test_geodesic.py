@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized haversine functions.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from utils.geodesic import (
+    DEFAULT_ROAD_FACTOR,
+    _benchmark,
+    distance_km,
+    distances_from,
+    pairwise_km,
+)
+
+JFK = (40.6413, -73.7781)
+LAX = (33.9425, -118.4081)
+LHR = (51.4700, -0.4543)
+
+
+def test_one_to_many_and_matrix_agree_with_single_pairs():
+    """All call shapes give the same distances, scaled by the road factor."""
+    assert distance_km(JFK, LAX) == pytest.approx(3974, abs=5)
+    assert distance_km(JFK, JFK) == 0.0
+
+    row = distances_from(JFK, [LAX, LHR], road_factor=DEFAULT_ROAD_FACTOR)
+    assert row == pytest.approx(
+        [distance_km(JFK, p) * DEFAULT_ROAD_FACTOR for p in (LAX, LHR)]
+    )
+
+    matrix = pairwise_km([JFK, LAX, LHR])
+    assert matrix.shape == (3, 3)
+    assert np.allclose(matrix, matrix.T)
+    assert matrix[0, 2] == pytest.approx(distance_km(JFK, LHR))
+    assert pairwise_km([JFK], [LAX, LHR]).shape == (1, 2)
+
+
+def test_vectorized_matches_scalar_loop():
+    """The benchmark's scalar and NumPy results agree to well under a metre."""
+    _, _, max_error = _benchmark(1_000)
+    assert max_error < 1e-6
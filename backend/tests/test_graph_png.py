@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached GET /graph.png endpoint.
+"""
+
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+
+
+class FakeRegistry:  # pylint: disable=too-few-public-methods
+    """Registry stand-in that counts renders instead of calling Mermaid."""
+
+    def __init__(self):
+        self.renders = 0
+
+    def get_graph_png(self, budget_preference):
+        """Return a fixed PNG payload and ETag."""
+        self.renders += 1
+        return b"\x89PNG" + budget_preference.encode(), '"abc123"'
+
+
+def test_graph_png_supports_conditional_get(monkeypatch):
+    """The endpoint returns an ETag and answers If-None-Match with 304."""
+    monkeypatch.setattr(main, "graph_registry", FakeRegistry())
+    client = TestClient(main.app)
+
+    response = client.get("/graph.png")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["etag"] == '"abc123"'
+
+    cached = client.get("/graph.png", headers={"If-None-Match": 'W/"abc123"'})
+    assert cached.status_code == 304
+    assert not cached.content
+
+
+def test_graph_png_can_be_disabled(monkeypatch):
+    """Rendering is skipped entirely when graph.render_png is false."""
+    registry = FakeRegistry()
+    monkeypatch.setattr(main, "graph_registry", registry)
+    monkeypatch.setattr(main, "get_config_value", lambda *keys, default=None: False)
+    client = TestClient(main.app)
+
+    response = client.get("/graph.png")
+    assert response.status_code == 404
+    assert registry.renders == 0
+
+
+def test_graph_png_rejects_unknown_budget_preference(monkeypatch):
+    """Arbitrary query values get a 400 instead of building and rendering a graph."""
+    registry = FakeRegistry()
+    monkeypatch.setattr(main, "graph_registry", registry)
+    client = TestClient(main.app)
+
+    response = client.get("/graph.png", params={"budget_preference": "x" * 50})
+    assert response.status_code == 400
+    assert registry.renders == 0
+    assert client.get("/graph.png?budget_preference=Luxurious").status_code == 200
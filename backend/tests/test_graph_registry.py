@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide compiled graph registry.
+"""
+
+import gc
+import os
+import sys
+import threading
+import time
+import weakref
+
+import pytest
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from agent.graph_registry import GraphKey, GraphRegistry
+from utils.config_loaders import reload_config
+
+
+class FakeBuilder:  # pylint: disable=too-few-public-methods
+    """Stand-in for GraphBuilder that records how often it was built."""
+
+    def __init__(self, key: GraphKey):
+        self.key = key
+        self.llm_with_tools = object()
+        self.graph = object()
+
+    def __call__(self):
+        return self.graph
+
+
+def _counting_factory(builds):
+    def factory(key):
+        time.sleep(0.01)  # widen the race window for concurrent callers
+        builds.append(key)
+        return FakeBuilder(key)
+
+    return factory
+
+
+def test_graph_is_built_once_per_budget_preference():
+    """Repeated lookups reuse the same compiled graph."""
+    builds = []
+    registry = GraphRegistry(factory=_counting_factory(builds))
+
+    first = registry.get("cheapest")
+    second = registry.get("cheapest")
+    luxurious = registry.get("luxurious")
+
+    assert first is second
+    assert luxurious is not first
+    assert [key.budget_preference for key in builds] == ["cheapest", "luxurious"]
+
+
+def test_concurrent_first_requests_share_one_build():
+    """Concurrent callers for the same key do not build duplicate graphs."""
+    builds = []
+    registry = GraphRegistry(factory=_counting_factory(builds))
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("budget_friendly")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_reload_config_invalidates_registry():
+    """reload_config() clears cached graphs so they are rebuilt."""
+    builds = []
+    registry = GraphRegistry(factory=_counting_factory(builds))
+
+    registry.get("cheapest")
+    reload_config()
+    assert len(registry) == 0
+
+    registry.get("cheapest")
+    assert len(builds) == 2
+
+
+def test_reload_callback_does_not_keep_registry_alive():
+    """A discarded registry is collected and no longer notified on reload."""
+    builds = []
+    registry = GraphRegistry(factory=_counting_factory(builds))
+    registry.get("cheapest")
+    collected = weakref.ref(registry)
+
+    del registry
+    gc.collect()
+    assert collected() is None
+    reload_config()
+
+
+def test_warm_up_reports_failures_without_raising():
+    """A failing build is reported by warm_up instead of raising."""
+
+    def factory(key):
+        if key.budget_preference == "luxurious":
+            raise ValueError("missing API key")
+        return FakeBuilder(key)
+
+    registry = GraphRegistry(factory=factory)
+    results = registry.warm_up()
+
+    assert results["cheapest"] is None
+    assert results["luxurious"] == "missing API key"
+    assert len(registry) == 2
+
+
+def test_unknown_budget_preference_is_rejected_without_building():
+    """Only known preferences reach the registry; variants share one graph."""
+    builds = []
+    registry = GraphRegistry(factory=_counting_factory(builds))
+
+    with pytest.raises(ValueError):
+        registry.get("free stuff please")
+    assert len(registry) == 0 and not builds
+
+    assert registry.get(" Budget-Friendly ") is registry.get("budget_friendly")
+    assert len(registry) == 1
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled HTTP transport shared by the upstream API clients.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from utils import http_client
+from utils.http_client import PooledSession, build_async_client
+
+
+class _Upstream:
+    """Keep-alive server counting connections, failures and concurrency."""
+
+    def __init__(self, failures=0, retry_after=None):
+        self.failures = failures
+        self.retry_after = retry_after
+        self.connections = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with upstream._lock:
+                    upstream.connections += 1
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Answer 503 while failures remain, else 200 (slowly on /slow)."""
+                with upstream._lock:
+                    upstream.active += 1
+                    upstream.peak = max(upstream.peak, upstream.active)
+                    failing = upstream.failures > 0
+                    upstream.failures -= failing
+                if self.path == "/slow":
+                    time.sleep(0.05)
+                body = b"busy" if failing else b"ok"
+                self.send_response(503 if failing else 200)
+                if failing and upstream.retry_after is not None:
+                    self.send_header("Retry-After", upstream.retry_after)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with upstream._lock:
+                    upstream.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def test_session_reuses_connections_and_retries():
+    """Sequential calls share one connection; a 503 is retried transparently."""
+    with _Upstream(failures=1) as upstream:
+        session = PooledSession(retries=2, backoff_seconds=0.01)
+        answers = [session.get(f"{upstream.url}/").text for _ in range(5)]
+        session.close()
+
+    assert answers == ["ok"] * 5
+    assert upstream.connections == 1
+
+
+def test_session_caps_retry_after(monkeypatch):
+    """A huge Retry-After does not hold the calling thread for that long."""
+    monkeypatch.setattr(http_client, "MAX_RETRY_AFTER_SECONDS", 0.2)
+    with _Upstream(failures=1, retry_after="3600") as upstream:
+        session = PooledSession(retries=2, backoff_seconds=0.01)
+        started = time.perf_counter()
+        answer = session.get(f"{upstream.url}/").text
+        elapsed = time.perf_counter() - started
+        session.close()
+
+    assert answer == "ok"
+    assert 0.2 <= elapsed < 1.0
+
+
+def test_session_caps_requests_per_host():
+    """No more than max_per_host requests reach one host at a time."""
+    with _Upstream() as upstream:
+        session = PooledSession(max_per_host=2)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            statuses = list(
+                pool.map(lambda _: session.get(f"{upstream.url}/slow"), range(8))
+            )
+        session.close()
+
+    assert all(r.status_code == 200 for r in statuses)
+    assert upstream.peak <= 2
+
+
+def test_async_client_shares_the_policy():
+    """The async client pools, caps per host, retries and gives up eventually."""
+
+    async def run(url):
+        client = build_async_client(max_per_host=2, retries=1, backoff_seconds=0.01)
+        async with client:
+            flaky = await client.get(f"{url}/")
+            burst = await asyncio.gather(*(client.get(f"{url}/slow") for _ in range(6)))
+        return flaky, burst
+
+    with _Upstream(failures=1) as upstream:
+        flaky, burst = asyncio.run(run(upstream.url))
+    assert flaky.text == "ok" and all(r.text == "ok" for r in burst)
+    assert upstream.peak <= 2 and upstream.connections <= 2
+
+    with _Upstream(failures=5) as upstream:
+        flaky, _ = asyncio.run(run(upstream.url))
+    assert flaky.status_code == 503
+
+
+def test_session_applies_default_timeout(monkeypatch):
+    """Calls without a timeout get the session's default; explicit ones win."""
+    seen = []
+    monkeypatch.setattr(
+        requests.Session,
+        "request",
+        lambda _self, _method, _url, **kwargs: seen.append(kwargs["timeout"]),
+    )
+    session = PooledSession(timeout=0.5)
+    session.get("http://example.invalid/")
+    session.post("http://example.invalid/", timeout=20)
+    assert seen == [0.5, 20]
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded job queue and the /jobs endpoints.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+from utils.job_queue import JobManager, QueueFullError
+
+
+def test_queue_rejects_jobs_beyond_capacity():
+    """Only `workers` jobs run at once and the queue bound is enforced."""
+
+    async def scenario():
+        running = []
+        peak = []
+        release = asyncio.Event()
+
+        async def runner(payload):
+            running.append(payload)
+            peak.append(len(running))
+            await release.wait()
+            running.remove(payload)
+            return payload * 2
+
+        manager = JobManager(runner, workers=2, max_queue_size=2)
+        jobs = [manager.submit(i) for i in range(2)]
+        await asyncio.sleep(0)  # let the workers pick up the first two jobs
+        jobs += [manager.submit(i) for i in range(2, 4)]
+
+        try:
+            manager.submit(99)
+            raise AssertionError("expected QueueFullError")
+        except QueueFullError as e:
+            assert e.retry_after_seconds >= 1
+
+        release.set()
+        while any(job.status != "succeeded" for job in jobs):
+            await asyncio.sleep(0.01)
+        await manager.stop()
+        return jobs, max(peak), manager.stats()
+
+    jobs, peak, stats = asyncio.run(scenario())
+    assert [job.result for job in jobs] == [0, 2, 4, 6]
+    assert peak == 2
+    assert stats["rejected"] == 1
+
+
+def test_finished_jobs_expire_after_ttl():
+    """Results are dropped once the retention TTL has passed."""
+
+    async def scenario():
+        async def runner(payload):
+            return payload
+
+        manager = JobManager(runner, workers=1, result_ttl_seconds=0.05)
+        job = manager.submit("plan")
+        while manager.get(job.job_id).status != "succeeded":
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        expired = manager.get(job.job_id)
+        await manager.stop()
+        return expired
+
+    assert asyncio.run(scenario()) is None
+
+
+class StubRegistry:  # pylint: disable=too-few-public-methods
+    """Registry stand-in that skips the startup warm-up."""
+
+    def warm_up(self):
+        """Nothing to pre-build."""
+        return {}
+
+
+def test_jobs_endpoints_round_trip(monkeypatch):
+    """POST /jobs returns an id immediately; GET /jobs/{id} returns the plan."""
+
+    async def fake_answer(query, _timer):
+        await asyncio.sleep(0.05)
+        return f"Plan for {query.query}", "MISS"
+
+    monkeypatch.setattr(main, "graph_registry", StubRegistry())
+    monkeypatch.setattr(main, "_answer_query", fake_answer)
+    monkeypatch.setattr(main, "job_manager", JobManager(main._run_job, workers=1))
+
+    with TestClient(main.app) as client:
+        submitted = client.post("/jobs", json={"query": "Paris"})
+        assert submitted.status_code == 202
+        job_id = submitted.json()["job_id"]
+        assert submitted.json()["status_url"].endswith(f"/jobs/{job_id}")
+
+        deadline = time.time() + 5
+        status = client.get(f"/jobs/{job_id}").json()
+        while status["status"] != "succeeded" and time.time() < deadline:
+            time.sleep(0.02)
+            status = client.get(f"/jobs/{job_id}").json()
+
+        assert status["result"]["answer"] == "Plan for Paris"
+        assert client.get("/jobs/unknown").status_code == 404
+
+
+def test_jobs_endpoint_returns_429_when_full(monkeypatch):
+    """A full queue is reported as 429 with a Retry-After header."""
+
+    def reject(_payload):
+        raise QueueFullError(retry_after_seconds=12)
+
+    monkeypatch.setattr(main.job_manager, "submit", reject)
+    client = TestClient(main.app)
+
+    response = client.post("/jobs", json={"query": "Paris"})
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "12"
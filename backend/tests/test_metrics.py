@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for latency instrumentation: Prometheus metrics, Server-Timing and the
+StageTimer binding used by LLM, tool and external API calls.
+"""
+
+import asyncio
+import os
+import sys
+
+from fastapi.testclient import TestClient
+from langchain_core.tools import StructuredTool
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+from utils.metrics import (
+    OPERATION_ERRORS,
+    OPERATION_SECONDS,
+    MetricsRegistry,
+    instrument_tool,
+    timed,
+)
+from utils.response_cache import ResponseCache
+from utils.single_flight import SingleFlight
+from utils.timing import StageTimer
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Bucket counts are cumulative and end with +Inf, _sum and _count."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo.", ("op",), (0.1, 1))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value, op="x")
+    registry.counter("demo_total", "Demo.", ("op",)).inc(op='say "hi"')
+
+    text = registry.render()
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{op="x",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{op="x",le="1"} 2' in text
+    assert 'demo_seconds_bucket{op="x",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{op="x"} 3' in text
+    assert 'demo_total{op="say \\"hi\\""} 1' in text
+
+
+def test_timed_reports_to_histogram_and_bound_timer():
+    """Operations land in the histogram, the error counter and the request timer."""
+    timer = StageTimer()
+    before = OPERATION_SECONDS.count(component="test", operation="op")
+    errors_before = OPERATION_ERRORS.value(component="test", operation="op")
+
+    with timer.bind():
+        with timed("test", "op"):
+            pass
+        try:
+            with timed("test", "op"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+    with timed("test", "op"):  # unbound: metrics only
+        pass
+
+    assert OPERATION_SECONDS.count(component="test", operation="op") == before + 3
+    assert OPERATION_ERRORS.value(component="test", operation="op") == (
+        errors_before + 1
+    )
+    assert "test.op" in timer.summary()
+
+
+def test_instrumented_tool_is_timed_by_name():
+    """Sync and async tool invocations are both recorded under the tool name."""
+
+    def lookup_city(city: str) -> str:
+        """Look up a city"""
+        return city
+
+    async def alookup_city(city: str) -> str:
+        return city
+
+    tool = instrument_tool(
+        StructuredTool.from_function(func=lookup_city, coroutine=alookup_city)
+    )
+    before = OPERATION_SECONDS.count(component="tool", operation="lookup_city")
+
+    assert tool.invoke({"city": "Paris"}) == "Paris"
+    assert asyncio.run(tool.ainvoke({"city": "Rome"})) == "Rome"
+    assert OPERATION_SECONDS.count(component="tool", operation="lookup_city") == (
+        before + 2
+    )
+
+
+def test_query_sets_server_timing_and_feeds_metrics(monkeypatch):
+    """/query exposes its stages in Server-Timing and in /metrics."""
+
+    async def fake_run(_query, _timer):
+        with timed("llm", "agent"):
+            await asyncio.sleep(0.01)
+        return "Plan"
+
+    monkeypatch.setattr(main, "_run_travel_plan", fake_run)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(enabled=False))
+    monkeypatch.setattr(main, "single_flight", SingleFlight())
+    client = TestClient(main.app)
+
+    response = client.post("/query", json={"query": "Plan a trip to Paris"})
+    server_timing = response.headers["server-timing"]
+    assert "llm.agent;dur=" in server_timing
+    assert "total;dur=" in server_timing
+
+    metrics = client.get("/metrics")
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert (
+        'travel_planner_requests_total{endpoint="query",outcome="miss"}' in metrics.text
+    )
+    assert (
+        'travel_planner_operation_duration_seconds_count{component="llm",'
+        'operation="agent"}' in metrics.text
+    )
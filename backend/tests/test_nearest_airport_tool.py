@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the find_nearest_airport_to_city agent tool.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tests.ors_stub import OrsStubServer
+from tools.distance_calculator_tool import (
+    NEAREST_AIRPORT_CANDIDATES,
+    DistanceCalculatorTool,
+)
+from utils.airport_index import get_airport_index
+from utils.route_cache import RouteCache
+
+NICE = (43.7102, 7.2620)
+
+
+def _nearest_tool(monkeypatch, ors_url):
+    monkeypatch.setenv("OPENROUTE_BASE_URL", ors_url)
+    tool_container = DistanceCalculatorTool(openroute_api_key="test-key")
+    tool_container.route_cache = RouteCache()
+
+    async def ageocode(_address):
+        return NICE
+
+    monkeypatch.setattr(tool_container, "_get_coordinates_from_address", lambda _: NICE)
+    monkeypatch.setattr(tool_container, "_aget_coordinates_from_address", ageocode)
+    tools = {tool.name: tool for tool in tool_container.distance_tool_list}
+    return tools["find_nearest_airport_to_city"], tool_container
+
+
+def test_tool_searches_the_whole_table_and_routes_once(monkeypatch):
+    """The local airport wins; the top candidates are routed once, then cached."""
+    with OrsStubServer() as ors:
+        tool, _ = _nearest_tool(monkeypatch, ors.url)
+        result = tool.invoke({"city_name": "Nice"})
+        async_result = asyncio.run(tool.ainvoke({"city_name": "Nice"}))
+
+    assert result.startswith("Nearest commercial airport to Nice:")
+    assert "(NCE) - " in result and " km by road" in result
+    assert "Other nearby airports:" in result
+    assert async_result == result
+    assert len(ors.paths("/v2/matrix/")) == 1
+    assert not ors.paths("/v2/directions/")
+    assert NEAREST_AIRPORT_CANDIDATES > 1
+
+
+def test_tool_filters_by_type_and_falls_back_to_straight_line(monkeypatch):
+    """Type filters apply and unroutable results still return an airport."""
+    with OrsStubServer() as ors:
+        tool, tool_container = _nearest_tool(monkeypatch, ors.url)
+
+    async def no_route(_sources, _destinations):
+        return None
+
+    monkeypatch.setattr(tool_container.route_matrix, "amatrix", no_route)
+    index = get_airport_index()
+
+    result = asyncio.run(
+        tool.ainvoke({"city_name": "Nice", "airport_type": "international"})
+    )
+    code = result.split("(")[1].split(")")[0]
+    assert index.airport_type(code) == "international"
+    assert "straight-line (road distance unavailable)" in result
+
+    assert "must be one of" in tool.invoke(
+        {"city_name": "Nice", "airport_type": "spaceport"}
+    )
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for POST /query/batch: bounded parallelism, NDJSON streaming and
+deduplication of identical tool calls within a batch.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+from fastapi.testclient import TestClient
+from langchain_core.tools import StructuredTool
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+from utils.call_memo import CallMemo, memoize_tool
+from utils.response_cache import ResponseCache
+from utils.single_flight import SingleFlight
+
+
+def _weather_tool(fetched):
+    def get_current_weather(city: str) -> str:
+        """Get current weather for a city"""
+        return f"Sunny in {city}"
+
+    async def aget_current_weather(city: str) -> str:
+        fetched.append(city)
+        await asyncio.sleep(0.05)
+        return f"Sunny in {city}"
+
+    return memoize_tool(
+        StructuredTool.from_function(
+            func=get_current_weather, coroutine=aget_current_weather
+        )
+    )
+
+
+def test_memoized_tool_runs_once_per_scope():
+    """Identical calls share one execution inside a memo scope only."""
+    fetched = []
+    tool = _weather_tool(fetched)
+
+    async def scenario():
+        memo = CallMemo()
+        with memo.bind():
+            results = await asyncio.gather(
+                tool.ainvoke({"city": "Paris"}),
+                tool.ainvoke({"city": "Paris"}),
+                tool.ainvoke({"city": "Rome"}),
+            )
+        unscoped = await tool.ainvoke({"city": "Paris"})
+        return results, unscoped, memo.stats()
+
+    results, unscoped, stats = asyncio.run(scenario())
+    assert results == ["Sunny in Paris", "Sunny in Paris", "Sunny in Rome"]
+    assert unscoped == "Sunny in Paris"
+    assert fetched == ["Paris", "Rome", "Paris"]
+    assert stats == {"calls": 2, "deduplicated": 1}
+
+
+def test_batch_streams_ndjson_with_bounded_parallelism(monkeypatch):
+    """Results arrive as NDJSON lines, at most max_concurrency plans run at once."""
+    fetched = []
+    tool = _weather_tool(fetched)
+    running = []
+    peak = []
+
+    async def fake_run(query, _timer):
+        running.append(query.query)
+        peak.append(len(running))
+        weather = await tool.ainvoke({"city": query.endCity})
+        await asyncio.sleep(0.05)
+        running.remove(query.query)
+        return f"{query.query}: {weather}"
+
+    monkeypatch.setattr(main, "_run_travel_plan", fake_run)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(enabled=False))
+    monkeypatch.setattr(main, "single_flight", SingleFlight())
+    client = TestClient(main.app)
+
+    queries = [
+        {"query": f"Trip {i}", "endCity": "Paris" if i % 2 else "Rome"}
+        for i in range(6)
+    ]
+    response = client.post(
+        "/query/batch", json={"queries": queries, "max_concurrency": 2}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    results, summary = lines[:-1], lines[-1]
+
+    assert sorted(result["index"] for result in results) == list(range(6))
+    for result in results:
+        city = queries[result["index"]]["endCity"]
+        assert result["answer"] == f"Trip {result['index']}: Sunny in {city}"
+    assert max(peak) == 2
+    assert sorted(fetched) == ["Paris", "Rome"]
+    assert summary["completed"] == 6
+    assert summary["tool_calls"]["deduplicated"] == 4
+
+
+def test_batch_rejects_oversized_batches(monkeypatch):
+    """Batches above batch.max_queries are refused up front."""
+    monkeypatch.setattr(main, "get_config_value", lambda *keys, default=None: 1)
+    client = TestClient(main.app)
+
+    response = client.post(
+        "/query/batch", json={"queries": [{"query": "A"}, {"query": "B"}]}
+    )
+    assert response.status_code == 400
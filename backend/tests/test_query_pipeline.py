@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the /query orchestration: enrichments overlap the agent run and
+per-stage timings are reported.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+from utils.response_cache import ResponseCache
+
+STAGE_SECONDS = 0.3
+
+
+class SlowGraph:  # pylint: disable=too-few-public-methods
+    """Compiled-graph stand-in with a fixed async latency."""
+
+    async def ainvoke(self, messages):
+        """Simulate an agent run."""
+        await asyncio.sleep(STAGE_SECONDS)
+        return {"messages": messages["messages"] + [AIMessage(content="Plan")]}
+
+
+class StubRegistry:  # pylint: disable=too-few-public-methods
+    """Registry stand-in returning the slow graph."""
+
+    def get(self, _budget_preference):
+        """Return the stub graph."""
+        return SlowGraph()
+
+
+def _slow_section(text):
+    def build(_query):
+        time.sleep(STAGE_SECONDS)  # blocking, like the real Amadeus/ORS clients
+        return text
+
+    return build
+
+
+def test_enrichments_run_concurrently_with_agent(monkeypatch):
+    """Latency is close to the slowest stage, not the sum of all stages."""
+    monkeypatch.setattr(main, "graph_registry", StubRegistry())
+    monkeypatch.setattr(main, "response_cache", ResponseCache())
+    monkeypatch.setattr(main, "_build_distance_section", _slow_section("\nDIST"))
+    monkeypatch.setattr(main, "_build_car_rental_section", _slow_section("\nCARS"))
+    client = TestClient(main.app)
+
+    started = time.perf_counter()
+    response = client.post("/query", json={"query": "Plan a trip to Paris"})
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["answer"] == "Plan\nDIST\nCARS"
+    assert elapsed < STAGE_SECONDS * 2
+
+    timings = body["timings"]
+    for stage in ("graph", "agent", "distance", "car_rental", "total"):
+        assert stage in timings
+    assert timings["total"] < timings["agent"] + timings["distance"]
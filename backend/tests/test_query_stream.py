@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for the Server-Sent Events endpoint POST /query/stream.
+
+A real LangGraph agent/tools graph is compiled around a scripted chat model so
+the test exercises LangGraph's "messages" and "updates" streaming modes.
+"""
+
+import json
+import os
+import sys
+from typing import Any, List
+
+from fastapi.testclient import TestClient
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.tools import tool
+from langgraph.graph import END, START, MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode, tools_condition
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model that replays scripted AIMessages, streaming word by word."""
+
+    responses: List[AIMessage]
+    position: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _next(self) -> AIMessage:
+        message = self.responses[self.position]
+        self.position += 1
+        return message
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        return ChatResult(generations=[ChatGeneration(message=self._next())])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        message = self._next()
+        for i, word in enumerate(message.content.split(" ")):
+            chunk = ChatGenerationChunk(
+                message=AIMessageChunk(content=word if i == 0 else f" {word}")
+            )
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+        for index, tool_call in enumerate(message.tool_calls):
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": tool_call["name"],
+                            "args": json.dumps(tool_call["args"]),
+                            "id": tool_call["id"],
+                            "index": index,
+                        }
+                    ],
+                )
+            )
+
+
+@tool
+def get_current_weather(city: str) -> str:
+    """Get current weather for a city"""
+    return f"Current weather in {city}: 21°C, clear sky"
+
+
+def _build_graph():
+    model = ScriptedChatModel(
+        responses=[
+            AIMessage(
+                content="Checking the weather",
+                tool_calls=[
+                    {
+                        "name": "get_current_weather",
+                        "args": {"city": "Paris"},
+                        "id": "c1",
+                    }
+                ],
+            ),
+            AIMessage(content="Pack light clothes for Paris"),
+        ]
+    )
+
+    async def agent(state: MessagesState):
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    graph_builder = StateGraph(MessagesState)
+    graph_builder.add_node("agent", agent)
+    graph_builder.add_node("tools", ToolNode(tools=[get_current_weather]))
+    graph_builder.add_edge(START, "agent")
+    graph_builder.add_conditional_edges("agent", tools_condition)
+    graph_builder.add_edge("tools", "agent")
+    graph_builder.add_edge("agent", END)
+    return graph_builder.compile()
+
+
+class StubRegistry:  # pylint: disable=too-few-public-methods
+    """Registry stand-in returning the scripted graph."""
+
+    def __init__(self):
+        self.graph = _build_graph()
+
+    def get(self, _budget_preference):
+        """Return the scripted graph."""
+        return self.graph
+
+
+def _parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_emits_tokens_tools_sections_and_done(monkeypatch):
+    """The stream carries LLM tokens, tool events, report sections and the answer."""
+    monkeypatch.setattr(main, "graph_registry", StubRegistry())
+    monkeypatch.setattr(main, "_build_distance_section", lambda query: "\nDIST")
+    monkeypatch.setattr(main, "_build_car_rental_section", lambda query: "\nCARS")
+    client = TestClient(main.app)
+
+    response = client.post("/query/stream", json={"query": "Plan a trip to Paris"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse(response.text)
+    names = [name for name, _ in events]
+
+    tokens = "".join(data["content"] for name, data in events if name == "token")
+    assert tokens == "Checking the weatherPack light clothes for Paris"
+
+    tool_start = next(data for name, data in events if name == "tool_start")
+    assert tool_start == {
+        "id": "c1",
+        "name": "get_current_weather",
+        "args": {"city": "Paris"},
+    }
+    tool_end = next(data for name, data in events if name == "tool_end")
+    assert tool_end["content"].startswith("Current weather in Paris")
+    assert names.index("tool_start") < names.index("tool_end")
+
+    sections = [data["name"] for name, data in events if name == "section"]
+    assert sections == ["distance", "car_rental"]
+
+    assert names[-1] == "done"
+    done = events[-1][1]
+    assert done["answer"] == "Pack light clothes for Paris\nDIST\nCARS"
+    assert "agent" in done["timings"]
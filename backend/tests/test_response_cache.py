@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the TTL + LRU cache and the /query response cache.
+"""
+
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+from utils.response_cache import ResponseCache, build_cache_key
+from utils.ttl_cache import TTLCache
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    """Entries are served until their TTL elapses."""
+    clock = FakeClock()
+    cache = TTLCache(ttl_seconds=10, clock=clock)
+    cache.set("paris", "plan")
+
+    clock.now = 9
+    assert cache.get("paris") == "plan"
+    clock.now = 10
+    assert cache.get("paris") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Entry count and byte bounds evict the least recently used entry first."""
+    cache = TTLCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    sized = TTLCache(max_entries=10, max_bytes=10, sizeof=len)
+    sized.set("a", "xxxxxx")
+    sized.set("b", "yyyyyy")
+    assert sized.get("a") is None
+    assert sized.stats()["bytes"] == 6
+
+
+def test_cache_key_normalizes_trip_parameters():
+    """Case, whitespace and trailing punctuation do not change the key."""
+    first = build_cache_key(
+        "Plan a trip to  Paris!", "cheapest", "jfk", "cdg", "New York", "Paris"
+    )
+    second = build_cache_key(
+        "plan a trip to paris", "cheapest", "JFK", "CDG", " new york", "PARIS"
+    )
+    assert first == second
+    assert first != build_cache_key("plan a trip to paris", "luxurious", "JFK", "CDG")
+
+
+def test_query_endpoint_hits_bypasses_and_refreshes(monkeypatch):
+    """Repeated queries are served from cache unless bypassed or refreshed."""
+    runs = []
+
+    async def fake_run(query, _timer):
+        runs.append(query.query)
+        return f"Plan #{len(runs)}"
+
+    monkeypatch.setattr(main, "_run_travel_plan", fake_run)
+    monkeypatch.setattr(main, "response_cache", ResponseCache())
+    client = TestClient(main.app)
+    payload = {"query": "Plan a trip to Paris", "budget_preference": "cheapest"}
+
+    first = client.post("/query", json=payload)
+    assert first.headers["x-cache"] == "MISS"
+    second = client.post("/query", json={**payload, "query": "plan a trip to paris."})
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json()["answer"] == "Plan #1"
+
+    bypass = client.post("/query", json={**payload, "cache_bypass": True})
+    assert bypass.json()["answer"] == "Plan #2"
+    refresh = client.post("/query", json={**payload, "cache_refresh": True})
+    assert refresh.json()["answer"] == "Plan #3"
+    assert client.post("/query", json=payload).json()["answer"] == "Plan #3"
+
+    stats = client.get("/cache/stats").json()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["bypasses"] == 1
+    assert stats["refreshes"] == 1
+    assert len(runs) == 3
+
+
+def test_budget_preference_is_normalized_before_caching(monkeypatch):
+    """Case variants share one cached answer and the graph sees the same value."""
+    budgets = []
+
+    async def fake_run(query, _timer):
+        budgets.append(query.budget_preference)
+        return f"Plan for {query.budget_preference}"
+
+    monkeypatch.setattr(main, "_run_travel_plan", fake_run)
+    monkeypatch.setattr(main, "response_cache", ResponseCache())
+    client = TestClient(main.app)
+    payload = {"query": "Plan a trip to Rome", "budget_preference": "Cheapest"}
+
+    assert client.post("/query", json=payload).headers["x-cache"] == "MISS"
+    hit = client.post("/query", json={**payload, "budget_preference": "cheapest "})
+    assert hit.headers["x-cache"] == "HIT"
+    unknown = client.post("/query", json={**payload, "budget_preference": "Frugal"})
+    assert unknown.json()["answer"] == "Plan for budget_friendly"
+    assert budgets == ["cheapest", "budget_friendly"]
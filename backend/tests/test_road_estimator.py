@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the offline road distance estimator and the "estimate" routing mode.
+"""
+
+import os
+import sys
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tests.ors_stub import OrsStubServer
+from tools.distance_calculator_tool import DistanceCalculatorTool
+from utils.airport_distance_calculator import AirportDistanceCalculator
+from utils.geodesic import distance_km
+from utils.road_estimator import REGION_PROFILES, RoadEstimator
+from utils.route_cache import RouteCache
+
+CDG = (49.0097, 2.5479)
+LOUVRE = (48.8606, 2.3376)
+LYON = (45.7640, 4.8357)
+KOLKATA = (22.5726, 88.3639)
+
+
+def test_estimates_use_region_and_trip_profile():
+    """Circuity and speed come from the region and the urban/intercity split."""
+    estimator = RoadEstimator(urban_radius_km=25)
+    assert estimator.region(CDG) == "europe"
+    assert estimator.region(KOLKATA) == "south_asia"
+
+    city = estimator.estimate(CDG, LOUVRE)
+    trip = estimator.estimate(LOUVRE, LYON)
+    europe = REGION_PROFILES["europe"]
+    assert city.urban and not trip.urban
+    assert city.distance_km == round(distance_km(CDG, LOUVRE) * 1.40, 2)
+    assert trip.duration_s == round(
+        distance_km(LOUVRE, LYON) * 1.25 / europe.intercity_speed_kmh * 3600, 1
+    )
+
+
+def test_estimate_mode_never_calls_ors(monkeypatch):
+    """Estimate mode answers offline and prefers a real cached route."""
+    with OrsStubServer() as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        calculator = AirportDistanceCalculator(api_key="test-key")
+        calculator.route_cache = RouteCache()
+        calculator.route_cache.store(CDG, LYON, 470.0, 16000.0)
+
+        offline = calculator.calculate_driving_distances(
+            CDG, [LOUVRE, LYON], mode="estimate"
+        )
+        single = calculator.calculate_driving_distance(CDG, LOUVRE, mode="estimate")
+
+    assert not ors.calls
+    assert offline[1] == (470.0, 16000.0, False) and offline[0][2]
+    assert (
+        offline[0][0]
+        == single
+        == calculator.road_estimator.estimate(CDG, LOUVRE).distance_km
+    )
+
+
+def test_report_lines_mark_estimates(monkeypatch):
+    """Estimated distances in the /query section do not read as measured."""
+    calculator = AirportDistanceCalculator(api_key="test-key")
+    monkeypatch.setattr(calculator, "get_coordinates_from_address", lambda _: LOUVRE)
+    monkeypatch.setattr(
+        calculator,
+        "calculate_driving_distances",
+        lambda start, ends, mode="exact": [(12.5, 1800.0, mode == "estimate")]
+        * len(ends),
+    )
+
+    lines = {
+        mode: calculator.format_distance_info(
+            calculator.get_airport_to_attraction_distances("CDG", ["Louvre"], mode)[0]
+        )
+        for mode in ("estimate", "exact")
+    }
+
+    assert lines["estimate"].endswith(
+        "to Louvre: ≈ 12.5 km (estimated, approximately 0h 30m by car)"
+    )
+    assert lines["exact"].endswith("to Louvre: 12.5 km (approximately 0h 30m by car)")
+
+
+def test_tool_estimate_mode(monkeypatch):
+    """The LLM tool can ask for an offline estimate and rejects unknown modes."""
+    tool_container = DistanceCalculatorTool(openroute_api_key="test-key")
+    tool_container.route_cache = RouteCache()
+    places = {"Louvre": LOUVRE, "Lyon": LYON}
+    monkeypatch.setattr(tool_container, "_get_coordinates_from_address", places.get)
+    tools = {tool.name: tool for tool in tool_container.distance_tool_list}
+    between = tools["calculate_distance_between_places"]
+
+    result = between.invoke({"place1": "Louvre", "place2": "Lyon", "mode": "estimate"})
+    assert result.startswith("Distance from Louvre to Lyon:")
+    assert "offline estimate" in result
+    assert "must be one of" in between.invoke(
+        {"place1": "Louvre", "place2": "Lyon", "mode": "guess"}
+    )
+
+
+def test_accuracy_report_against_cached_routes():
+    """Errors are reported overall and per region/profile."""
+    estimator = RoadEstimator()
+    cache = RouteCache()
+    city = estimator.estimate(CDG, LOUVRE)
+    cache.store(CDG, LOUVRE, city.distance_km, city.duration_s)
+    cache.store(LOUVRE, LYON, estimator.estimate(LOUVRE, LYON).distance_km * 0.8)
+    cache.store_estimate(CDG, LYON, 1.0)
+
+    report = estimator.accuracy_report(cache)
+    assert report["routes"] == 2
+    # Cached endpoints are rounded, so a perfect estimate is off by a hair
+    assert report["groups"]["europe/urban"]["distance"]["mape"] < 0.5
+    assert 24.5 < report["groups"]["europe/intercity"]["distance"]["bias"] < 25.5
+    assert report["duration"]["mape"] < 0.5
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the driving route cache and its use by the distance calculator.
+"""
+
+import os
+import sys
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tests.ors_stub import OrsStubServer
+from utils.airport_distance_calculator import AirportDistanceCalculator
+from utils.route_cache import RouteCache
+
+CDG = (49.0097, 2.5479)
+LOUVRE = (48.8606, 2.3376)
+EIFFEL = (48.8584, 2.2945)
+
+
+def test_keys_ignore_direction_and_tiny_offsets():
+    """A -> B, B -> A and points within the rounding share one entry."""
+    cache = RouteCache(precision=3)
+    cache.store(CDG, LOUVRE, 31.2, 2400.0)
+
+    assert cache.get(LOUVRE, CDG).distance_km == 31.2
+    assert cache.get((49.00971, 2.54788), (48.86062, 2.33758)).duration_s == 2400.0
+    assert cache.get(CDG, EIFFEL) is None
+    assert RouteCache(enabled=False).get(CDG, LOUVRE) is None
+
+
+def test_estimates_never_shadow_routes():
+    """Estimates are kept apart and a real route always wins."""
+    cache = RouteCache()
+    cache.store_estimate(CDG, LOUVRE, 25.0)
+    assert cache.get(CDG, LOUVRE).estimated
+    assert cache.get(CDG, LOUVRE, estimates=False) is None
+
+    cache.store(CDG, LOUVRE, 31.2)
+    cache.store_estimate(CDG, LOUVRE, 25.0)
+    route = cache.get(CDG, LOUVRE)
+    assert route.distance_km == 31.2 and not route.estimated
+
+
+def test_calculator_routes_each_pair_once(monkeypatch):
+    """Repeated distances, single or batched, skip ORS after the first call."""
+    with OrsStubServer(unroutable=[EIFFEL]) as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        calculator = AirportDistanceCalculator(api_key="test-key")
+        calculator.route_cache = RouteCache()
+
+        first = calculator.calculate_driving_distances(CDG, [LOUVRE, EIFFEL])
+        again = calculator.calculate_driving_distances(LOUVRE, [CDG])
+        single = calculator.calculate_driving_distance(CDG, LOUVRE)
+        estimate = calculator.calculate_driving_distance(EIFFEL, CDG)
+
+    assert len(ors.paths("/v2/matrix/")) == 1
+    assert not ors.paths("/v2/directions/")
+    assert again[0] == first[0] and single == first[0][0] and not first[0][2]
+    # The unroutable pair falls back once and the estimate is reused
+    offline = calculator.road_estimator.estimate(CDG, EIFFEL)
+    assert first[1] == (offline.distance_km, offline.duration_s, True)
+    assert estimate == first[1][0]
+    assert calculator.route_cache.get(CDG, EIFFEL).estimated
+
+
+def test_exact_mode_marks_fallback_estimates(monkeypatch):
+    """A pair the matrix cannot route is labelled estimated even in exact mode."""
+    places = {"Louvre": LOUVRE, "Eiffel Tower": EIFFEL}
+    with OrsStubServer(unroutable=[EIFFEL]) as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        calculator = AirportDistanceCalculator(api_key="test-key")
+        calculator.route_cache = RouteCache()
+        monkeypatch.setattr(calculator, "get_coordinates_from_address", places.get)
+
+        louvre, eiffel = calculator.get_airport_to_attraction_distances(
+            "CDG", list(places), mode="exact"
+        )
+
+    assert not louvre["estimated"] and eiffel["estimated"]
+    assert "≈" not in calculator.format_distance_info(louvre)
+    assert "Eiffel Tower: ≈ " in calculator.format_distance_info(eiffel)
+    assert "(estimated, approximately" in calculator.format_distance_info(eiffel)
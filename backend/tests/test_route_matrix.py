@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for batch routing through the OpenRouteService matrix endpoint.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tests.ors_stub import OrsStubServer
+from utils.airport_distance_calculator import AirportDistanceCalculator
+from utils.geocode_cache import GeocodeCache
+from utils.route_cache import RouteCache
+from utils.route_matrix import RouteMatrixClient
+
+CDG = (49.0097, 2.5479)
+ATTRACTIONS = {
+    "Eiffel Tower, Paris": (48.8584, 2.2945),
+    "Louvre Museum, Paris": (48.8606, 2.3376),
+    "Notre-Dame de Paris, Paris": (48.8530, 2.3499),
+    "Sacre-Coeur, Paris": (48.8867, 2.3431),
+}
+
+
+def test_matrix_routes_all_destinations_in_one_request():
+    """N destinations cost one HTTP call, sync or async."""
+    destinations = list(ATTRACTIONS.values())
+    with OrsStubServer() as ors:
+        client = RouteMatrixClient("test-key", base_url=ors.url)
+        matrix = client.matrix([CDG], destinations)
+        async_matrix = asyncio.run(client.amatrix([CDG], destinations))
+
+    assert ors.paths("/v2/matrix/") == ["/v2/matrix/driving-car"] * 2
+    assert async_matrix == matrix
+    assert len(matrix.row()) == len(destinations)
+    assert all(20 < km < 40 for km in matrix.row())
+    assert all(seconds > 0 for seconds in matrix.durations_s[0])
+
+
+def test_matrix_failure_returns_none():
+    """A failing service yields None rather than an exception."""
+    with OrsStubServer() as ors:
+        client = RouteMatrixClient("test-key", base_url=ors.url, profile="unknown")
+        client.base_url += "/missing"
+        assert client.matrix([CDG], [ATTRACTIONS["Eiffel Tower, Paris"]]) is None
+
+
+def test_attraction_distances_share_one_matrix_request(monkeypatch):
+    """Attractions are routed together and unroutable ones fall back."""
+    louvre = ATTRACTIONS["Louvre Museum, Paris"]
+    with OrsStubServer(places=ATTRACTIONS, unroutable=[louvre]) as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        calculator = AirportDistanceCalculator(api_key="test-key")
+        calculator.geocode_cache = GeocodeCache(":memory:")
+        calculator.route_cache = RouteCache()
+        results = calculator.get_airport_to_attraction_distances(
+            "CDG", [*ATTRACTIONS, "Nowhere In Particular"]
+        )
+
+    assert len(ors.paths("/v2/matrix/")) == 1
+    assert not ors.paths("/v2/directions/")
+    assert [r["success"] for r in results] == [True] * 4 + [False]
+    assert "Could not find coordinates" in results[-1]["error"]
+    # The unroutable Louvre gets the offline estimate instead
+    airport = calculator.get_airport_coordinates("CDG")
+    fallback = calculator.road_estimator.estimate(airport, louvre).distance_km
+    assert results[1]["distance_km"] == fallback
+    assert all(r["travel_time"].endswith("m") for r in results[:4])
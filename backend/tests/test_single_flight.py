@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for single-flight coalescing of identical in-flight /query requests.
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+import main
+from utils.response_cache import ResponseCache
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    """Callers with the same key get the leader's result; other keys run separately."""
+
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.05)
+            return value.upper()
+
+        results = await asyncio.gather(
+            flight.do("paris", lambda: work("paris")),
+            flight.do("paris", lambda: work("paris")),
+            flight.do("paris", lambda: work("paris")),
+            flight.do("rome", lambda: work("rome")),
+        )
+        return results, calls, flight.stats()
+
+    results, calls, stats = asyncio.run(scenario())
+    assert [result for result, _ in results] == ["PARIS", "PARIS", "PARIS", "ROME"]
+    assert [shared for _, shared in results] == [False, True, True, False]
+    assert sorted(calls) == ["paris", "rome"]
+    assert stats == {"executions": 2, "coalesced": 2, "in_flight": 0}
+
+
+def test_cancelled_caller_does_not_abort_shared_execution():
+    """A follower keeps its result even if the leader's caller goes away."""
+
+    async def scenario():
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "plan"
+
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()) == ("plan", True)
+
+
+def test_identical_queries_are_coalesced(monkeypatch):
+    """Concurrent identical /query bodies trigger one agent run."""
+    runs = []
+
+    async def fake_run(query, _timer):
+        runs.append(query.query)
+        await asyncio.sleep(0.1)
+        return "Shared plan"
+
+    monkeypatch.setattr(main, "_run_travel_plan", fake_run)
+    monkeypatch.setattr(main, "response_cache", ResponseCache(enabled=False))
+    monkeypatch.setattr(main, "single_flight", SingleFlight())
+
+    async def burst():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://t"
+        ) as client:
+            responses = await asyncio.gather(
+                *(
+                    client.post("/query", json={"query": "Plan a trip to Paris"})
+                    for _ in range(5)
+                )
+            )
+            stats = (await client.get("/coalescing/stats")).json()
+        return responses, stats
+
+    responses, stats = asyncio.run(burst())
+    assert all(r.json()["answer"] == "Shared plan" for r in responses)
+    assert len(runs) == 1
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == 4
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for the routable point (snap) cache and its use by the distance code.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tests.ors_stub import OrsStubServer
+from tools.distance_calculator_tool import DistanceCalculatorTool
+from utils.airport_distance_calculator import AirportDistanceCalculator
+from utils.airport_store import get_airport_store
+from utils.route_cache import RouteCache
+from utils.snap_cache import (
+    ROUTE_RADIUS_M,
+    SNAPPED_RADIUS_M,
+    SnapCache,
+    SnapClient,
+    route_endpoints,
+    seed_airports,
+)
+
+CDG = (49.0097, 2.5479)
+CDG_ROAD = (49.0035, 2.5660)
+LOUVRE = (48.8606, 2.3376)
+ISLAND = (48.8500, 2.2000)
+
+
+def _calculator(ors_url, monkeypatch):
+    monkeypatch.setenv("OPENROUTE_BASE_URL", ors_url)
+    calculator = AirportDistanceCalculator(api_key="test-key")
+    calculator.route_cache = RouteCache()
+    calculator.snap_cache = SnapCache(":memory:")
+    return calculator
+
+
+def test_cache_stores_snapped_and_unroutable_points(tmp_path):
+    """Learned points survive a reopen and drive the directions endpoints."""
+    path = tmp_path / "snap.sqlite3"
+    cache = SnapCache(path)
+    cache.learn(CDG, CDG_ROAD)
+    cache.learn(ISLAND, None)
+
+    reopened = SnapCache(path)
+    assert reopened.get((49.00971, 2.54792)) == (CDG_ROAD,)
+    assert reopened.get(ISLAND) == (None,)
+    assert reopened.get(LOUVRE) is None
+    assert route_endpoints(reopened, (CDG, LOUVRE)) == [
+        (CDG_ROAD, SNAPPED_RADIUS_M),
+        (LOUVRE, ROUTE_RADIUS_M),
+    ]
+    assert route_endpoints(reopened, (CDG, ISLAND)) is None
+    assert reopened.stats()["routable"] == 1
+    assert reopened.stats()["unroutable"] == 1
+    assert SnapCache(path, enabled=False).get(CDG) is None
+
+
+def test_offroad_point_is_snapped_once(monkeypatch):
+    """The first 404 costs one widened retry; later routes start on the road."""
+    with OrsStubServer(offroad={CDG: CDG_ROAD}) as ors:
+        calculator = _calculator(ors.url, monkeypatch)
+        first = calculator.calculate_driving_distance(CDG, LOUVRE)
+        calculator.route_cache.clear()
+        second = calculator.calculate_driving_distance(LOUVRE, CDG)
+
+    assert first == second
+    assert not ors.paths("/v2/snap/")
+    # 404 and the widened retry, then one request from the snapped point
+    assert len(ors.paths("/v2/directions/")) == 3
+    assert calculator.snap_cache.get(CDG) == (CDG_ROAD,)
+    assert calculator.snap_cache.get(LOUVRE) == (LOUVRE,)
+
+
+def test_unroutable_point_skips_the_request(monkeypatch):
+    """A point with no road is estimated offline, without asking ORS again."""
+    with OrsStubServer(offroad={ISLAND: None}) as ors:
+        calculator = _calculator(ors.url, monkeypatch)
+        first = calculator.calculate_driving_distance(ISLAND, LOUVRE)
+        calculator.route_cache.clear()
+        second = calculator.calculate_driving_distance(LOUVRE, ISLAND)
+
+    assert (
+        first
+        == second
+        == calculator.road_estimator.estimate(ISLAND, LOUVRE).distance_km
+    )
+    # 404 and the widened retry name the island; the reverse trip is skipped
+    assert len(ors.paths("/v2/directions/")) == 2
+    assert calculator.snap_cache.get(ISLAND) == (None,)
+    assert calculator.snap_cache.get(LOUVRE) is None
+
+
+def test_tool_routes_from_snapped_points(monkeypatch):
+    """The LLM tool uses learned points and gives up early on unroutable ones."""
+    with OrsStubServer(offroad={CDG: CDG_ROAD, ISLAND: None}) as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        tool_container = DistanceCalculatorTool(openroute_api_key="test-key")
+        tool_container.route_cache = RouteCache()
+        tool_container.snap_cache = SnapCache(":memory:")
+        tool_container.snap_cache.learn_many([(CDG, CDG_ROAD), (ISLAND, None)])
+
+        routed = tool_container._calculate_driving_distance(CDG, LOUVRE)
+        unroutable = tool_container._calculate_driving_distance(ISLAND, LOUVRE)
+
+    assert routed is not None and unroutable is None
+    assert len(ors.paths("/v2/directions/")) == 1
+
+
+def test_tool_learns_from_its_own_404_retry(monkeypatch):
+    """The LLM tool retries a 404 once and remembers what it learned."""
+    with OrsStubServer(offroad={CDG: CDG_ROAD, ISLAND: None}) as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        tool_container = DistanceCalculatorTool(openroute_api_key="test-key")
+        tool_container.route_cache = RouteCache()
+        tool_container.snap_cache = SnapCache(":memory:")
+
+        routed = tool_container._calculate_driving_distance(CDG, LOUVRE)
+        unroutable = asyncio.run(
+            tool_container._acalculate_driving_distance(LOUVRE, ISLAND)
+        )
+        tool_container.route_cache.clear()
+        again = asyncio.run(tool_container._acalculate_driving_distance(LOUVRE, CDG))
+        skipped = tool_container._calculate_driving_distance(ISLAND, LOUVRE)
+
+    assert routed == again and unroutable is None and skipped is None
+    assert tool_container.snap_cache.get(CDG) == (CDG_ROAD,)
+    assert tool_container.snap_cache.get(ISLAND) == (None,)
+    # two for each first-time 404, one from the snapped points, none when skipped
+    assert len(ors.paths("/v2/directions/")) == 5
+    assert not ors.paths("/v2/snap/")
+
+
+class ThreadRecordingSnapCache(SnapCache):
+    """SnapCache that records which threads touch SQLite."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.db_threads = []
+
+    def get(self, point):
+        self.db_threads.append(threading.get_ident())
+        return super().get(point)
+
+    def learn_many(self, pairs):
+        self.db_threads.append(threading.get_ident())
+        super().learn_many(pairs)
+
+
+def test_async_tool_keeps_snap_cache_off_the_event_loop(monkeypatch):
+    """Lookups and learn-writes of the async tool run on the executor."""
+    with OrsStubServer(offroad={CDG: CDG_ROAD, ISLAND: None}) as ors:
+        monkeypatch.setenv("OPENROUTE_BASE_URL", ors.url)
+        tool_container = DistanceCalculatorTool(openroute_api_key="test-key")
+        tool_container.route_cache = RouteCache()
+        tool_container.snap_cache = ThreadRecordingSnapCache(":memory:")
+
+        async def scenario():
+            routed = await tool_container._acalculate_driving_distance(CDG, LOUVRE)
+            failed = await tool_container._acalculate_driving_distance(LOUVRE, ISLAND)
+            return routed, failed, threading.get_ident()
+
+        routed, failed, loop_thread = asyncio.run(scenario())
+
+    db_threads = list(tool_container.snap_cache.db_threads)
+    assert routed is not None and failed is None
+    # two lookups and one learn per request
+    assert len(db_threads) == 6 and loop_thread not in db_threads
+    assert tool_container.snap_cache.get(ISLAND) == (None,)
+
+
+def test_seed_airports_snaps_unknown_airports_in_batches():
+    """Seeding asks only about airports the cache does not know yet."""
+    with OrsStubServer() as ors:
+        cache = SnapCache(":memory:")
+        counts = seed_airports(cache, SnapClient("test-key", ors.url), batch_size=5000)
+        again = seed_airports(cache, SnapClient("test-key", ors.url))
+
+    assert counts["snapped"] > 5000 and not counts["failed"]
+    assert again == {"snapped": 0, "unroutable": 0, "failed": 0}
+    assert len(ors.paths("/v2/snap/")) == -(-counts["snapped"] // 5000)
+    store = get_airport_store()
+    cdg = (store.value("CDG", "lat"), store.value("CDG", "lon"))
+    assert cache.get(cdg) == (cdg,)
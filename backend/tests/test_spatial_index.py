@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the airport spatial index and its use in nearest-airport searches.
+"""
+
+import math
+import os
+import random
+import sys
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tests.ors_stub import OrsStubServer
+from utils.airport_distance_calculator import AirportDistanceCalculator
+from utils.airport_index import get_airport_index
+from utils.route_cache import RouteCache
+from utils.spatial_index import EARTH_RADIUS_KM, get_spatial_index
+
+
+def _great_circle_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def test_nearest_matches_brute_force():
+    """The index returns the same k nearest airports as a full haversine scan."""
+    index = get_spatial_index()
+    airports = {
+        code: info
+        for code, info in get_airport_index().airports.items()
+        if info.get("lat") is not None and info.get("lon") is not None
+    }
+    rng = random.Random(7)
+    for _ in range(20):
+        lat, lon = rng.uniform(-60, 70), rng.uniform(-180, 180)
+        expected = sorted(
+            airports,
+            key=lambda c: _great_circle_km(
+                lat, lon, airports[c]["lat"], airports[c]["lon"]
+            ),
+        )[:5]
+        assert [code for code, _ in index.nearest(lat, lon, k=5)] == expected
+
+
+def test_nearest_respects_radius_and_filter():
+    """Results stay within max_km and only include accepted codes."""
+    index = get_spatial_index()
+    london = (51.5072, -0.1276)
+
+    nearby = index.nearest(*london, k=50, max_km=60)
+    assert nearby and all(distance <= 60 for _, distance in nearby)
+    assert "LCY" in [code for code, _ in nearby]
+
+    filtered = index.nearest(*london, k=2, include=lambda code: code[0] == "L")
+    assert len(filtered) == 2
+    assert all(code.startswith("L") for code, _ in filtered)
+    assert index.nearest(0.0, -30.0, k=3, max_km=10) == []
+
+
+def test_find_nearest_airports_routes_only_top_candidates(monkeypatch):
+    """Road routing is requested for a handful of airports, not the whole table."""
+    calculator = AirportDistanceCalculator(api_key="test-key")
+    calculator.route_cache = RouteCache()
+    monkeypatch.setattr(
+        calculator, "get_coordinates_from_address", lambda _city: (22.5726, 88.3639)
+    )
+
+    with OrsStubServer() as ors:
+        calculator.route_matrix.base_url = ors.url
+        nearest = calculator.find_nearest_airports_to_city("Kolkata")
+
+    assert nearest[0]["code"] == "CCU"
+    assert ors.paths("/v2/matrix/") == ["/v2/matrix/driving-car"]
+    assert not ors.paths("/v2/directions/")
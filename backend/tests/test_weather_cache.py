@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Tests for the stale-while-revalidate weather cache.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from utils.weather_cache import WeatherCache
+from utils.weather_info import WeatherForecastTool
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingFetch:
+    """Fetch function returning a numbered payload per call."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"call": self.calls}
+
+    async def acall(self):
+        return self()
+
+
+def _cache(path=":memory:", clock=None):
+    return WeatherCache(
+        path,
+        ttl_seconds={"weather": 600, "forecast": 3600},
+        stale_seconds={"weather": 3000, "forecast": 0},
+        clock=clock or FakeClock(),
+    )
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_fresh_answers_share_key_by_city_and_units():
+    """Spelling variants of a city hit one entry; units and endpoints do not."""
+    cache = _cache()
+    fetch = CountingFetch()
+
+    assert cache.get_or_fetch("weather", "Paris", "metric", fetch) == {"call": 1}
+    assert cache.get_or_fetch("weather", "  paris ", "metric", fetch) == {"call": 1}
+    assert cache.get_or_fetch("weather", "Paris", "imperial", fetch) == {"call": 2}
+    assert cache.get_or_fetch("forecast", "Paris", "metric", fetch) == {"call": 3}
+    assert cache.stats()["hits"] == 1 and cache.stats()["stored"] == 3
+
+
+def test_stale_answer_is_served_while_one_refresh_runs():
+    """After the TTL the old answer returns at once and is refreshed once."""
+    clock = FakeClock()
+    cache = _cache(clock=clock)
+    fetch = CountingFetch()
+    cache.get_or_fetch("weather", "Rome", "metric", fetch)
+    release = threading.Event()
+
+    def slow_fetch():
+        release.wait(2)
+        return fetch()
+
+    clock.now += 700
+    assert cache.get_or_fetch("weather", "Rome", "metric", slow_fetch) == {"call": 1}
+    assert cache.get_or_fetch("weather", "Rome", "metric", slow_fetch) == {"call": 1}
+    release.set()
+    assert _wait_for(
+        lambda: cache.get_or_fetch("weather", "Rome", "metric", fetch) == {"call": 2}
+    )
+    assert fetch.calls == 2 and cache.stats()["refreshes"] == 1
+
+
+def test_failed_refresh_is_logged_and_keeps_the_stale_answer(caplog):
+    """A background refresh error is logged with its traceback, not printed."""
+    clock = FakeClock()
+    cache = _cache(clock=clock)
+    cache.get_or_fetch("weather", "Lima", "metric", CountingFetch())
+
+    def broken_fetch():
+        raise ConnectionError("upstream down")
+
+    clock.now += 700
+    with caplog.at_level(logging.WARNING, logger="utils.weather_cache"):
+        assert cache.get_or_fetch("weather", "Lima", "metric", broken_fetch) == {
+            "call": 1
+        }
+        assert _wait_for(lambda: caplog.records)
+    record = caplog.records[0]
+    assert record.getMessage().startswith("Weather refresh failed for weather")
+    assert record.exc_info[0] is ConnectionError
+
+
+def test_expired_answers_and_failures_block_and_are_not_cached():
+    """Past the stale window the call waits; empty answers are not stored."""
+    clock = FakeClock()
+    cache = _cache(clock=clock)
+    fetch = CountingFetch()
+    cache.get_or_fetch("forecast", "Oslo", "metric", fetch)
+
+    clock.now += 3601  # forecast has no stale window here
+    assert cache.get_or_fetch("forecast", "Oslo", "metric", fetch) == {"call": 2}
+    assert cache.get_or_fetch("weather", "Atlantis", "metric", dict) == {}
+    assert cache.stats()["stored"] == 1
+
+
+def test_workers_share_answers_and_the_refresh_lease(tmp_path):
+    """A second worker reads the first one's answer and never double-refreshes."""
+    clock = FakeClock()
+    path = tmp_path / "weather.sqlite3"
+    first, second = _cache(path, clock), _cache(path, clock)
+    fetch = CountingFetch()
+    first.get_or_fetch("weather", "Lima", "metric", fetch)
+
+    assert second.get_or_fetch("weather", "Lima", "metric", fetch) == {"call": 1}
+    clock.now += 700
+    first.get_or_fetch("weather", "Lima", "metric", fetch)
+    second.get_or_fetch("weather", "Lima", "metric", fetch)
+    assert _wait_for(lambda: fetch.calls == 2)
+    assert first.stats()["refreshes"] + second.stats()["refreshes"] == 1
+
+
+class ThreadRecordingCache(WeatherCache):
+    """WeatherCache that records which threads touch SQLite."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.db_threads = []
+
+    def _load(self, key, ttl):
+        self.db_threads.append(threading.get_ident())
+        return super()._load(key, ttl)
+
+    def _claim_refresh(self, key, fetched_at):
+        self.db_threads.append(threading.get_ident())
+        return super()._claim_refresh(key, fetched_at)
+
+    def _store(self, key, payload):
+        self.db_threads.append(threading.get_ident())
+        super()._store(key, payload)
+
+
+def test_async_path_keeps_sqlite_off_the_event_loop():
+    """Miss, fresh hit and stale refresh never run SQLite on the loop thread."""
+    clock = FakeClock()
+    cache = ThreadRecordingCache(
+        ":memory:",
+        ttl_seconds={"weather": 600},
+        stale_seconds={"weather": 3000},
+        clock=clock,
+    )
+    fetch = CountingFetch()
+
+    async def scenario():
+        await cache.aget_or_fetch("weather", "Lima", "metric", fetch.acall)
+        await cache.aget_or_fetch("weather", "Lima", "metric", fetch.acall)
+        clock.now += 700
+        await cache.aget_or_fetch("weather", "Lima", "metric", fetch.acall)
+        await asyncio.gather(*cache._tasks)  # pylint: disable=protected-access
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+
+    assert fetch.calls == 2 and cache.stats()["refreshes"] == 1
+    # miss: load + store; stale: load + claim; refresh: store
+    assert len(cache.db_threads) == 5
+    assert loop_thread not in cache.db_threads
+
+
+def test_async_stale_refresh_and_weather_service(monkeypatch):
+    """The async path refreshes in a task; the service fetches each city once."""
+    clock = FakeClock()
+    cache = _cache(clock=clock)
+    fetch = CountingFetch()
+
+    async def scenario():
+        await cache.aget_or_fetch("weather", "Kyiv", "metric", fetch.acall)
+        clock.now += 700
+        stale = await cache.aget_or_fetch("weather", "Kyiv", "metric", fetch.acall)
+        await asyncio.sleep(0.05)
+        return stale
+
+    assert asyncio.run(scenario()) == {"call": 1}
+    assert fetch.calls == 2
+
+    service = WeatherForecastTool(api_key="test-key", base_url="http://unused")
+    service.cache = _cache()
+    monkeypatch.setattr(
+        service, "_fetch", lambda endpoint, place, params: {"name": place}
+    )
+    monkeypatch.setattr(service, "_afetch", None)
+    assert service.get_current_weather("Kyiv") == {"name": "Kyiv"}
+    assert asyncio.run(service.aget_current_weather("kyiv")) == {"name": "Kyiv"}
+
+
+def test_current_weather_and_forecast_are_fetched_in_celsius(monkeypatch):
+    """Both endpoints ask for metric units, which the tools print as °C."""
+    service = WeatherForecastTool(api_key="test-key", base_url="http://unused")
+    service.cache = _cache()
+    requested = {}
+
+    def fetch(endpoint, place, params):
+        requested[endpoint] = params["units"]
+        return {"name": place}
+
+    monkeypatch.setattr(service, "_fetch", fetch)
+    service.get_current_weather("Oslo")
+    service.get_forecast_weather("Oslo")
+    assert requested == {"weather": "metric", "forecast": "metric"}
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the weather tools: the combined multi-city tool and daily forecasts.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add parent directory to path for local imports
+# pylint: disable=wrong-import-position
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error,wrong-import-position
+from tools.weather_info_tool import MAX_WEATHER_CITIES, WeatherInfoTool
+from utils.weather_info import daily_forecast
+
+DELAY = 0.2
+
+
+def _forecast(city, temp):
+    return {
+        "city": {"name": city},
+        "list": [
+            {
+                "dt_txt": f"2026-10-17 {hour:02d}:00:00",
+                "main": {
+                    "temp": temp + i,
+                    "feels_like": temp + i - 1,
+                    "humidity": 60,
+                },
+                "weather": [{"description": "light rain" if i else "clear sky"}],
+                "wind": {"speed": 3.5},
+            }
+            for i, hour in enumerate((12, 15, 18))
+        ],
+    }
+
+
+FORECASTS = {"Paris": _forecast("Paris", 14), "Rome": _forecast("Rome", 21)}
+
+
+def _weather_tool(monkeypatch):
+    tool_container = WeatherInfoTool(api_key="test-key", base_url="http://unused")
+    service = tool_container.weather_service
+    fetched = []
+
+    def forecast(city):
+        fetched.append(city)
+        time.sleep(DELAY)
+        return FORECASTS.get(city, {})
+
+    async def aforecast(city):
+        fetched.append(city)
+        await asyncio.sleep(DELAY)
+        return FORECASTS.get(city, {})
+
+    def no_current(_city):
+        raise AssertionError("current weather must come from the forecast")
+
+    monkeypatch.setattr(service, "get_forecast_weather", forecast)
+    monkeypatch.setattr(service, "aget_forecast_weather", aforecast)
+    monkeypatch.setattr(service, "get_current_weather", no_current)
+    monkeypatch.setattr(service, "aget_current_weather", no_current)
+    tools = {tool.name: tool for tool in tool_container.weather_tool_list}
+    return tools["get_weather_for_cities"], fetched
+
+
+def test_one_forecast_request_per_city_fetched_concurrently(monkeypatch):
+    """Each city costs one forecast call, all cities in one round-trip."""
+    tool, fetched = _weather_tool(monkeypatch)
+    cities = ["Paris", "Rome", "Paris", "Atlantis"]
+
+    started = time.perf_counter()
+    result = tool.invoke({"cities": cities})
+    assert time.perf_counter() - started < 1.8 * DELAY
+    started = time.perf_counter()
+    async_result = asyncio.run(tool.ainvoke({"cities": cities}))
+    assert time.perf_counter() - started < 1.8 * DELAY
+
+    assert async_result == result
+    assert sorted(fetched) == ["Atlantis", "Atlantis", "Paris", "Paris", "Rome", "Rome"]
+    paris, rome, atlantis = result.split("\n\n")
+    assert paris.startswith(
+        "Weather in Paris now (forecast for 2026-10-17 12:00:00 UTC): "
+        "14°C, feels like 13°C, clear sky"
+    )
+    assert "Weather forecast for Paris (daily, local dates):" in paris
+    assert rome.startswith("Weather in Rome now") and "21°C" in rome
+    assert atlantis == "Could not fetch weather for Atlantis"
+
+
+def test_city_list_is_bounded(monkeypatch):
+    """Empty and oversized city lists are rejected without fetching."""
+    tool, fetched = _weather_tool(monkeypatch)
+
+    assert tool.invoke({"cities": []}).startswith("cities must list")
+    too_many = [f"City {i}" for i in range(MAX_WEATHER_CITIES + 1)]
+    assert tool.invoke({"cities": too_many}).startswith("cities must list")
+    assert not fetched
+
+
+def _slot(timestamp, temp, description, rain=0.0, pop=0.0):
+    slot = {
+        "dt": timestamp,
+        "main": {"temp": temp, "temp_min": temp - 1, "temp_max": temp + 1},
+        "weather": [{"description": description}],
+        "pop": pop,
+    }
+    if rain:
+        slot["rain"] = {"3h": rain}
+    return slot
+
+
+def test_daily_forecast_aggregates_local_days():
+    """Slots fold into local days with min/max, rain and the usual condition."""
+    # 2026-10-16 21:00 UTC onwards, every 3 hours, for a city at UTC+3
+    start = 1792184400
+    slots = [
+        _slot(start + i * 10800, 10 + i % 8, "rain" if i % 8 < 3 else "clouds")
+        for i in range(40)
+    ]
+    slots[1]["rain"] = {"3h": 1.25}
+    slots[2]["pop"] = 0.6
+    data = {"city": {"timezone": 3 * 3600}, "list": slots}
+
+    days = daily_forecast(data, days=3)
+
+    assert [day.date for day in days] == ["2026-10-17", "2026-10-18", "2026-10-19"]
+    assert (days[0].temp_min, days[0].temp_max) == (9, 18)
+    assert days[0].condition == "clouds"
+    assert days[0].precipitation_mm == 1.2 and days[0].precipitation_chance == 0.6
+    assert days[1].precipitation_mm == 0 and days[1].precipitation_chance == 0
+    assert len(daily_forecast(data, days=10)) == 5
+
+
+def test_forecast_output_is_one_line_per_day(monkeypatch):
+    """The forecast tool prints a compact line per day, not per 3-hour slot."""
+    monkeypatch.setattr("tools.weather_info_tool.forecast_days", lambda: 2)
+    start = 1792195200  # 2026-10-17 00:00 UTC
+    slots = [_slot(start + i * 10800, 15, "clear sky") for i in range(40)]
+    slots[3] = _slot(start + 3 * 10800, 12, "clear sky", rain=2.0, pop=0.8)
+
+    text = WeatherInfoTool._format_forecast("Oslo", {"list": slots})
+
+    assert text.splitlines() == [
+        "Weather forecast for Oslo (daily, local dates):",
+        "Sat 2026-10-17: 11-16°C, clear sky, 2 mm (80% chance)",
+        "Sun 2026-10-18: 14-16°C, clear sky",
+    ]
+    assert WeatherInfoTool._format_forecast("Oslo", {}) == (
+        "Could not fetch forecast for Oslo"
+    )
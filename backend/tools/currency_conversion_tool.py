@@ -6,7 +6,7 @@ for converting currencies using external currency conversion APIs.
 
 from typing import List
 
-from langchain.tools import tool
+from langchain_core.tools import StructuredTool
 
 from utils.currency_convertor import CurrencyConverter
 
@@ -30,9 +30,19 @@ class CurrencyConverterTool:  # pylint: disable=too-few-public-methods
     def _setup_tools(self) -> List:
         """Setup all tools for the currency converter tool"""
 
-        @tool
         def convert_currency(amount: float, from_currency: str, to_currency: str):
             """Convert amount from one currency to another"""
             return self.currency_service.convert(amount, from_currency, to_currency)
 
-        return [convert_currency]
+        async def aconvert_currency(
+            amount: float, from_currency: str, to_currency: str
+        ):
+            return await self.currency_service.aconvert(
+                amount, from_currency, to_currency
+            )
+
+        return [
+            StructuredTool.from_function(
+                func=convert_currency, coroutine=aconvert_currency
+            )
+        ]
@@ -5,11 +5,35 @@ for calculating distances between airports, cities, and attractions using
 OpenRouteService API and airport data.
 """
 
-from typing import List
+import asyncio
+from typing import List, Optional, Sequence, Tuple
 
+import httpx
 import requests
-from airportsdata import load as load_airports
-from langchain.tools import tool
+from langchain_core.tools import StructuredTool
+
+from utils.airport_index import AIRPORT_TYPE_FILTERS, get_airport_index
+from utils.executor import map_concurrently, run_blocking
+from utils.geocode_cache import geocode_concurrency, get_geocode_cache
+from utils.http_client import get_async_client, get_session
+from utils.road_estimator import ROUTING_MODES, get_road_estimator
+from utils.route_cache import get_route_cache
+from utils.route_matrix import RouteMatrix, RouteMatrixClient, openroute_base_url
+from utils.snap_cache import (
+    get_snap_cache,
+    learn_from_failed_route,
+    learn_from_route,
+    route_endpoints,
+    widen_unknown,
+)
+from utils.spatial_index import get_spatial_index
+
+GEOCODE_PATH = "/geocode/search"
+DIRECTIONS_PATH = "/v2/directions/driving-car"
+# Nearest airports by great-circle distance that are refined by road routing
+NEAREST_AIRPORT_CANDIDATES = 3
+# Most places one itinerary distance call accepts
+MAX_ITINERARY_PLACES = 25
 
 
 class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
@@ -20,7 +44,12 @@ class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
 
     Attributes:
         openroute_api_key (str): API key for OpenRouteService
-        airports_data (dict): IATA airport data
+        geocode_cache (GeocodeCache): Shared persistent geocoding cache
+        route_cache (RouteCache): Shared driving route cache
+        snap_cache (SnapCache): Shared routable (snapped) point cache
+        road_estimator (RoadEstimator): Offline distance estimates for "estimate" mode
+        airport_index (AirportIndex): Shared city to IATA code index
+        airports_data (AirportStore): Shared read-only IATA airport data
         distance_tool_list (List): List of available distance calculation tools
     """
 
@@ -28,23 +57,88 @@ class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
         if not openroute_api_key:
             raise ValueError("OpenRouteService API key not provided.")
         self.openroute_api_key = openroute_api_key
-        self.airports_data = load_airports("IATA")
+        self.route_matrix = RouteMatrixClient(openroute_api_key)
+        self.geocode_cache = get_geocode_cache()
+        self.route_cache = get_route_cache()
+        self.snap_cache = get_snap_cache()
+        self.road_estimator = get_road_estimator()
+        self.airport_index = get_airport_index()
+        self.airports_data = self.airport_index.airports
         self.distance_tool_list = self._setup_tools()
 
+    @staticmethod
+    def _parse_geocode(data: dict) -> tuple:
+        if data.get("features"):
+            coords = data["features"][0]["geometry"]["coordinates"]
+            return (coords[1], coords[0])  # Return as (lat, lon)
+        return None
+
+    @staticmethod
+    def _parse_route_distance(data: dict) -> float:
+        # distance in meters, convert to kilometers
+        distance_km = (
+            data["features"][0]["properties"]["segments"][0]["distance"] / 1000
+        )
+        return round(distance_km, 2)
+
+    def _remember_route(
+        self, start_coords: tuple, end_coords: tuple, data: dict
+    ) -> float:
+        distance = self._parse_route_distance(data)
+        learn_from_route(self.snap_cache, (start_coords, end_coords), data)
+        segment = data["features"][0]["properties"]["segments"][0]
+        self.route_cache.store(
+            start_coords, end_coords, distance, segment.get("duration")
+        )
+        return distance
+
+    @staticmethod
+    def _route_body(endpoints: Sequence[Tuple[tuple, int]]) -> dict:
+        """Directions request body for (point, search radius) endpoints"""
+        return {
+            "coordinates": [[lon, lat] for (lat, lon), _ in endpoints],
+            "radiuses": [radius for _, radius in endpoints],
+        }
+
+    def _post_route(self, endpoints: Sequence[Tuple[tuple, int]]):
+        return get_session().post(
+            f"{openroute_base_url()}{DIRECTIONS_PATH}",
+            json=self._route_body(endpoints),
+            headers={"Authorization": self.openroute_api_key},
+        )
+
+    async def _apost_route(self, endpoints: Sequence[Tuple[tuple, int]]):
+        return await get_async_client().post(
+            f"{openroute_base_url()}{DIRECTIONS_PATH}",
+            json=self._route_body(endpoints),
+            headers={"Authorization": self.openroute_api_key},
+        )
+
+    def _geocode(self, address: str) -> tuple:
+        response = get_session().get(
+            f"{openroute_base_url()}{GEOCODE_PATH}",
+            headers={"Authorization": self.openroute_api_key},
+            params={"text": address, "size": 1},
+        )
+        # Errors raise so that they are not cached as "address not found"
+        response.raise_for_status()
+        return self._parse_geocode(response.json())
+
+    async def _ageocode(self, address: str) -> tuple:
+        response = await get_async_client().get(
+            f"{openroute_base_url()}{GEOCODE_PATH}",
+            headers={"Authorization": self.openroute_api_key},
+            params={"text": address, "size": 1},
+        )
+        response.raise_for_status()
+        return self._parse_geocode(response.json())
+
     def _get_coordinates_from_address(self, address: str) -> tuple:
         """Get coordinates from address using OpenRouteService Geocoding API"""
         try:
-            url = "https://api.openrouteservice.org/geocode/search"
-            headers = {"Authorization": self.openroute_api_key}
-            params = {"text": address, "size": 1}
-
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("features"):
-                    coords = data["features"][0]["geometry"]["coordinates"]
-                    return (coords[1], coords[0])  # Return as (lat, lon)
-            return None
+            return self.geocode_cache.get_or_fetch(
+                address, lambda: self._geocode(address)
+            )
         except requests.exceptions.RequestException as e:
             print(f"Request error getting coordinates for {address}: {e}")
             return None
@@ -52,9 +146,48 @@ class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
             print(f"Data processing error for {address}: {e}")
             return None
 
+    async def _aget_coordinates_from_address(self, address: str) -> tuple:
+        """Async variant of _get_coordinates_from_address"""
+        try:
+            return await self.geocode_cache.aget_or_fetch(
+                address, lambda: self._ageocode(address)
+            )
+        except httpx.HTTPError as e:
+            print(f"Request error getting coordinates for {address}: {e}")
+            return None
+        except (KeyError, ValueError, IndexError) as e:
+            print(f"Data processing error for {address}: {e}")
+            return None
+
+    def _geocode_all(self, addresses: Sequence[str]) -> List[Optional[tuple]]:
+        """Geocode several addresses concurrently, each distinct one once"""
+        unique = list(dict.fromkeys(addresses))
+        coords = dict(
+            zip(
+                unique,
+                map_concurrently(
+                    self._get_coordinates_from_address, unique, geocode_concurrency()
+                ),
+            )
+        )
+        return [coords[address] for address in addresses]
+
+    async def _ageocode_all(self, addresses: Sequence[str]) -> List[Optional[tuple]]:
+        """Async variant of _geocode_all"""
+        semaphore = asyncio.Semaphore(geocode_concurrency())
+
+        async def geocode(address: str) -> Optional[tuple]:
+            async with semaphore:
+                return await self._aget_coordinates_from_address(address)
+
+        unique = list(dict.fromkeys(addresses))
+        coords = dict(zip(unique, await asyncio.gather(*map(geocode, unique))))
+        return [coords[address] for address in addresses]
+
     def _get_airport_coordinates(self, airport_code: str) -> tuple:
-        """Get airport coordinates from IATA code"""
+        """Get airport coordinates from IATA code (or a city's main airport)"""
         try:
+            airport_code = self.airport_index.resolve(airport_code)
             if airport_code in self.airports_data:
                 airport_info = self.airports_data[airport_code]
                 lat = airport_info.get("lat")
@@ -69,24 +202,33 @@ class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
     def _calculate_driving_distance(
         self, start_coords: tuple, end_coords: tuple
     ) -> float:
-        """Calculate driving distance using OpenRouteService"""
+        """
+        Calculate driving distance using OpenRouteService
+
+        Routing starts from the snapped points learned for the endpoints. A
+        404 is retried once with a wider search for the points not seen
+        before, as AirportDistanceCalculator does.
+        """
+        cached = self.route_cache.get(start_coords, end_coords, estimates=False)
+        if cached is not None:
+            return cached.distance_km
+        points = (start_coords, end_coords)
+        endpoints = route_endpoints(self.snap_cache, points)
+        if endpoints is None:
+            return None  # an endpoint is known to have no road nearby
         try:
-            url = "https://api.openrouteservice.org/v2/directions/driving-car"
-            headers = {"Authorization": self.openroute_api_key}
-            body = {
-                "coordinates": [
-                    [start_coords[1], start_coords[0]],  # [lon, lat]
-                    [end_coords[1], end_coords[0]],
-                ]
-            }
-            response = requests.post(url, json=body, headers=headers, timeout=10)
+            response = self._post_route(endpoints)
+            if response.status_code == 404:
+                endpoints = widen_unknown(endpoints)
+                if endpoints is None:
+                    return None
+                response = self._post_route(endpoints)
+                if response.status_code != 200:
+                    learn_from_failed_route(
+                        self.snap_cache, points, endpoints, response
+                    )
             if response.status_code == 200:
-                data = response.json()
-                # distance in meters, convert to kilometers
-                distance_km = (
-                    data["features"][0]["properties"]["segments"][0]["distance"] / 1000
-                )
-                return round(distance_km, 2)
+                return self._remember_route(start_coords, end_coords, response.json())
             return None
         except requests.exceptions.RequestException as e:
             print(f"Request error calculating distance: {e}")
@@ -95,12 +237,249 @@ class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
             print(f"Data processing error calculating distance: {e}")
             return None
 
+    async def _acalculate_driving_distance(
+        self, start_coords: tuple, end_coords: tuple
+    ) -> float:
+        """
+        Async variant of _calculate_driving_distance
+
+        Snap cache reads and writes are SQLite calls that may wait on another
+        worker's lock, so they run on the shared executor.
+        """
+        cached = self.route_cache.get(start_coords, end_coords, estimates=False)
+        if cached is not None:
+            return cached.distance_km
+        points = (start_coords, end_coords)
+        endpoints = await run_blocking(route_endpoints, self.snap_cache, points)
+        if endpoints is None:
+            return None  # an endpoint is known to have no road nearby
+        try:
+            response = await self._apost_route(endpoints)
+            if response.status_code == 404:
+                endpoints = widen_unknown(endpoints)
+                if endpoints is None:
+                    return None
+                response = await self._apost_route(endpoints)
+                if response.status_code != 200:
+                    await run_blocking(
+                        learn_from_failed_route,
+                        self.snap_cache,
+                        points,
+                        endpoints,
+                        response,
+                    )
+            if response.status_code == 200:
+                return await run_blocking(
+                    self._remember_route, start_coords, end_coords, response.json()
+                )
+            return None
+        except httpx.HTTPError as e:
+            print(f"Request error calculating distance: {e}")
+            return None
+        except (KeyError, ValueError, IndexError) as e:
+            print(f"Data processing error calculating distance: {e}")
+            return None
+
+    def _driving_route(self, start_coords: tuple, end_coords: tuple, mode: str):
+        """(distance km, duration s, estimated) for a pair, routed or offline"""
+        if mode == "estimate":
+            return (
+                *self.road_estimator.offline_route(
+                    start_coords, end_coords, self.route_cache
+                ),
+                True,
+            )
+        return self._calculate_driving_distance(start_coords, end_coords), None, False
+
+    async def _adriving_route(self, start_coords: tuple, end_coords: tuple, mode: str):
+        """Async variant of _driving_route"""
+        if mode == "estimate":
+            return self._driving_route(start_coords, end_coords, mode)
+        distance = await self._acalculate_driving_distance(start_coords, end_coords)
+        return distance, None, False
+
+    @staticmethod
+    def _format_travel_time(distance: float, duration_s: Optional[float] = None) -> str:
+        if duration_s is None:
+            # Estimate travel time (assuming average speed of 50 km/h)
+            duration_s = distance / 50 * 3600
+        hours, minutes = divmod(int(duration_s // 60), 60)
+        return f"{hours}h {minutes}m"
+
+    def _describe_drive(self, route: tuple) -> str:
+        distance, duration_s, estimated = route
+        label = "offline estimate, " if estimated else ""
+        return (
+            f"{distance} km ({label}approximately "
+            f"{self._format_travel_time(distance, duration_s)} by car)"
+        )
+
+    def _airport_name(self, airport_code: str) -> str:
+        return self.airports_data.get(airport_code, {}).get("name", airport_code)
+
+    def _format_airport_to_attraction(
+        self, airport_code: str, attraction_address: str, route: tuple
+    ) -> str:
+        if route[0] is not None:
+            return (
+                f"Distance from {self._airport_name(airport_code)} ({airport_code}) "
+                f"to {attraction_address}: {self._describe_drive(route)}"
+            )
+        return (
+            f"Could not calculate distance from {airport_code} to {attraction_address}"
+        )
+
+    def _format_between_places(self, place1: str, place2: str, route: tuple) -> str:
+        if route[0] is not None:
+            return f"Distance from {place1} to {place2}: {self._describe_drive(route)}"
+        return f"Could not calculate distance between {place1} and {place2}"
+
+    def _format_itinerary(self, places: Sequence[str], routes: List[tuple]) -> str:
+        lines = [f"Driving distances through {len(places)} places:"]
+        for number, (start, end, route) in enumerate(
+            zip(places, places[1:], routes), start=1
+        ):
+            if route[0] is not None:
+                lines.append(
+                    f"{number}. {start} to {end}: {self._describe_drive(route)}"
+                )
+            else:
+                lines.append(f"{number}. {start} to {end}: could not calculate")
+        routed = [route for route in routes if route[0] is not None]
+        if len(routed) < len(routes):
+            lines.append(
+                f"Total unavailable: {len(routes) - len(routed)} leg(s) "
+                "could not be routed"
+            )
+            return "\n".join(lines)
+        total_km = round(sum(distance for distance, _, _ in routed), 2)
+        total_s = sum(
+            duration if duration is not None else distance / 50 * 3600
+            for distance, duration, _ in routed
+        )
+        estimated = any(route[2] for route in routed)
+        lines.append(f"Total: {self._describe_drive((total_km, total_s, estimated))}")
+        return "\n".join(lines)
+
+    def _nearest_candidates(
+        self, city_coords: tuple, airport_type: str
+    ) -> List[Tuple[str, float]]:
+        """Nearest airports of a type by great-circle distance, from the whole table"""
+        return get_spatial_index().nearest(
+            *city_coords,
+            k=NEAREST_AIRPORT_CANDIDATES,
+            include=lambda code: self.airport_index.type_matches(code, airport_type),
+        )
+
+    def _cached_road_distances(
+        self, city_coords: tuple, airport_coords: List[tuple]
+    ) -> Tuple[List[Optional[float]], List[int]]:
+        """Road distances known to the route cache, and the indices still missing"""
+        cached = [
+            self.route_cache.get(city_coords, coords, estimates=False)
+            for coords in airport_coords
+        ]
+        distances = [None if route is None else route.distance_km for route in cached]
+        return distances, [i for i, route in enumerate(cached) if route is None]
+
+    def _merge_matrix(
+        self,
+        city_coords: tuple,
+        airport_coords: List[tuple],
+        distances: List[Optional[float]],
+        missing: List[int],
+        matrix: Optional[RouteMatrix],
+    ) -> List[Optional[float]]:
+        """Fill the missing distances from a matrix over them, caching routes"""
+        for column, i in enumerate(missing if matrix else []):
+            distance = matrix.distances_km[0][column]
+            if distance is not None:
+                self.route_cache.store(
+                    city_coords,
+                    airport_coords[i],
+                    distance,
+                    matrix.durations_s[0][column],
+                )
+            distances[i] = distance
+        return distances
+
+    def _road_distances(
+        self, city_coords: tuple, airport_coords: List[tuple]
+    ) -> List[Optional[float]]:
+        """Road distances to several airports; only uncached ones are routed"""
+        distances, missing = self._cached_road_distances(city_coords, airport_coords)
+        if not missing:
+            return distances
+        matrix = self.route_matrix.matrix(
+            [city_coords], [airport_coords[i] for i in missing]
+        )
+        return self._merge_matrix(
+            city_coords, airport_coords, distances, missing, matrix
+        )
+
+    async def _aroad_distances(
+        self, city_coords: tuple, airport_coords: List[tuple]
+    ) -> List[Optional[float]]:
+        """Async variant of _road_distances"""
+        distances, missing = self._cached_road_distances(city_coords, airport_coords)
+        if not missing:
+            return distances
+        matrix = await self.route_matrix.amatrix(
+            [city_coords], [airport_coords[i] for i in missing]
+        )
+        return self._merge_matrix(
+            city_coords, airport_coords, distances, missing, matrix
+        )
+
+    @staticmethod
+    def _rank_by_road(
+        candidates: List[Tuple[str, float]], road_distances: List[Optional[float]]
+    ) -> List[Tuple[str, float, Optional[float]]]:
+        # Routed airports sort by road distance; unroutable ones by straight line
+        ranked = [
+            (code, straight_km, road_km)
+            for (code, straight_km), road_km in zip(candidates, road_distances)
+        ]
+        ranked.sort(key=lambda item: item[2] if item[2] is not None else item[1])
+        return ranked
+
+    def _format_nearest_airport(
+        self,
+        city_name: str,
+        airport_type: str,
+        ranked: List[Tuple[str, float, Optional[float]]],
+    ) -> str:
+        label = "" if airport_type == "any" else f"{airport_type} "
+        if not ranked:
+            return f"Could not find a nearby {label}airport to {city_name}"
+
+        code, straight_km, road_km = ranked[0]
+        if road_km is not None:
+            distance = (
+                f"{road_km} km by road (approximately "
+                f"{self._format_travel_time(road_km)} by car), "
+                f"{straight_km} km straight-line"
+            )
+        else:
+            distance = f"{straight_km} km straight-line (road distance unavailable)"
+        lines = [
+            f"Nearest {label}airport to {city_name}: "
+            f"{self._airport_name(code)} ({code}) - {distance}"
+        ]
+        if len(ranked) > 1:
+            others = ", ".join(
+                f"{self._airport_name(other)} ({other}) "
+                f"{other_road if other_road is not None else other_straight} km"
+                for other, other_straight, other_road in ranked[1:]
+            )
+            lines.append(f"Other nearby airports: {others}")
+        return "\n".join(lines)
+
     def _setup_tools(self) -> List:
         """Setup all tools for distance calculation"""
 
-        @tool
         def calculate_airport_to_attraction_distance(
-            airport_code: str, attraction_address: str
+            airport_code: str, attraction_address: str, mode: str = "exact"
         ) -> str:
             """
             Calculate driving distance from airport to attraction/place.
@@ -108,10 +487,14 @@ class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
             Args:
                 airport_code (str): IATA airport code (e.g., 'JFK', 'LHR', 'DEL')
                 attraction_address (str): Address or name of the attraction/place
+                mode (str): "exact" (default) routes the trip; "estimate"
+                    answers instantly offline when approximate is good enough
 
             Returns:
                 str: Distance information with travel details
             """
+            if mode not in ROUTING_MODES:
+                return f"mode must be one of {', '.join(ROUTING_MODES)}"
             # Get airport coordinates
             airport_coords = self._get_airport_coordinates(airport_code)
             if not airport_coords:
@@ -123,40 +506,50 @@ class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
                 return f"Could not find coordinates for {attraction_address}"
 
             # Calculate distance
-            distance = self._calculate_driving_distance(
-                airport_coords, attraction_coords
+            route = self._driving_route(airport_coords, attraction_coords, mode)
+            return self._format_airport_to_attraction(
+                airport_code, attraction_address, route
             )
-            if distance is not None:
-                # Estimate travel time (assuming average speed of 50 km/h)
-                travel_time_hours = distance / 50
-                hours = int(travel_time_hours)
-                minutes = int((travel_time_hours - hours) * 60)
 
-                airport_name = self.airports_data.get(airport_code, {}).get(
-                    "name", airport_code
-                )
+        async def acalculate_airport_to_attraction_distance(
+            airport_code: str, attraction_address: str, mode: str = "exact"
+        ) -> str:
+            if mode not in ROUTING_MODES:
+                return f"mode must be one of {', '.join(ROUTING_MODES)}"
+            airport_coords = self._get_airport_coordinates(airport_code)
+            if not airport_coords:
+                return f"Could not find coordinates for airport {airport_code}"
 
-                return (
-                    f"Distance from {airport_name} ({airport_code}) to {attraction_address}: "
-                    f"{distance} km (approximately {hours}h {minutes}m by car)"
-                )
-            return f"Could not calculate distance from {airport_code} to {attraction_address}"
+            attraction_coords = await self._aget_coordinates_from_address(
+                attraction_address
+            )
+            if not attraction_coords:
+                return f"Could not find coordinates for {attraction_address}"
+
+            route = await self._adriving_route(airport_coords, attraction_coords, mode)
+            return self._format_airport_to_attraction(
+                airport_code, attraction_address, route
+            )
 
-        @tool
-        def calculate_distance_between_places(place1: str, place2: str) -> str:
+        def calculate_distance_between_places(
+            place1: str, place2: str, mode: str = "exact"
+        ) -> str:
             """
             Calculate driving distance between two places/addresses.
 
             Args:
                 place1 (str): First place/address
                 place2 (str): Second place/address
+                mode (str): "exact" (default) routes the trip; "estimate"
+                    answers instantly offline when approximate is good enough
 
             Returns:
                 str: Distance information between the two places
             """
-            # Get coordinates for both places
-            coords1 = self._get_coordinates_from_address(place1)
-            coords2 = self._get_coordinates_from_address(place2)
+            if mode not in ROUTING_MODES:
+                return f"mode must be one of {', '.join(ROUTING_MODES)}"
+            # Get coordinates for both places at the same time
+            coords1, coords2 = self._geocode_all([place1, place2])
 
             if not coords1:
                 return f"Could not find coordinates for {place1}"
@@ -164,73 +557,147 @@ class DistanceCalculatorTool:  # pylint: disable=too-few-public-methods
                 return f"Could not find coordinates for {place2}"
 
             # Calculate distance
-            distance = self._calculate_driving_distance(coords1, coords2)
-            if distance is not None:
-                # Estimate travel time
-                travel_time_hours = distance / 50
-                hours = int(travel_time_hours)
-                minutes = int((travel_time_hours - hours) * 60)
-
-                return (
-                    f"Distance from {place1} to {place2}: "
-                    f"{distance} km (approximately {hours}h {minutes}m by car)"
+            route = self._driving_route(coords1, coords2, mode)
+            return self._format_between_places(place1, place2, route)
+
+        async def acalculate_distance_between_places(
+            place1: str, place2: str, mode: str = "exact"
+        ) -> str:
+            if mode not in ROUTING_MODES:
+                return f"mode must be one of {', '.join(ROUTING_MODES)}"
+            coords1, coords2 = await self._ageocode_all([place1, place2])
+
+            if not coords1:
+                return f"Could not find coordinates for {place1}"
+            if not coords2:
+                return f"Could not find coordinates for {place2}"
+
+            route = await self._adriving_route(coords1, coords2, mode)
+            return self._format_between_places(place1, place2, route)
+
+        def _itinerary_error(places: List[str], mode: str) -> Optional[str]:
+            if mode not in ROUTING_MODES:
+                return f"mode must be one of {', '.join(ROUTING_MODES)}"
+            if not 2 <= len(places) <= MAX_ITINERARY_PLACES:
+                return f"places must list between 2 and {MAX_ITINERARY_PLACES} places"
+            return None
+
+        def _missing_places(places: List[str], coords: List[Optional[tuple]]) -> str:
+            missing = [place for place, point in zip(places, coords) if not point]
+            return f"Could not find coordinates for {', '.join(missing)}"
+
+        def calculate_distances_between_places(
+            places: List[str], mode: str = "exact"
+        ) -> str:
+            """
+            Calculate driving distances along several places visited in order.
+
+            All places are looked up at once, so this is faster than calling
+            calculate_distance_between_places for each pair.
+
+            Args:
+                places (List[str]): Places/addresses in visiting order (2 to 25)
+                mode (str): "exact" (default) routes every leg; "estimate"
+                    answers instantly offline when approximate is good enough
+
+            Returns:
+                str: Distance of every leg and the total
+            """
+            error = _itinerary_error(places, mode)
+            if error:
+                return error
+            coords = self._geocode_all(places)
+            if not all(coords):
+                return _missing_places(places, coords)
+
+            routes = map_concurrently(
+                lambda leg: self._driving_route(*leg, mode),
+                list(zip(coords, coords[1:])),
+                geocode_concurrency(),
+            )
+            return self._format_itinerary(places, routes)
+
+        async def acalculate_distances_between_places(
+            places: List[str], mode: str = "exact"
+        ) -> str:
+            error = _itinerary_error(places, mode)
+            if error:
+                return error
+            coords = await self._ageocode_all(places)
+            if not all(coords):
+                return _missing_places(places, coords)
+
+            routes = await asyncio.gather(
+                *(
+                    self._adriving_route(start, end, mode)
+                    for start, end in zip(coords, coords[1:])
                 )
-            return f"Could not calculate distance between {place1} and {place2}"
+            )
+            return self._format_itinerary(places, list(routes))
 
-        @tool
-        def find_nearest_airport_to_city(city_name: str) -> str:
+        def find_nearest_airport_to_city(
+            city_name: str, airport_type: str = "commercial"
+        ) -> str:
             """
-            Find the nearest airport to a given city.
+            Find the nearest airport to a given city anywhere in the world.
 
             Args:
                 city_name (str): Name of the city
+                airport_type (str): "commercial" (default; excludes heliports,
+                    seaplane bases and military fields), "international",
+                    "regional", "military" or "any"
 
             Returns:
-                str: Information about the nearest airport
+                str: The nearest airport with road distance, plus alternatives
             """
+            if airport_type not in AIRPORT_TYPE_FILTERS:
+                return f"airport_type must be one of {', '.join(AIRPORT_TYPE_FILTERS)}"
             city_coords = self._get_coordinates_from_address(city_name)
             if not city_coords:
                 return f"Could not find coordinates for {city_name}"
 
-            nearest_airport = None
-            min_distance = float("inf")
-
-            # Check major airports (limit search for performance)
-            major_airports = [
-                "JFK",
-                "LHR",
-                "CDG",
-                "DXB",
-                "NRT",
-                "LAX",
-                "ORD",
-                "DEL",
-                "BOM",
-                "SIN",
-            ]
-
-            for airport_code in major_airports:
-                airport_coords = self._get_airport_coordinates(airport_code)
-                if airport_coords:
-                    distance = self._calculate_driving_distance(
-                        city_coords, airport_coords
-                    )
-                    if distance and distance < min_distance:
-                        min_distance = distance
-                        nearest_airport = airport_code
+            candidates = self._nearest_candidates(city_coords, airport_type)
+            road_distances = self._road_distances(
+                city_coords,
+                [self._get_airport_coordinates(code) for code, _ in candidates],
+            )
+            return self._format_nearest_airport(
+                city_name, airport_type, self._rank_by_road(candidates, road_distances)
+            )
 
-            if nearest_airport:
-                airport_name = self.airports_data.get(nearest_airport, {}).get(
-                    "name", nearest_airport
-                )
-                return (
-                    f"Nearest major airport to {city_name}: {airport_name} "
-                    f"({nearest_airport}) - {min_distance} km away"
-                )
-            return f"Could not find nearest airport to {city_name}"
+        async def afind_nearest_airport_to_city(
+            city_name: str, airport_type: str = "commercial"
+        ) -> str:
+            if airport_type not in AIRPORT_TYPE_FILTERS:
+                return f"airport_type must be one of {', '.join(AIRPORT_TYPE_FILTERS)}"
+            city_coords = await self._aget_coordinates_from_address(city_name)
+            if not city_coords:
+                return f"Could not find coordinates for {city_name}"
+
+            candidates = self._nearest_candidates(city_coords, airport_type)
+            road_distances = await self._aroad_distances(
+                city_coords,
+                [self._get_airport_coordinates(code) for code, _ in candidates],
+            )
+            return self._format_nearest_airport(
+                city_name, airport_type, self._rank_by_road(candidates, road_distances)
+            )
 
         return [
-            calculate_airport_to_attraction_distance,
-            calculate_distance_between_places,
-            find_nearest_airport_to_city,
+            StructuredTool.from_function(
+                func=calculate_airport_to_attraction_distance,
+                coroutine=acalculate_airport_to_attraction_distance,
+            ),
+            StructuredTool.from_function(
+                func=calculate_distance_between_places,
+                coroutine=acalculate_distance_between_places,
+            ),
+            StructuredTool.from_function(
+                func=calculate_distances_between_places,
+                coroutine=acalculate_distances_between_places,
+            ),
+            StructuredTool.from_function(
+                func=find_nearest_airport_to_city,
+                coroutine=afind_nearest_airport_to_city,
+            ),
         ]
@@ -7,7 +7,7 @@ activities, and transportation options using Tavily search.
 
 from typing import List
 
-from langchain.tools import tool
+from langchain_core.tools import StructuredTool
 
 from utils.place_info_search import TavilyPlaceSearchTool
 
@@ -31,19 +31,24 @@ class PlaceSearchTool:  # pylint: disable=too-few-public-methods
     def _setup_tools(self) -> List:
         """Setup all tools for the place search tool"""
 
-        @tool
         def search_attractions(place: str) -> str:
             """Search attractions of a place"""
             tavily_result = self.tavily_search.tavily_search_attractions(place)
             return f"Following are the attractions of {place}: {tavily_result}"
 
-        @tool
+        async def asearch_attractions(place: str) -> str:
+            tavily_result = await self.tavily_search.atavily_search_attractions(place)
+            return f"Following are the attractions of {place}: {tavily_result}"
+
         def search_restaurants(place: str) -> str:
             """Search restaurants of a place"""
             tavily_result = self.tavily_search.tavily_search_restaurants(place)
             return f"Following are the restaurants of {place}: {tavily_result}"
 
-        @tool
+        async def asearch_restaurants(place: str) -> str:
+            tavily_result = await self.tavily_search.atavily_search_restaurants(place)
+            return f"Following are the restaurants of {place}: {tavily_result}"
+
         def search_activities(place: str) -> str:
             """Search activities of a place"""
             tavily_result = self.tavily_search.tavily_search_activity(place)
@@ -51,7 +56,12 @@ class PlaceSearchTool:  # pylint: disable=too-few-public-methods
                 f"Following are the activities in and around {place}: {tavily_result}"
             )
 
-        @tool
+        async def asearch_activities(place: str) -> str:
+            tavily_result = await self.tavily_search.atavily_search_activity(place)
+            return (
+                f"Following are the activities in and around {place}: {tavily_result}"
+            )
+
         def search_transportation(place: str) -> str:
             """Search transportation of a place"""
             tavily_result = self.tavily_search.tavily_search_transportation(place)
@@ -60,9 +70,26 @@ class PlaceSearchTool:  # pylint: disable=too-few-public-methods
                 f"{tavily_result}"
             )
 
+        async def asearch_transportation(place: str) -> str:
+            tavily_result = await self.tavily_search.atavily_search_transportation(
+                place
+            )
+            return (
+                f"Following are the modes of transportation available in {place}: "
+                f"{tavily_result}"
+            )
+
         return [
-            search_attractions,
-            search_restaurants,
-            search_activities,
-            search_transportation,
+            StructuredTool.from_function(
+                func=search_attractions, coroutine=asearch_attractions
+            ),
+            StructuredTool.from_function(
+                func=search_restaurants, coroutine=asearch_restaurants
+            ),
+            StructuredTool.from_function(
+                func=search_activities, coroutine=asearch_activities
+            ),
+            StructuredTool.from_function(
+                func=search_transportation, coroutine=asearch_transportation
+            ),
         ]
@@ -5,11 +5,18 @@ for fetching current weather conditions and weather forecasts for cities
 using external weather APIs.
 """
 
+import asyncio
+from datetime import date
 from typing import List
 
-from langchain.tools import tool
+from langchain_core.tools import StructuredTool
 
-from utils.weather_info import WeatherForecastTool
+from utils.executor import map_concurrently
+from utils.weather_info import WeatherForecastTool, daily_forecast, forecast_days
+
+# Most cities one combined weather call accepts, and fetches at once
+MAX_WEATHER_CITIES = 10
+WEATHER_CONCURRENCY = 5
 
 
 class WeatherInfoTool:  # pylint: disable=too-few-public-methods
@@ -27,32 +34,134 @@ class WeatherInfoTool:  # pylint: disable=too-few-public-methods
         self.weather_service = WeatherForecastTool(api_key=api_key, base_url=base_url)
         self.weather_tool_list = self._setup_tools()
 
+    @staticmethod
+    def _format_current_weather(city: str, weather_data: dict) -> str:
+        if weather_data:
+            temp = weather_data.get("main", {}).get("temp", "N/A")
+            desc = weather_data.get("weather", [{}])[0].get("description", "N/A")
+            return f"Current weather in {city}: {temp}°C, {desc}"
+        return f"Could not fetch weather for {city}"
+
+    @staticmethod
+    def _format_forecast(city: str, forecast_data: dict) -> str:
+        days = daily_forecast(forecast_data or {}, forecast_days())
+        if not days:
+            return f"Could not fetch forecast for {city}"
+        lines = [f"Weather forecast for {city} (daily, local dates):"]
+        for day in days:
+            weekday = date.fromisoformat(day.date).strftime("%a")
+            line = (
+                f"{weekday} {day.date}: {day.temp_min:.0f}-{day.temp_max:.0f}°C, "
+                f"{day.condition}"
+            )
+            if day.precipitation_mm or day.precipitation_chance:
+                line += (
+                    f", {day.precipitation_mm:g} mm "
+                    f"({day.precipitation_chance:.0%} chance)"
+                )
+            lines.append(line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_snapshot(city: str, forecast_data: dict) -> str:
+        # The first forecast slot stands in for current conditions
+        item = forecast_data["list"][0]
+        main = item.get("main", {})
+        desc = item.get("weather", [{}])[0].get("description", "N/A")
+        return (
+            f"Weather in {city} now (forecast for {item.get('dt_txt', 'N/A')} UTC): "
+            f"{main.get('temp', 'N/A')}°C, feels like "
+            f"{main.get('feels_like', 'N/A')}°C, {desc}, "
+            f"humidity {main.get('humidity', 'N/A')}%, "
+            f"wind {item.get('wind', {}).get('speed', 'N/A')} m/s"
+        )
+
+    def _format_city_weather(self, city: str, forecast_data: dict) -> str:
+        if forecast_data and forecast_data.get("list"):
+            return "\n".join(
+                [
+                    self._format_snapshot(city, forecast_data),
+                    self._format_forecast(city, forecast_data),
+                ]
+            )
+        return f"Could not fetch weather for {city}"
+
+    def _format_cities_weather(self, cities: List[str], forecasts: List[dict]) -> str:
+        return "\n\n".join(
+            self._format_city_weather(city, forecast)
+            for city, forecast in zip(cities, forecasts)
+        )
+
     def _setup_tools(self) -> List:
         """Setup all tools for the weather forecast tool"""
 
-        @tool
         def get_current_weather(city: str) -> str:
             """Get current weather for a city"""
             weather_data = self.weather_service.get_current_weather(city)
-            if weather_data:
-                temp = weather_data.get("main", {}).get("temp", "N/A")
-                desc = weather_data.get("weather", [{}])[0].get("description", "N/A")
-                return f"Current weather in {city}: {temp}°C, {desc}"
-            return f"Could not fetch weather for {city}"
+            return self._format_current_weather(city, weather_data)
+
+        async def aget_current_weather(city: str) -> str:
+            weather_data = await self.weather_service.aget_current_weather(city)
+            return self._format_current_weather(city, weather_data)
 
-        @tool
         def get_weather_forecast(city: str) -> str:
-            """Get weather forecast for a city"""
+            """Get a daily weather forecast (min/max, conditions, rain) for a city"""
             forecast_data = self.weather_service.get_forecast_weather(city)
-            if forecast_data and "list" in forecast_data:
-                forecast_summary = []
-                for i in range(len(forecast_data["list"])):
-                    item = forecast_data["list"][i]
-                    date = item["dt_txt"].split(" ")[0]
-                    temp = item["main"]["temp"]
-                    desc = item["weather"][0]["description"]
-                    forecast_summary.append(f"{date}: {temp} degree celcius , {desc}")
-                return f"Weather forecast for {city}:\n" + "\n".join(forecast_summary)
-            return f"Could not fetch forecast for {city}"
+            return self._format_forecast(city, forecast_data)
+
+        async def aget_weather_forecast(city: str) -> str:
+            forecast_data = await self.weather_service.aget_forecast_weather(city)
+            return self._format_forecast(city, forecast_data)
+
+        def _cities_error(cities: List[str]) -> str:
+            if not 1 <= len(cities) <= MAX_WEATHER_CITIES:
+                return f"cities must list between 1 and {MAX_WEATHER_CITIES} cities"
+            return ""
+
+        def get_weather_for_cities(cities: List[str]) -> str:
+            """
+            Get current conditions and the forecast for one or more cities.
+
+            One call covers every city of a trip; prefer it to calling
+            get_current_weather and get_weather_forecast for each city.
+
+            Args:
+                cities (List[str]): City names (1 to 10)
+
+            Returns:
+                str: Current conditions and forecast, per city
+            """
+            error = _cities_error(cities)
+            if error:
+                return error
+            unique = list(dict.fromkeys(cities))
+            forecasts = map_concurrently(
+                self.weather_service.get_forecast_weather, unique, WEATHER_CONCURRENCY
+            )
+            return self._format_cities_weather(unique, forecasts)
+
+        async def aget_weather_for_cities(cities: List[str]) -> str:
+            error = _cities_error(cities)
+            if error:
+                return error
+            unique = list(dict.fromkeys(cities))
+            semaphore = asyncio.Semaphore(WEATHER_CONCURRENCY)
+
+            async def forecast(city: str) -> dict:
+                async with semaphore:
+                    return await self.weather_service.aget_forecast_weather(city)
+
+            forecasts = await asyncio.gather(*map(forecast, unique))
+            return self._format_cities_weather(unique, list(forecasts))
 
-        return [get_current_weather, get_weather_forecast]
+        return [
+            StructuredTool.from_function(
+                func=get_weather_for_cities, coroutine=aget_weather_for_cities
+            ),
+            StructuredTool.from_function(
+                func=get_current_weather, coroutine=aget_current_weather
+            ),
+            StructuredTool.from_function(
+                func=get_weather_forecast, coroutine=aget_weather_forecast
+            ),
+        ]
@@ -1,14 +1,35 @@
 """Airport distance calculator utility module.
 
 This module provides functionality to calculate distances between airports
-and various locations using the OpenRouteService API.
+and various locations using the OpenRouteService API. Several destinations
+are routed with a single matrix request.
 """
 
-import math
-from typing import Tuple, Optional, Dict, List, Any
+from typing import Tuple, Optional, Dict, List, Any, Sequence
 
 import requests
-from airportsdata import load as load_airports
+from utils.airport_index import get_airport_index
+from utils.executor import map_concurrently
+from utils.geocode_cache import geocode_concurrency, get_geocode_cache
+from utils.geodesic import DEFAULT_ROAD_FACTOR, distance_km
+from utils.http_client import get_session
+from utils.metrics import timed
+from utils.road_estimator import get_road_estimator
+from utils.route_cache import get_route_cache
+from utils.route_matrix import RouteMatrixClient, openroute_base_url
+from utils.snap_cache import (
+    get_snap_cache,
+    learn_from_failed_route,
+    learn_from_route,
+    route_endpoints,
+    widen_unknown,
+)
+from utils.spatial_index import get_spatial_index
+
+# Only airports this close (great-circle) are considered, and only the nearest
+# few of them are routed by road
+NEAREST_AIRPORT_RADIUS_KM = 200
+NEAREST_AIRPORT_CANDIDATES = 5
 
 
 class AirportDistanceCalculator:
@@ -19,15 +40,22 @@ class AirportDistanceCalculator:
         if not api_key:
             raise ValueError("OpenRouteService API key not provided.")
         self.openroute_api_key = api_key
-        self.airports_data = load_airports("IATA")
+        self.route_matrix = RouteMatrixClient(api_key)
+        self.geocode_cache = get_geocode_cache()
+        self.route_cache = get_route_cache()
+        self.snap_cache = get_snap_cache()
+        self.road_estimator = get_road_estimator()
+        self.airport_index = get_airport_index()
+        self.airports_data = self.airport_index.airports
 
     def get_airport_coordinates(
         self, airport_code: str
     ) -> Optional[Tuple[float, float]]:
-        """Get latitude and longitude for an airport given its IATA code"""
+        """Get latitude and longitude for an airport given its IATA code or city"""
         try:
-            if airport_code.upper() in self.airports_data:
-                airport_info = self.airports_data[airport_code.upper()]
+            airport_code = self.airport_index.resolve(airport_code)
+            if airport_code in self.airports_data:
+                airport_info = self.airports_data[airport_code]
                 lat = airport_info.get("lat")
                 lon = airport_info.get("lon")
                 if lat and lon:
@@ -37,16 +65,34 @@ class AirportDistanceCalculator:
             print(f"Error getting airport coordinates for {airport_code}: {e}")
             return None
 
+    @staticmethod
+    def _geocode(
+        url: str, headers: dict, params: dict
+    ) -> Optional[Tuple[float, float]]:
+        response = get_session().get(url, headers=headers, params=params, timeout=15)
+        # Errors raise so that they are not cached as "address not found"
+        response.raise_for_status()
+        data = response.json()
+        if data.get("features"):
+            coords = data["features"][0]["geometry"]["coordinates"]
+            return (float(coords[1]), float(coords[0]))  # Return as (lat, lon)
+        return None
+
+    @timed("airport_distance", "geocode")
     def get_coordinates_from_address(
         self, address: str
     ) -> Optional[Tuple[float, float]]:
-        """Get coordinates from address using OpenRouteService Geocoding API"""
+        """Get coordinates from address using OpenRouteService Geocoding API
+
+        Answers, including addresses that were not found, come from the shared
+        geocode cache when available.
+        """
         if not self.openroute_api_key:
             print("No OpenRouteService API key available, skipping geocoding")
             return None
 
         try:
-            url = "https://api.openrouteservice.org/geocode/search"
+            url = f"{openroute_base_url()}/geocode/search"
             headers = {"Authorization": self.openroute_api_key}
 
             # Improve address specificity
@@ -74,93 +120,193 @@ class AirportDistanceCalculator:
             # Remove None values
             params = {k: v for k, v in params.items() if v is not None}
 
-            response = requests.get(url, headers=headers, params=params, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("features"):
-                    coords = data["features"][0]["geometry"]["coordinates"]
-                    return (float(coords[1]), float(coords[0]))  # Return as (lat, lon)
-            return None
+            return self.geocode_cache.get_or_fetch(
+                enhanced_address,
+                lambda: self._geocode(url, headers, params),
+                country=params.get("boundary.country"),
+            )
         except (requests.RequestException, KeyError, ValueError, IndexError) as e:
             print(f"Error getting coordinates for {address}: {e}")
             return None
 
+    @timed("airport_distance", "directions")
     def calculate_driving_distance(
-        self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]
+        self,
+        start_coords: Tuple[float, float],
+        end_coords: Tuple[float, float],
+        mode: str = "exact",
     ) -> Optional[float]:
-        """Calculate driving distance in kilometers between two coordinate points"""
+        """Calculate driving distance in kilometers between two coordinate points
+
+        Routes and offline fallbacks are served from the shared route cache
+        when the pair was seen recently, and routing starts from the snapped
+        points learned for the endpoints. mode="estimate" never routes.
+        """
         if not self.openroute_api_key:
             # Fall back to straight-line distance if no API key
             return self._calculate_haversine_distance(start_coords, end_coords)
-
+        if mode == "estimate":
+            return self.estimate_driving_distance(start_coords, end_coords)[0]
+
+        cached = self.route_cache.get(start_coords, end_coords)
+        if cached is not None:
+            return cached.distance_km
+
+        points = (start_coords, end_coords)
+        endpoints = route_endpoints(self.snap_cache, points)
+        if endpoints is None:
+            # An endpoint is known to have no road nearby; skip the request
+            return self._estimate_distance(start_coords, end_coords)
         try:
-            url = "https://api.openrouteservice.org/v2/directions/driving-car"
-            headers = {"Authorization": self.openroute_api_key}
-            body = {
-                "coordinates": [
-                    [start_coords[1], start_coords[0]],  # [lon, lat]
-                    [end_coords[1], end_coords[0]],
-                ],
-                "radiuses": [
-                    1000,
-                    1000,
-                ],  # Allow up to 1km radius to find routable points
-            }
-            response = requests.post(url, json=body, headers=headers, timeout=20)
+            response = self._post_route(endpoints)
+            if response.status_code == 404:
+                # Routable point not found: widen the search for the endpoints
+                # not seen before once; the route then starts at their snapped
+                # points, which are remembered for next time
+                endpoints = widen_unknown(endpoints)
+                if endpoints is None:
+                    return self._estimate_distance(start_coords, end_coords)
+                response = self._post_route(endpoints)
+                if response.status_code != 200:
+                    learn_from_failed_route(
+                        self.snap_cache, points, endpoints, response
+                    )
+                    # Fall back to the offline estimate
+                    return self._estimate_distance(start_coords, end_coords)
             if response.status_code == 200:
                 data = response.json()
+                segment = data["features"][0]["properties"]["segments"][0]
+                learn_from_route(self.snap_cache, points, data)
                 # distance in meters, convert to kilometers
-                distance_km = (
-                    data["features"][0]["properties"]["segments"][0]["distance"] / 1000
+                distance = round(segment["distance"] / 1000, 2)
+                self.route_cache.store(
+                    start_coords, end_coords, distance, segment.get("duration")
                 )
-                return round(distance_km, 2)
-            if response.status_code == 404:
-                # Try with larger radius if 404 (routable point not found)
-                body["radiuses"] = [5000, 5000]  # 5km radius
-                response = requests.post(url, json=body, headers=headers, timeout=20)
-                if response.status_code == 200:
-                    data = response.json()
-                    distance_km = (
-                        data["features"][0]["properties"]["segments"][0]["distance"]
-                        / 1000
-                    )
-                    return round(distance_km, 2)
-                # Fall back to straight-line distance calculation
-                return self._calculate_haversine_distance(start_coords, end_coords)
+                return distance
             return None
         except (requests.RequestException, KeyError, ValueError, IndexError) as e:
             print(f"Error calculating distance: {e}")
-            # Fall back to straight-line distance
-            return self._calculate_haversine_distance(start_coords, end_coords)
+            # Fall back to the offline estimate
+            return self._estimate_distance(start_coords, end_coords)
+
+    def _post_route(self, endpoints: List[Tuple[Tuple[float, float], int]]):
+        return get_session().post(
+            f"{openroute_base_url()}/v2/directions/driving-car",
+            json={
+                "coordinates": [[lon, lat] for (lat, lon), _ in endpoints],
+                "radiuses": [radius for _, radius in endpoints],
+            },
+            headers={"Authorization": self.openroute_api_key},
+            timeout=20,
+        )
 
-    def _calculate_haversine_distance(
-        self, coord1: Tuple[float, float], coord2: Tuple[float, float]
+    def _estimate_distance(
+        self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]
     ) -> float:
-        """Calculate straight-line distance using Haversine formula as fallback"""
+        """Offline fallback after a failed route, cached apart from routed distances"""
+        return self._fallback_route(start_coords, end_coords)[0]
 
-        lat1, lon1 = coord1
-        lat2, lon2 = coord2
+    def _fallback_route(
+        self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]
+    ) -> Tuple[float, float, bool]:
+        """Offline estimate for a pair that could not be routed, flagged as such"""
+        estimate = self.road_estimator.estimate(start_coords, end_coords)
+        self.route_cache.store_estimate(
+            start_coords, end_coords, estimate.distance_km, estimate.duration_s
+        )
+        return estimate.distance_km, estimate.duration_s, True
+
+    def estimate_driving_distance(
+        self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]
+    ) -> Tuple[float, float]:
+        """
+        Driving distance and duration without any routing call
 
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+        A real route from the route cache is used when there is one; otherwise
+        the offline road estimator answers.
 
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        Returns:
+            tuple: (distance in km, duration in seconds)
+        """
+        return self.road_estimator.offline_route(
+            start_coords, end_coords, self.route_cache
         )
-        c = 2 * math.asin(math.sqrt(a))
 
-        # Earth's radius in kilometers
-        r = 6371
+    def _calculate_haversine_distance(
+        self, coord1: Tuple[float, float], coord2: Tuple[float, float]
+    ) -> float:
+        """Calculate straight-line distance using Haversine formula as fallback"""
+        # Scale by the road factor to approximate road distance
+        return round(distance_km(coord1, coord2, road_factor=DEFAULT_ROAD_FACTOR), 2)
+
+    def calculate_driving_distances(
+        self,
+        start_coords: Tuple[float, float],
+        destinations: Sequence[Tuple[float, float]],
+        mode: str = "exact",
+    ) -> List[Tuple[float, Optional[float], bool]]:
+        """
+        Route one start point to several destinations with one matrix request
 
-        distance = r * c
-        return round(distance * 1.2, 2)  # Add 20% to approximate road distance
+        Only pairs missing from the route cache are sent. Unroutable pairs, or
+        all of them if the request fails, fall back to the offline estimate
+        like calculate_driving_distance does. With mode="estimate" nothing is
+        routed (see estimate_driving_distance).
 
+        Returns:
+            list: (distance in km, duration in seconds or None, estimated) per
+            destination; estimated is True unless the distance was routed
+        """
+        if mode == "estimate":
+            return [
+                (
+                    *self.estimate_driving_distance(start_coords, d),
+                    self.route_cache.get(start_coords, d, estimates=False) is None,
+                )
+                for d in destinations
+            ]
+
+        results: List[Optional[Tuple[float, Optional[float], bool]]] = []
+        missing = []
+        for i, end_coords in enumerate(destinations):
+            cached = self.route_cache.get(start_coords, end_coords)
+            if cached is None:
+                missing.append(i)
+                results.append(None)
+            else:
+                results.append(
+                    (cached.distance_km, cached.duration_s, cached.estimated)
+                )
+        if not missing:
+            return results
+
+        matrix = self.route_matrix.matrix(
+            [start_coords], [destinations[i] for i in missing]
+        )
+        for column, i in enumerate(missing):
+            end_coords = destinations[i]
+            distance = matrix.distances_km[0][column] if matrix else None
+            if distance is None:
+                results[i] = self._fallback_route(start_coords, end_coords)
+            else:
+                duration = matrix.durations_s[0][column]
+                self.route_cache.store(start_coords, end_coords, distance, duration)
+                results[i] = (distance, duration, False)
+        return results
+
+    @staticmethod
+    def _format_travel_time(
+        distance: float, duration_seconds: Optional[float] = None
+    ) -> str:
+        if duration_seconds is None:
+            # Assume an average speed of 50 km/h for city driving
+            duration_seconds = distance / 50 * 3600
+        hours, minutes = divmod(int(duration_seconds // 60), 60)
+        return f"{hours}h {minutes}m"
+
+    @timed("airport_distance", "airport_to_attraction")
     def get_airport_to_attraction_distance(
-        self, airport_code: str, attraction_address: str
+        self, airport_code: str, attraction_address: str, mode: str = "exact"
     ) -> Dict[str, Any]:
         """
         Get comprehensive distance information from airport to attraction
@@ -168,57 +314,92 @@ class AirportDistanceCalculator:
         Returns:
             dict: Contains distance, travel time, airport info, and status
         """
-        result = {
-            "success": False,
-            "airport_code": airport_code,
-            "attraction": attraction_address,
-            "distance_km": None,
-            "travel_time": None,
-            "airport_name": None,
-            "error": None,
-        }
+        return self.get_airport_to_attraction_distances(
+            airport_code, [attraction_address], mode=mode
+        )[0]
+
+    @timed("airport_distance", "airport_to_attractions")
+    def get_airport_to_attraction_distances(
+        self,
+        airport_code: str,
+        attraction_addresses: Sequence[str],
+        mode: str = "exact",
+    ) -> List[Dict[str, Any]]:
+        """
+        Get distance information from one airport to several attractions
+
+        The attractions are geocoded concurrently and routed with a single
+        matrix request, or estimated offline with mode="estimate".
+
+        Returns:
+            list: One dict per attraction, as get_airport_to_attraction_distance
+        """
+        results = [
+            {
+                "success": False,
+                "airport_code": airport_code,
+                "attraction": attraction_address,
+                "distance_km": None,
+                "travel_time": None,
+                "airport_name": None,
+                "estimated": False,
+                "error": None,
+            }
+            for attraction_address in attraction_addresses
+        ]
 
         # Get airport coordinates and info
         airport_coords = self.get_airport_coordinates(airport_code)
         if not airport_coords:
-            result["error"] = f"Could not find airport with code {airport_code}"
-            return result
-
-        airport_info = self.airports_data.get(airport_code.upper(), {})
-        result["airport_name"] = airport_info.get("name", airport_code)
-
-        # Get attraction coordinates
-        attraction_coords = self.get_coordinates_from_address(attraction_address)
-        if not attraction_coords:
-            result["error"] = f"Could not find coordinates for {attraction_address}"
-            return result
+            for result in results:
+                result["error"] = f"Could not find airport with code {airport_code}"
+            return results
+
+        resolved_code = self.airport_index.resolve(airport_code)
+        airport_info = self.airports_data.get(resolved_code, {})
+
+        # Get attraction coordinates, all at once
+        coordinates = map_concurrently(
+            self.get_coordinates_from_address,
+            attraction_addresses,
+            geocode_concurrency(),
+        )
+        routable = []
+        for result, attraction_coords in zip(results, coordinates):
+            result["airport_name"] = airport_info.get("name", airport_code)
+            if attraction_coords:
+                routable.append((result, attraction_coords))
+            else:
+                result["error"] = (
+                    f"Could not find coordinates for {result['attraction']}"
+                )
 
-        # Calculate distance
-        distance = self.calculate_driving_distance(airport_coords, attraction_coords)
-        if distance is not None:
+        # Calculate all distances at once
+        routes = self.calculate_driving_distances(
+            airport_coords, [coords for _, coords in routable], mode=mode
+        )
+        for (result, _), (distance, duration, estimated) in zip(routable, routes):
             result["success"] = True
             result["distance_km"] = distance
+            result["estimated"] = estimated
+            result["travel_time"] = self._format_travel_time(distance, duration)
 
-            # Calculate travel time (assuming average speed of 50 km/h for city driving)
-            travel_time_hours = distance / 50
-            hours = int(travel_time_hours)
-            minutes = int((travel_time_hours - hours) * 60)
-            result["travel_time"] = f"{hours}h {minutes}m"
-
-        else:
-            result["error"] = "Could not calculate distance"
-
-        return result
+        return results
 
+    @timed("airport_distance", "nearest_airports")
     def find_nearest_airports_to_city(
-        self, city_name: str, limit: int = 3
+        self, city_name: str, limit: int = 3, mode: str = "exact"
     ) -> List[Dict[str, Any]]:
         """
         Find the nearest airports to a given city
 
+        Candidates come from the spatial index by great-circle distance; only
+        those are routed for driving distance, in one matrix request.
+
         Args:
             city_name: Name of the city
             limit: Maximum number of airports to return
+            mode: "exact" to route the candidates, "estimate" to stay offline
 
         Returns:
             List of airport information dictionaries
@@ -229,21 +410,28 @@ class AirportDistanceCalculator:
 
         airport_distances = []
 
-        # Check a broader range of airports
-        for airport_code, airport_info in self.airports_data.items():
-            airport_coords = self.get_airport_coordinates(airport_code)
-            if airport_coords:
-                distance = self.calculate_driving_distance(city_coords, airport_coords)
-                if distance and distance <= 200:  # Only consider airports within 200km
-                    airport_distances.append(
-                        {
-                            "code": airport_code,
-                            "name": airport_info.get("name", airport_code),
-                            "city": airport_info.get("city", ""),
-                            "country": airport_info.get("country", ""),
-                            "distance_km": distance,
-                        }
-                    )
+        candidates = get_spatial_index().nearest(
+            *city_coords,
+            k=max(limit, NEAREST_AIRPORT_CANDIDATES),
+            max_km=NEAREST_AIRPORT_RADIUS_KM,
+        )
+        candidate_coords = [self.get_airport_coordinates(c) for c, _ in candidates]
+        routes = self.calculate_driving_distances(
+            city_coords, candidate_coords, mode=mode
+        )
+        for (airport_code, _), (distance, _, estimated) in zip(candidates, routes):
+            airport_info = self.airports_data[airport_code]
+            if distance and distance <= NEAREST_AIRPORT_RADIUS_KM:
+                airport_distances.append(
+                    {
+                        "code": airport_code,
+                        "name": airport_info.get("name", airport_code),
+                        "city": airport_info.get("city", ""),
+                        "country": airport_info.get("country", ""),
+                        "distance_km": distance,
+                        "estimated": estimated,
+                    }
+                )
 
         # Sort by distance and return top results
         airport_distances.sort(key=lambda x: x["distance_km"])
@@ -254,6 +442,13 @@ class AirportDistanceCalculator:
         if not distance_data["success"]:
             return f"Error: {distance_data['error']}"
 
+        if distance_data.get("estimated"):
+            # Offline estimates must not read like measured road distances
+            return (
+                f"Distance from {distance_data['airport_name']} ({distance_data['airport_code']}) "
+                f"to {distance_data['attraction']}: ≈ {distance_data['distance_km']} km "
+                f"(estimated, approximately {distance_data['travel_time']} by car)"
+            )
         return (
             f"Distance from {distance_data['airport_name']} ({distance_data['airport_code']}) "
             f"to {distance_data['attraction']}: {distance_data['distance_km']} km "
@@ -0,0 +1,270 @@
+"""City to airport index utility module.
+
+This module provides an AirportIndex class that maps normalized city names to
+ranked IATA airport codes. The index is built once from the shared
+AirportStore and used by the API, AirportDistanceCalculator and
+DistanceCalculatorTool, so city lookups are dictionary hits instead of scans
+over every airport.
+"""
+
+import difflib
+import re
+import threading
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from utils.airport_store import get_airport_store
+
+# Main passenger airport of frequently requested cities, keyed by folded name.
+# Checked before the IATA table's own city names, which often name the suburb
+# the airport is in ("Mississauga" for YYZ, "Frankfurt am Main" for FRA).
+CITY_AIRPORTS = {
+    "amsterdam": "AMS", "atlanta": "ATL", "bangkok": "BKK", "barcelona": "BCN",
+    "beijing": "PEK", "berlin": "BER", "bombay": "BOM", "buenos aires": "EZE",
+    "calcutta": "CCU", "chicago": "ORD", "dallas": "DFW", "delhi": "DEL",
+    "dubai": "DXB", "frankfurt": "FRA", "goa": "GOI", "hong kong": "HKG",
+    "houston": "IAH", "istanbul": "IST", "jakarta": "CGK", "kolkata": "CCU",
+    "london": "LHR", "los angeles": "LAX", "madrid": "MAD", "mexico city": "MEX",
+    "milan": "MXP", "montreal": "YUL", "moscow": "SVO", "mumbai": "BOM",
+    "munchen": "MUC", "munich": "MUC", "new delhi": "DEL", "new york": "JFK",
+    "osaka": "KIX", "paris": "CDG", "rio de janeiro": "GIG", "roma": "FCO",
+    "rome": "FCO", "san francisco": "SFO", "sao paulo": "GRU", "seoul": "ICN",
+    "shanghai": "PVG", "singapore": "SIN", "stockholm": "ARN", "sydney": "SYD",
+    "taipei": "TPE", "tokyo": "HND", "toronto": "YYZ", "vancouver": "YVR",
+    "venice": "VCE", "washington": "IAD", "zurich": "ZRH",
+}  # fmt: skip
+
+# Airports rank first under any city name they are listed for
+PRIMARY_AIRPORTS = frozenset(CITY_AIRPORTS.values())
+
+# Still in the IATA table but closed to scheduled passenger flights
+CLOSED_AIRPORTS = frozenset({"DIA", "ISL", "NAY", "TXL"})
+
+# State and province abbreviations accepted as qualifiers ("Portland, ME")
+REGION_ABBREVIATIONS = {
+    "US": {
+        "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
+        "CA": "California", "CO": "Colorado", "CT": "Connecticut",
+        "DE": "Delaware", "DC": "District of Columbia", "FL": "Florida",
+        "GA": "Georgia", "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois",
+        "IN": "Indiana", "IA": "Iowa", "KS": "Kansas", "KY": "Kentucky",
+        "LA": "Louisiana", "ME": "Maine", "MD": "Maryland",
+        "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
+        "MS": "Mississippi", "MO": "Missouri", "MT": "Montana",
+        "NE": "Nebraska", "NV": "Nevada", "NH": "New Hampshire",
+        "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
+        "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio",
+        "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania",
+        "PR": "Puerto Rico", "RI": "Rhode Island", "SC": "South Carolina",
+        "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah",
+        "VT": "Vermont", "VI": "Virgin Islands", "VA": "Virginia",
+        "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin",
+        "WY": "Wyoming",
+    },
+    "CA": {
+        "AB": "Alberta", "BC": "British Columbia", "MB": "Manitoba",
+        "NB": "New Brunswick", "NL": "Newfoundland and Labrador",
+        "NT": "Northwest Territories", "NS": "Nova Scotia", "NU": "Nunavut",
+        "ON": "Ontario", "PE": "Prince Edward Island", "QC": "Quebec",
+        "SK": "Saskatchewan", "YT": "Yukon",
+    },
+}  # fmt: skip
+
+# Facility types that rarely serve scheduled passenger flights
+MINOR_FACILITY_WORDS = ("heliport", "seaplane", "air base", "raf ", "airstrip")
+
+# Airport types derived from the airport name, most specific first
+_TYPE_WORDS = (
+    ("heliport", ("heliport",)),
+    ("seaplane_base", ("seaplane",)),
+    ("military", ("air base", "air force", "raf ", "naval air", "army air")),
+    ("international", ("international",)),
+)
+# Filters accepted by type_matches(); "commercial" excludes minor facilities
+AIRPORT_TYPE_FILTERS = ("any", "commercial", "international", "regional", "military")
+
+# Letters that Unicode decomposition does not reduce to ASCII
+_EXTRA_FOLDS = str.maketrans(
+    {"ß": "ss", "æ": "ae", "ø": "o", "đ": "d", "ð": "d", "þ": "th", "ł": "l"}
+)
+
+FUZZY_CUTOFF = 0.8
+# Shorter names are too ambiguous to correct ("goa" would become "goya")
+FUZZY_MIN_LENGTH = 5
+
+
+def fold(text: str) -> str:
+    """Normalize a place name: case and accent folding, punctuation to spaces."""
+    text = unicodedata.normalize("NFKD", text.casefold().translate(_EXTRA_FOLDS))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+class AirportIndex:
+    """Immutable city to IATA code index with ranking and fuzzy matching.
+
+    Attributes:
+        airports (Mapping): The IATA airport table, keyed by upper-case code
+    """
+
+    def __init__(self, airports: Mapping[str, Dict[str, Any]]):
+        self.airports = airports
+        by_city: Dict[str, List[str]] = {}
+        for code, info in airports.items():
+            city = fold(info.get("city") or "")
+            if city and code not in CLOSED_AIRPORTS:
+                by_city.setdefault(city, []).append(code)
+        for city, code in CITY_AIRPORTS.items():
+            if code in airports and code not in by_city.get(city, ()):
+                by_city.setdefault(city, []).append(code)
+
+        self._by_city = {
+            city: self._rank(city, codes) for city, codes in by_city.items()
+        }
+        self._city_names = sorted(self._by_city)
+        self._types = {code: self._classify(info) for code, info in airports.items()}
+        # Lookups repeat the same few cities; keep fuzzy results per instance
+        self._fuzzy_city = lru_cache(maxsize=1024)(self._closest_city)
+
+    def _rank(self, city: str, codes: List[str]) -> List[str]:
+        """Order a city's airports from most to least likely intended."""
+        metro_size: Dict[str, int] = {}
+        for code in codes:
+            country = self.airports[code].get("country", "")
+            metro_size[country] = metro_size.get(country, 0) + 1
+
+        def score(code: str) -> Tuple:
+            info = self.airports[code]
+            name = (info.get("name") or "").lower()
+            return (
+                code != CITY_AIRPORTS.get(city),
+                code not in PRIMARY_AIRPORTS,
+                # the country with the most airports for this name is the big city
+                -metro_size[info.get("country", "")],
+                "international" not in name,
+                any(word in name for word in MINOR_FACILITY_WORDS),
+                code,
+            )
+
+        return sorted(codes, key=score)
+
+    @staticmethod
+    def _classify(info: Dict[str, Any]) -> str:
+        name = f"{(info.get('name') or '').lower()} "
+        for airport_type, words in _TYPE_WORDS:
+            if any(word in name for word in words):
+                return airport_type
+        return "regional"
+
+    def airport_type(self, code: str) -> Optional[str]:
+        """
+        Return the airport's type inferred from its name.
+
+        Returns:
+            str: "international", "regional", "military", "heliport" or
+            "seaplane_base"; None for unknown codes
+        """
+        return self._types.get(code)
+
+    def type_matches(self, code: str, airport_type: str) -> bool:
+        """Check an airport against one of AIRPORT_TYPE_FILTERS."""
+        actual = self._types.get(code)
+        if airport_type == "any":
+            return actual is not None
+        if airport_type == "commercial":
+            return actual in ("international", "regional")
+        return actual == airport_type
+
+    def _closest_city(self, folded_city: str) -> Optional[str]:
+        matches = difflib.get_close_matches(
+            folded_city, self._city_names, n=1, cutoff=FUZZY_CUTOFF
+        )
+        return matches[0] if matches else None
+
+    @staticmethod
+    def _split_qualifier(city: str) -> Tuple[str, Optional[str]]:
+        """Split "Portland, ME" or "Paris, FR" into city and qualifier."""
+        if "," in city:
+            name, qualifier = city.split(",", 1)
+            return name, qualifier.strip() or None
+        return city, None
+
+    def _matches_qualifier(self, code: str, qualifier: str) -> bool:
+        info = self.airports[code]
+        folded = fold(qualifier)
+        country = info.get("country") or ""
+        subd = fold(info.get("subd") or "")
+        region = REGION_ABBREVIATIONS.get(country, {}).get(qualifier.strip().upper())
+        return folded in (fold(country), subd) or (
+            region is not None and fold(region) == subd
+        )
+
+    def lookup(
+        self, city: str, country: Optional[str] = None, fuzzy: bool = True
+    ) -> List[str]:
+        """
+        Return the IATA codes serving a city, best candidate first.
+
+        Args:
+            city: City name; a ", <country code or region>" suffix narrows it down
+            country: ISO country code, region name or US/Canadian state or
+                province abbreviation to disambiguate the city
+            fuzzy: Fall back to the closest city name for misspellings
+
+        Returns:
+            list: Ranked IATA codes, empty if nothing matches
+        """
+        if not city:
+            return []
+        name, qualifier = self._split_qualifier(city)
+        qualifier = country or qualifier
+        folded = fold(name)
+
+        codes = self._by_city.get(folded)
+        if codes is None and fuzzy and len(folded) >= FUZZY_MIN_LENGTH:
+            closest = self._fuzzy_city(folded)
+            codes = self._by_city.get(closest) if closest else None
+        if not codes:
+            return []
+        if qualifier:
+            narrowed = [c for c in codes if self._matches_qualifier(c, qualifier)]
+            codes = narrowed or codes
+        return list(codes)
+
+    def best(self, city: str, country: Optional[str] = None) -> Optional[str]:
+        """Return the most likely IATA code for a city, or None."""
+        codes = self.lookup(city, country=country)
+        return codes[0] if codes else None
+
+    def resolve(self, code_or_city: str) -> Optional[str]:
+        """Return an IATA code for either an IATA code or a city name."""
+        if not code_or_city:
+            return None
+        text = code_or_city.strip()
+        if text.isupper() and text in self.airports:
+            return text
+        # "GOA" is Genoa's code while "Goa" is a place: other spellings of a
+        # code only win when they are not a city alias ("jfk", " lhr ")
+        code = text.upper()
+        if len(code) == 3 and code in self.airports and fold(text) not in CITY_AIRPORTS:
+            return code
+        return self.best(text)
+
+    def airport(self, code: str) -> Optional[Dict[str, Any]]:
+        """Return the airport record for an IATA code."""
+        return self.airports.get(code.strip().upper()) if code else None
+
+
+_index: Optional[AirportIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_airport_index() -> AirportIndex:
+    """Return the process-wide airport index, building it on first use."""
+    global _index  # pylint: disable=global-statement
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = AirportIndex(get_airport_store())
+    return _index
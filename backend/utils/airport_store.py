@@ -0,0 +1,128 @@
+"""Airport store utility module.
+
+This module provides an AirportStore class that holds the airportsdata IATA
+table once per process in column form: NumPy arrays for coordinates and
+elevation, and integer ids into a single interned string table for the text
+fields. It is read-only, so one instance is shared by every request and
+thread, and it still behaves like the familiar ``{code: {field: value}}``
+mapping for code that looks up single airports.
+"""
+
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+from airportsdata import load as load_airports
+
+STRING_FIELDS = ("icao", "iata", "name", "city", "subd", "country", "tz", "lid")
+NUMERIC_FIELDS = ("elevation", "lat", "lon")
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values.flags.writeable = False
+    return values
+
+
+class AirportStore(Mapping):
+    """Immutable column store of airports keyed by IATA code.
+
+    Attributes:
+        codes (np.ndarray): IATA codes in row order
+        lat (np.ndarray): Latitudes in degrees (NaN if unknown)
+        lon (np.ndarray): Longitudes in degrees (NaN if unknown)
+        elevation (np.ndarray): Elevations in feet (NaN if unknown)
+    """
+
+    def __init__(self, airports: Mapping):
+        codes = list(airports)
+        self._rows: Dict[str, int] = {code: row for row, code in enumerate(codes)}
+        self.codes = _read_only(np.array(codes))
+
+        strings: List[str] = [""]
+        string_ids: Dict[str, int] = {"": 0}
+        columns = {field: np.zeros(len(codes), np.int32) for field in STRING_FIELDS}
+        numbers = {field: np.full(len(codes), np.nan) for field in NUMERIC_FIELDS}
+        for row, code in enumerate(codes):
+            info = airports[code]
+            for field in STRING_FIELDS:
+                value = str(info.get(field) or "")
+                string_id = string_ids.get(value)
+                if string_id is None:
+                    string_id = string_ids[value] = len(strings)
+                    strings.append(sys.intern(value))
+                columns[field][row] = string_id
+            for field in NUMERIC_FIELDS:
+                value = info.get(field)
+                if value not in (None, ""):
+                    numbers[field][row] = float(value)
+
+        self._strings = tuple(strings)
+        self._columns = {field: _read_only(ids) for field, ids in columns.items()}
+        self.elevation = _read_only(numbers["elevation"])
+        self.lat = _read_only(numbers["lat"])
+        self.lon = _read_only(numbers["lon"])
+
+    @classmethod
+    def load(cls) -> "AirportStore":
+        """Build the store from the airportsdata IATA table."""
+        return cls(load_airports("IATA"))
+
+    def row(self, code: str) -> Optional[int]:
+        """Return the row number of an IATA code, or None."""
+        return self._rows.get(code)
+
+    def value(self, code: str, field: str) -> Any:
+        """Return one field of one airport without building a record."""
+        row = self._rows[code]
+        if field in self._columns:
+            return self._strings[self._columns[field][row]]
+        return float(getattr(self, field)[row])
+
+    def string_column(self, field: str) -> List[str]:
+        """Return a text column as a list of strings in row order."""
+        strings = self._strings
+        return [strings[i] for i in self._columns[field]]
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns and the string table."""
+        arrays = [self.codes, self.lat, self.lon, self.elevation]
+        arrays.extend(self._columns.values())
+        return sum(a.nbytes for a in arrays) + sum(
+            sys.getsizeof(s) for s in self._strings
+        )
+
+    # ---- Mapping interface: {code: {field: value}} ----
+    def __getitem__(self, code: str) -> Dict[str, Any]:
+        row = self._rows[code]
+        record: Dict[str, Any] = {
+            field: self._strings[ids[row]] for field, ids in self._columns.items()
+        }
+        for field in NUMERIC_FIELDS:
+            value = float(getattr(self, field)[row])
+            record[field] = None if np.isnan(value) else value
+        return record
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+_store: Optional[AirportStore] = None
+_store_lock = threading.Lock()
+
+
+def get_airport_store() -> AirportStore:
+    """Return the process-wide airport store, loading it on first use."""
+    global _store  # pylint: disable=global-statement
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = AirportStore.load()
+    return _store
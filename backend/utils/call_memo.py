@@ -0,0 +1,93 @@
+"""Scoped call memoization utility module.
+
+This module provides a CallMemo class that deduplicates identical tool and
+enrichment calls made by a group of requests, such as the plans in one
+/query/batch call. The active memo is carried in a context variable, so tools
+pick it up without any change to their signatures, and calls made outside a
+memo scope run unchanged.
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_active_memo: contextvars.ContextVar[Optional["CallMemo"]] = contextvars.ContextVar(
+    "active_call_memo", default=None
+)
+
+
+class CallMemo:
+    """Shares the result of identical calls among the requests of one scope.
+
+    Concurrent callers of the same key await the same task; later callers get
+    the finished result. Failed calls are not retained, so a later caller
+    retries them.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Tuple[str, str], "asyncio.Task[Any]"] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    @contextmanager
+    def bind(self) -> Iterator["CallMemo"]:
+        """Make this memo the active one for the current context."""
+        token = _active_memo.set(self)
+        try:
+            yield self
+        finally:
+            _active_memo.reset(token)
+
+    async def run(
+        self, namespace: str, args: Any, func: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run func once per (namespace, args) and share its result."""
+        key = (namespace, json.dumps(args, sort_keys=True, default=str))
+        task = self._calls.get(key)
+        if task is None or (
+            task.done() and (task.cancelled() or task.exception() is not None)
+        ):
+            self.calls += 1
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+        else:
+            self.deduplicated += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of executed and deduplicated calls."""
+        return {"calls": self.calls, "deduplicated": self.deduplicated}
+
+
+async def memoized_call(
+    namespace: str, args: Any, func: Callable[[], Awaitable[T]]
+) -> T:
+    """Run func through the active memo, or directly if there is none."""
+    memo = _active_memo.get()
+    if memo is None:
+        return await func()
+    return await memo.run(namespace, args, func)
+
+
+def memoize_tool(tool):
+    """
+    Route a StructuredTool's async implementation through the active memo.
+
+    Identical calls (same tool name and arguments) inside a memo scope then
+    reach the underlying API only once. The tool is modified in place.
+    """
+    coroutine = tool.coroutine
+    if coroutine is None:
+        return tool
+
+    @functools.wraps(coroutine)
+    async def memoized(**kwargs):
+        return await memoized_call(tool.name, kwargs, lambda: coroutine(**kwargs))
+
+    tool.coroutine = memoized
+    return tool
@@ -8,6 +8,9 @@ from dotenv import load_dotenv
 import os
 import requests
 
+from utils.http_client import get_session
+from utils.metrics import timed
+
 load_dotenv()  # Load environment variables from .env file
 
 
@@ -43,13 +46,14 @@ class CarRentalService:  # pylint: disable=too-few-public-methods
             "client_id": self.amadeus_api_key,
             "client_secret": self.amadeus_api_secret,
         }
-        response = requests.post(self.token_url, data=data, timeout=10)
+        response = get_session().post(self.token_url, data=data)
         if response.status_code != 200:
             raise requests.RequestException(
                 f"Failed to get Amadeus access token: {response.text}"
             )
         return response.json()["access_token"]
 
+    @timed("amadeus", "search_cars")
     def search_cars(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         start_location_code: str,
@@ -83,7 +87,7 @@ class CarRentalService:  # pylint: disable=too-few-public-methods
             "duration": duration,
             "passengers": passengers,
         }
-        response = requests.post(
+        response = get_session().post(
             self.base_url, headers=headers, json=params, timeout=30
         )
         print(f"Request URL: {response.url}")
@@ -5,10 +5,12 @@ with error handling and validation.
 """
 
 from __future__ import annotations
+import inspect
 import os
 from pathlib import Path
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Callable, List, Optional
 import logging
+import weakref
 from functools import lru_cache
 import yaml
 
@@ -18,6 +20,11 @@ DEFAULT_CONFIG_ENV = "CONFIG_PATH"
 DEFAULT_CONFIG_PATH = Path(os.getenv(DEFAULT_CONFIG_ENV, "config/config.yaml"))
 
 
+# Bound methods are held through weak references so that registering
+# obj.method does not keep obj alive for the lifetime of the process.
+_RELOAD_CALLBACKS: List[Callable[[], Optional[Callable[[], None]]]] = []
+
+
 class ConfigLoaderError(Exception):
     """Raised when configuration cannot be loaded or is invalid."""
 
@@ -52,6 +59,62 @@ def load_config(path: Union[str, Path] = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
 def reload_config(path: Union[str, Path] = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
     """
     Clear cache and reload configuration from disk.
+
+    Callbacks registered with register_reload_callback() are notified after
+    the cache is cleared so that objects derived from the configuration can
+    be invalidated.
     """
     load_config.cache_clear()
-    return load_config(path)
+    config = load_config(path)
+    for callback in _live_reload_callbacks():
+        try:
+            callback()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Config reload callback %r failed", callback)
+    return config
+
+
+def get_config_value(*keys: str, default: Any = None) -> Any:
+    """
+    Return a nested configuration value, or default if it is missing.
+
+    Example:
+        get_config_value("graph", "render_png", default=True)
+    """
+    try:
+        node: Any = load_config()
+    except ConfigLoaderError:
+        return default
+    for key in keys:
+        if not isinstance(node, dict) or key not in node:
+            return default
+        node = node[key]
+    return node
+
+
+def _live_reload_callbacks() -> List[Callable[[], None]]:
+    """Resolve registered callbacks, dropping those whose owner is gone."""
+    live = []
+    for ref in list(_RELOAD_CALLBACKS):
+        callback = ref()
+        if callback is None:
+            if ref in _RELOAD_CALLBACKS:
+                _RELOAD_CALLBACKS.remove(ref)
+        else:
+            live.append(callback)
+    return live
+
+
+def register_reload_callback(callback: Callable[[], None]) -> None:
+    """
+    Register a callable to be invoked whenever reload_config() runs.
+
+    Bound methods are only weakly referenced: the callback is dropped once
+    its object is garbage collected.
+    """
+    if callback in _live_reload_callbacks():
+        return
+    if inspect.ismethod(callback):
+        _RELOAD_CALLBACKS.append(weakref.WeakMethod(callback))
+    else:
+        _RELOAD_CALLBACKS.append(lambda: callback)
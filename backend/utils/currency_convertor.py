@@ -6,6 +6,8 @@ currencies using the ExchangeRate-API service.
 
 import requests
 
+from utils.http_client import get_async_client, get_session
+
 
 class CurrencyConverter:  # pylint: disable=too-few-public-methods
     """Currency converter using ExchangeRate-API service."""
@@ -16,12 +18,26 @@ class CurrencyConverter:  # pylint: disable=too-few-public-methods
     def convert(self, amount: float, from_currency: str, to_currency: str):
         """Convert the amount from one currency to another"""
         url = f"{self.base_url}/{from_currency}"
-        response = requests.get(url, timeout=10)
+        response = get_session().get(url)
+        if response.status_code != 200:
+            raise requests.RequestException(
+                f"API call failed: {response.status_code} {response.text}"
+            )
+        return self._apply_rate(amount, response.json(), to_currency)
+
+    async def aconvert(self, amount: float, from_currency: str, to_currency: str):
+        """Convert the amount from one currency to another without blocking"""
+        url = f"{self.base_url}/{from_currency}"
+        response = await get_async_client().get(url)
         if response.status_code != 200:
             raise requests.RequestException(
                 f"API call failed: {response.status_code} {response.text}"
             )
-        rates = response.json()["conversion_rates"]
+        return self._apply_rate(amount, response.json(), to_currency)
+
+    @staticmethod
+    def _apply_rate(amount: float, payload: dict, to_currency: str) -> float:
+        rates = payload["conversion_rates"]
         if to_currency not in rates:
             raise ValueError(f"{to_currency} not found in exchange rates.")
         return amount * rates[to_currency]
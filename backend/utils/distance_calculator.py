@@ -6,7 +6,7 @@ using the OpenRouteService API.
 
 from typing import Tuple, Optional
 
-import requests
+from utils.http_client import get_session
 
 
 def get_driving_distance(
@@ -23,7 +23,7 @@ def get_driving_distance(
             [end_coords[1], end_coords[0]],
         ]
     }
-    response = requests.post(url, json=body, headers=headers, timeout=15)
+    response = get_session().post(url, json=body, headers=headers, timeout=15)
     if response.status_code == 200:
         data = response.json()
         # distance in meters
@@ -0,0 +1,84 @@
+"""Bounded executor utility module.
+
+This module provides a shared, bounded thread pool for running blocking code
+(synchronous HTTP clients, file I/O, graph construction) from async endpoints
+without stalling the event loop, and a helper that fans independent blocking
+calls out over a few threads.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+from utils.config_loaders import get_config_value
+
+T = TypeVar("T")
+
+DEFAULT_BLOCKING_WORKERS = 16
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor, creating it on first use."""
+    global _executor  # pylint: disable=global-statement
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = int(
+                    get_config_value(
+                        "runtime", "blocking_workers", default=DEFAULT_BLOCKING_WORKERS
+                    )
+                )
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="blocking-io"
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking callable on the bounded executor and await its result.
+
+    Context variables are copied into the worker thread so per-request state
+    remains visible to the callable.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+def map_concurrently(
+    func: Callable[[Any], T], items: Sequence[Any], max_concurrency: int
+) -> List[T]:
+    """
+    Call func on every item from up to max_concurrency threads, keeping order.
+
+    Short-lived threads are used instead of the shared executor because the
+    callers usually already run on it, and waiting on the same bounded pool
+    for nested work could deadlock. Exceptions propagate from the first
+    failing item.
+    """
+    if len(items) <= 1 or max_concurrency <= 1:
+        return [func(item) for item in items]
+    contexts = [contextvars.copy_context() for _ in items]
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(items)), thread_name_prefix="fan-out"
+    ) as pool:
+        return list(
+            pool.map(lambda pair: pair[0].run(func, pair[1]), zip(contexts, items))
+        )
+
+
+def shutdown_executor() -> None:
+    """Shut down the executor; a new one is created on next use."""
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
@@ -0,0 +1,239 @@
+"""Persistent geocode cache utility module.
+
+This module provides a GeocodeCache class that remembers OpenRouteService
+geocoding answers keyed on the normalized address. Answers are kept in a
+SQLite database in WAL mode, so they survive restarts and every worker process
+on the host shares them, with a small in-memory LRU in front for hot lookups.
+Addresses the service could not find are cached too, for a shorter time.
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from utils.config_loaders import get_config_value
+from utils.executor import run_blocking
+from utils.ttl_cache import TTLCache
+
+Coordinates = Tuple[float, float]  # (lat, lon)
+
+DEFAULT_PATH = ".cache/geocode.sqlite3"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_NEGATIVE_TTL_SECONDS = 24 * 3600
+DEFAULT_MAX_CONCURRENCY = 8
+
+_WHITESPACE = re.compile(r"\s+")
+_EDGE_PUNCTUATION = re.compile(r"^[\s,.;]+|[\s,.;]+$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    key TEXT PRIMARY KEY,
+    lat REAL,
+    lon REAL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def geocode_concurrency() -> int:
+    """Maximum number of addresses one call may geocode at the same time."""
+    return int(
+        get_config_value(
+            "geocode_cache", "max_concurrency", default=DEFAULT_MAX_CONCURRENCY
+        )
+    )
+
+
+def normalize_address(address: str, country: Optional[str] = None) -> str:
+    """Build the cache key: case-folded, single-spaced text plus the country filter."""
+    text = _EDGE_PUNCTUATION.sub("", _WHITESPACE.sub(" ", address.casefold()))
+    return f"{text}|{country.upper()}" if country else text
+
+
+class GeocodeCache:  # pylint: disable=too-many-instance-attributes
+    """SQLite-backed geocode cache with an in-memory LRU front.
+
+    Attributes:
+        path (str): Database file, or ":memory:" for a private in-process cache
+        ttl_seconds (float): Lifetime of a found address
+        negative_ttl_seconds (float): Lifetime of an address that was not found
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str = DEFAULT_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        memory_entries: int = 4096,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        # Values are wrapped in a 1-tuple so a cached miss is not read as absent
+        self._memory: TTLCache[Tuple[Optional[Coordinates]]] = TTLCache(
+            max_entries=memory_entries, ttl_seconds=ttl_seconds, clock=clock
+        )
+        self._lock = threading.Lock()
+        self._db = self._connect()
+        self.hits = 0
+        self.negative_hits = 0
+        self.fetches = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Other workers may be writing; wait for their lock instead of failing
+        db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(_SCHEMA)
+        db.execute("DELETE FROM geocode WHERE expires_at <= ?", (self._clock(),))
+        db.commit()
+        return db
+
+    @classmethod
+    def from_config(cls) -> "GeocodeCache":
+        """Create a cache from the geocode_cache section of config.yaml."""
+        return cls(
+            path=get_config_value("geocode_cache", "path", default=DEFAULT_PATH),
+            ttl_seconds=float(
+                get_config_value(
+                    "geocode_cache", "ttl_seconds", default=DEFAULT_TTL_SECONDS
+                )
+            ),
+            negative_ttl_seconds=float(
+                get_config_value(
+                    "geocode_cache",
+                    "negative_ttl_seconds",
+                    default=DEFAULT_NEGATIVE_TTL_SECONDS,
+                )
+            ),
+            memory_entries=int(
+                get_config_value("geocode_cache", "memory_entries", default=4096)
+            ),
+        )
+
+    def get(self, key: str) -> Optional[Tuple[Optional[Coordinates]]]:
+        """
+        Look up a normalized key.
+
+        Returns:
+            tuple: (coordinates,) where coordinates is None for a cached miss,
+            or None when the key is not cached at all
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+        return self._get_stored(key)
+
+    def _get_stored(self, key: str) -> Optional[Tuple[Optional[Coordinates]]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT lat, lon, expires_at FROM geocode WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[2] <= self._clock():
+            return None
+        entry = (None,) if row[0] is None else ((row[0], row[1]),)
+        self._memory.set(key, entry, ttl_seconds=row[2] - self._clock())
+        return entry
+
+    def set(self, key: str, coords: Optional[Coordinates]) -> None:
+        """Store a geocoding answer; None records that the address was not found."""
+        ttl = self.ttl_seconds if coords is not None else self.negative_ttl_seconds
+        lat, lon = coords if coords is not None else (None, None)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)",
+                (key, lat, lon, self._clock() + ttl),
+            )
+            self._db.commit()
+        self._memory.set(key, (coords,), ttl_seconds=ttl)
+
+    def _hit(self, entry: Tuple[Optional[Coordinates]]) -> Optional[Coordinates]:
+        self.hits += 1
+        if entry[0] is None:
+            self.negative_hits += 1
+        return entry[0]
+
+    def get_or_fetch(
+        self,
+        address: str,
+        fetch: Callable[[], Optional[Coordinates]],
+        country: Optional[str] = None,
+    ) -> Optional[Coordinates]:
+        """
+        Return the cached coordinates of an address, geocoding it on a miss.
+
+        fetch should return None only when the service found nothing, and
+        raise on errors; errors propagate and are never cached.
+        """
+        key = normalize_address(address, country)
+        entry = self.get(key)
+        if entry is not None:
+            return self._hit(entry)
+        self.fetches += 1
+        coords = fetch()
+        self.set(key, coords)
+        return coords
+
+    async def aget_or_fetch(
+        self,
+        address: str,
+        fetch: Callable[[], Awaitable[Optional[Coordinates]]],
+        country: Optional[str] = None,
+    ) -> Optional[Coordinates]:
+        """
+        Async variant of get_or_fetch.
+
+        Only the in-memory LRU is checked on the event loop. SQLite reads and
+        writes may wait up to 5s for another worker's lock, so they run on the
+        shared executor.
+        """
+        key = normalize_address(address, country)
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = await run_blocking(self._get_stored, key)
+        if entry is not None:
+            return self._hit(entry)
+        self.fetches += 1
+        coords = await fetch()
+        await run_blocking(self.set, key, coords)
+        return coords
+
+    def clear(self) -> None:
+        """Drop every cached answer, in memory and on disk."""
+        with self._lock:
+            self._db.execute("DELETE FROM geocode")
+            self._db.commit()
+        self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/fetch counters and the number of stored addresses."""
+        with self._lock:
+            stored = self._db.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "fetches": self.fetches,
+            "stored": stored,
+            "memory": self._memory.stats(),
+        }
+
+
+_cache: Optional[GeocodeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_geocode_cache() -> GeocodeCache:
+    """Return the process-wide geocode cache, opening it on first use."""
+    global _cache  # pylint: disable=global-statement
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = GeocodeCache.from_config()
+    return _cache
@@ -0,0 +1,127 @@
+"""Vectorized geodesic distance utility module.
+
+This module provides NumPy haversine functions that compute great-circle
+distances for one pair, one point against many, or full pairwise matrices in a
+single call. A road factor converts straight-line distance into an estimate of
+driving distance.
+
+Run it directly for a benchmark against the scalar ``math`` loop:
+
+    python -m utils.geodesic
+"""
+
+import math
+import time
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+# Roads are on average about 20% longer than the straight line
+DEFAULT_ROAD_FACTOR = 1.2
+
+
+def haversine_km(lat1, lon1, lat2, lon2, road_factor: float = 1.0) -> np.ndarray:
+    """
+    Great-circle distance in km between points given in degrees.
+
+    Arguments broadcast like NumPy arrays, so any mix of scalars and arrays
+    works. The result is multiplied by road_factor.
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(v) for v in (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    central_angle = 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    return EARTH_RADIUS_KM * road_factor * central_angle
+
+
+def distance_km(
+    coord1: Tuple[float, float], coord2: Tuple[float, float], road_factor: float = 1.0
+) -> float:
+    """Distance in km between two (lat, lon) points."""
+    return float(haversine_km(*coord1, *coord2, road_factor=road_factor))
+
+
+def distances_from(
+    origin: Tuple[float, float],
+    points: Sequence[Tuple[float, float]],
+    road_factor: float = 1.0,
+) -> np.ndarray:
+    """
+    Distances in km from one (lat, lon) origin to N points.
+
+    Args:
+        origin: The (lat, lon) origin
+        points: An N x 2 array-like of (lat, lon) rows
+
+    Returns:
+        np.ndarray: N distances
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return haversine_km(
+        origin[0], origin[1], points[:, 0], points[:, 1], road_factor=road_factor
+    )
+
+
+def pairwise_km(
+    points_a: Sequence[Tuple[float, float]],
+    points_b: Optional[Sequence[Tuple[float, float]]] = None,
+    road_factor: float = 1.0,
+) -> np.ndarray:
+    """
+    Full distance matrix in km between two sets of (lat, lon) points.
+
+    Args:
+        points_a: An M x 2 array-like of (lat, lon) rows
+        points_b: An N x 2 array-like; defaults to points_a (distance table)
+
+    Returns:
+        np.ndarray: M x N distances
+    """
+    a = np.asarray(points_a, dtype=np.float64).reshape(-1, 2)
+    b = a if points_b is None else np.asarray(points_b, np.float64).reshape(-1, 2)
+    return haversine_km(
+        a[:, 0, None], a[:, 1, None], b[None, :, 0], b[None, :, 1], road_factor
+    )
+
+
+def _scalar_haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def _benchmark(pairs: int, seed: int = 0) -> Tuple[float, float, float]:
+    """Return scalar seconds, vectorized seconds and the max absolute difference."""
+    rng = np.random.default_rng(seed)
+    lat1, lat2 = rng.uniform(-90, 90, (2, pairs))
+    lon1, lon2 = rng.uniform(-180, 180, (2, pairs))
+
+    started = time.perf_counter()
+    scalar = [
+        _scalar_haversine_km(*row)
+        for row in zip(lat1.tolist(), lon1.tolist(), lat2.tolist(), lon2.tolist())
+    ]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    vectorized = haversine_km(lat1, lon1, lat2, lon2)
+    vectorized_seconds = time.perf_counter() - started
+
+    max_error = float(np.max(np.abs(vectorized - np.asarray(scalar))))
+    return scalar_seconds, vectorized_seconds, max_error
+
+
+if __name__ == "__main__":
+    print(f"{'pairs':>10} {'scalar (ms)':>12} {'numpy (ms)':>11} {'speedup':>8}")
+    for n_pairs in (10_000, 1_000_000):
+        loop_s, numpy_s, error = _benchmark(n_pairs)
+        print(
+            f"{n_pairs:>10,} {loop_s * 1000:>12.1f} {numpy_s * 1000:>11.1f} "
+            f"{loop_s / numpy_s:>7.0f}x  (max diff {error:.1e} km)"
+        )
@@ -0,0 +1,258 @@
+"""Pooled HTTP transport utility module.
+
+This module provides the shared HTTP clients used for every upstream API call:
+a requests.Session for synchronous code and an httpx.AsyncClient per event loop
+for async tool implementations. Both keep connections alive in per-host pools,
+cap concurrent requests per host, apply a default timeout and retry connection
+failures and 429/5xx answers with jittered exponential backoff.
+"""
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Callable, Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.config_loaders import get_config_value
+
+DEFAULT_TIMEOUT = 10.0
+# Statuses worth another attempt; everything else is returned to the caller
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Upstream POSTs (routing, matrix, Amadeus search) are read-only queries
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "POST"})
+MAX_RETRY_AFTER_SECONDS = 10.0
+
+_clients: "weakref.WeakKeyDictionary[object, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_session: Optional["PooledSession"] = None
+_session_lock = threading.Lock()
+
+
+def _setting(key: str, default):
+    return get_config_value("http", key, default=default)
+
+
+def _backoff_delay(attempt: int, backoff_seconds: float) -> float:
+    """Full-jitter exponential backoff: uniform(0, backoff * 2**attempt)."""
+    return random.uniform(0, backoff_seconds * 2**attempt)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        parsed = email.utils.parsedate_to_datetime(value)
+        seconds = parsed.timestamp() - time.time() if parsed else 0.0
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry that waits at most MAX_RETRY_AFTER_SECONDS for Retry-After.
+
+    urllib3 otherwise sleeps for the server's full Retry-After, holding a
+    blocking worker thread for as long as the upstream asks.
+    """
+
+    def get_retry_after(self, response) -> Optional[float]:
+        seconds = super().get_retry_after(response)
+        if seconds is None:
+            return None
+        return min(seconds, MAX_RETRY_AFTER_SECONDS)
+
+
+class PooledSession(requests.Session):
+    """requests.Session with keep-alive pools, host limits, retries and a timeout.
+
+    Attributes:
+        timeout (float): Timeout used when a call does not pass one
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = 10,
+        retries: int = 2,
+        backoff_seconds: float = 0.3,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        super().__init__()
+        self.timeout = timeout
+        retry = _CappedRetry(
+            total=retries,
+            connect=retries,
+            read=0,  # a slow upstream is not retried into an even slower answer
+            status=retries,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            backoff_factor=backoff_seconds,
+            backoff_jitter=backoff_seconds,
+            raise_on_status=False,
+        )
+        # urllib3 keeps one pool per host; blocking on a full pool makes its
+        # size the per-host concurrency limit
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=max_per_host,
+            pool_block=True,
+            max_retries=retry,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, *args, **kwargs)
+
+
+def get_session() -> PooledSession:
+    """Return the process-wide pooled session used by synchronous clients."""
+    global _session  # pylint: disable=global-statement
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = PooledSession(
+                    max_per_host=int(_setting("max_connections_per_host", 10)),
+                    retries=int(_setting("retries", 2)),
+                    backoff_seconds=float(_setting("backoff_seconds", 0.3)),
+                    timeout=float(_setting("timeout_seconds", DEFAULT_TIMEOUT)),
+                )
+    return _session
+
+
+def close_session() -> None:
+    """Close the pooled session's connections (called on shutdown)."""
+    global _session  # pylint: disable=global-statement
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that runs a callback once when it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Optional[Callable[[], None]] = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close, on_close = None, self._on_close
+                on_close()
+
+
+class _LimitedAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport adding per-host limits and jittered retries."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_per_host: int,
+        retries: int,
+        backoff_seconds: float,
+    ):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._retries = retries
+        self._backoff_seconds = backoff_seconds
+        # The client is per event loop, so plain asyncio semaphores are safe
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.netloc.decode("ascii")
+        semaphore = self._semaphores.setdefault(
+            host, asyncio.Semaphore(self._max_per_host)
+        )
+        retries = self._retries if request.method in RETRY_METHODS else 0
+        await semaphore.acquire()
+        try:
+            for attempt in range(retries):
+                try:
+                    response = await self._transport.handle_async_request(request)
+                except (httpx.ConnectError, httpx.ConnectTimeout):
+                    delay = _backoff_delay(attempt, self._backoff_seconds)
+                else:
+                    if response.status_code not in RETRY_STATUSES:
+                        break
+                    delay = _retry_after(response)
+                    if delay is None:
+                        delay = _backoff_delay(attempt, self._backoff_seconds)
+                    # Reading the short error body keeps the connection reusable
+                    await response.aread()
+                    await response.aclose()
+                await asyncio.sleep(delay)
+            else:
+                response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        # The slot is held until the caller has finished reading the body
+        response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def build_async_client(
+    max_per_host: int = 10,
+    retries: int = 2,
+    backoff_seconds: float = 0.3,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> httpx.AsyncClient:
+    """Create an AsyncClient with the same pooling and retry policy as the session."""
+    limits = httpx.Limits(
+        max_connections=int(_setting("max_connections", 100)),
+        max_keepalive_connections=int(_setting("max_keepalive_connections", 20)),
+    )
+    transport = _LimitedAsyncTransport(
+        httpx.AsyncHTTPTransport(limits=limits),
+        max_per_host=max_per_host,
+        retries=retries,
+        backoff_seconds=backoff_seconds,
+    )
+    return httpx.AsyncClient(transport=transport, timeout=timeout)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the pooled AsyncClient bound to the running event loop.
+
+    httpx connection pools cannot be shared between event loops, so one client
+    is kept per loop and dropped together with it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = build_async_client(
+            max_per_host=int(_setting("max_connections_per_host", 10)),
+            retries=int(_setting("retries", 2)),
+            backoff_seconds=float(_setting("backoff_seconds", 0.3)),
+            timeout=float(_setting("timeout_seconds", DEFAULT_TIMEOUT)),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the pooled client of the running event loop (called on shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -0,0 +1,188 @@
+"""Background job queue utility module.
+
+This module provides a JobManager class that runs travel planning jobs on a
+fixed number of asyncio workers fed by a bounded queue. Submissions beyond the
+queue capacity are rejected so callers can apply backpressure, and finished
+results are retained for a limited time.
+"""
+
+import asyncio
+import math
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from utils.config_loaders import get_config_value
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+    def __init__(self, retry_after_seconds: int):
+        super().__init__(f"Job queue is full; retry after {retry_after_seconds}s")
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass
+class Job:  # pylint: disable=too-many-instance-attributes
+    """State of a submitted job.
+
+    Attributes:
+        job_id: Unique identifier returned to the client
+        payload: Input passed to the job runner
+        status: One of "queued", "running", "succeeded", "failed"
+        result: Runner return value once succeeded
+        error: Error message once failed
+    """
+
+    job_id: str
+    payload: Any
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the client-facing representation of the job."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobManager:  # pylint: disable=too-many-instance-attributes
+    """Fixed-size worker pool with a bounded queue and TTL-based result retention."""
+
+    def __init__(
+        self,
+        runner: Callable[[Any], Awaitable[Any]],
+        workers: int = 4,
+        max_queue_size: int = 100,
+        result_ttl_seconds: float = 3600,
+    ):
+        self._runner = runner
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.result_ttl_seconds = result_ttl_seconds
+        self._jobs: Dict[str, Job] = {}
+        self._queue: Optional["asyncio.Queue[Job]"] = None
+        self._worker_tasks: List["asyncio.Task[None]"] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._average_duration: Optional[float] = None
+        self.rejected = 0
+
+    @classmethod
+    def from_config(cls, runner: Callable[[Any], Awaitable[Any]]) -> "JobManager":
+        """Create a manager from the jobs section of config.yaml."""
+        return cls(
+            runner,
+            workers=int(get_config_value("jobs", "workers", default=4)),
+            max_queue_size=int(get_config_value("jobs", "max_queue_size", default=100)),
+            result_ttl_seconds=float(
+                get_config_value("jobs", "result_ttl_seconds", default=3600)
+            ),
+        )
+
+    def start(self) -> None:
+        """Start the workers on the running event loop (idempotent)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker_tasks:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker_tasks = [
+            loop.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers; queued jobs are abandoned."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._loop = None
+
+    def _retry_after(self) -> int:
+        average = self._average_duration or 30.0
+        depth = self._queue.qsize() if self._queue else 0
+        return max(1, math.ceil(average * (depth + 1) / self.workers))
+
+    def submit(self, payload: Any) -> Job:
+        """
+        Queue a job for execution.
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+        """
+        self.start()
+        self._purge_expired()
+        job = Job(job_id=uuid.uuid4().hex, payload=payload)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull as e:
+            self.rejected += 1
+            raise QueueFullError(self._retry_after()) from e
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if unknown or expired."""
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    def _purge_expired(self) -> None:
+        cutoff = time.time() - self.result_ttl_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.started_at = time.time()
+            try:
+                job.result = await self._runner(job.payload)
+                job.status = "succeeded"
+            except asyncio.CancelledError:
+                job.status = "failed"
+                job.error = "Job was cancelled"
+                raise
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                job.status = "failed"
+                job.error = str(e)
+            finally:
+                job.finished_at = time.time()
+                duration = job.finished_at - job.started_at
+                self._average_duration = (
+                    duration
+                    if self._average_duration is None
+                    else 0.8 * self._average_duration + 0.2 * duration
+                )
+                self._queue.task_done()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, worker count and job counts by status."""
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "workers": self.workers,
+            "queue_size": self._queue.qsize() if self._queue else 0,
+            "max_queue_size": self.max_queue_size,
+            "rejected": self.rejected,
+            "jobs": counts,
+        }
@@ -0,0 +1,262 @@
+"""Prometheus metrics utility module.
+
+This module provides lightweight Counter and Histogram classes, a registry
+that renders them in the Prometheus text exposition format for GET /metrics,
+and a `timed` helper that measures an operation once and reports it both to
+the histograms and to the current request's StageTimer (Server-Timing).
+"""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from utils.config_loaders import get_config_value
+from utils.timing import current_timer
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _format_labels(labelnames: Sequence[str], values: Tuple[str, ...]) -> str:
+    if not labelnames:
+        return ""
+    pairs = []
+    for name, value in zip(labelnames, values):
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase the counter for the given labels."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given labels."""
+        return self._values.get(tuple(str(labels[n]) for n in self.labelnames), 0)
+
+    def render(self) -> List[str]:
+        """Return the exposition lines for this counter."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {value}"
+            for key, value in items
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for the given labels."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[key] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for the given labels."""
+        series = self._series.get(tuple(str(labels[n]) for n in self.labelnames))
+        return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        """Return the exposition lines for this histogram."""
+        with self._lock:
+            items = sorted(
+                (key, (list(counts), total[0]))
+                for key, (counts, total) in self._series.items()
+            )
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            bounds = [*(repr(float(b)) for b in self.buckets), "+Inf"]
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    (*self.labelnames, "le"), (*key, bound.removesuffix(".0"))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the process's metrics and renders them for scraping."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create, or return the existing, counter called `name`."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create, or return the existing, histogram called `name`."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+OPERATION_SECONDS = REGISTRY.histogram(
+    "travel_planner_operation_duration_seconds",
+    "Duration of graph builds, LLM calls, tool calls and external API calls.",
+    ("component", "operation"),
+)
+OPERATION_ERRORS = REGISTRY.counter(
+    "travel_planner_operation_errors_total",
+    "Operations that raised an exception.",
+    ("component", "operation"),
+)
+REQUEST_STAGE_SECONDS = REGISTRY.histogram(
+    "travel_planner_request_stage_duration_seconds",
+    "Duration of the stages of a travel planning request.",
+    ("endpoint", "stage"),
+)
+REQUESTS = REGISTRY.counter(
+    "travel_planner_requests_total",
+    "Travel planning requests by endpoint and outcome.",
+    ("endpoint", "outcome"),
+)
+
+_enabled = bool(get_config_value("metrics", "enabled", default=True))
+
+
+def set_enabled(enabled: bool) -> None:
+    """Switch metric collection on or off at runtime."""
+    global _enabled  # pylint: disable=global-statement
+    _enabled = enabled
+
+
+def metrics_enabled() -> bool:
+    """Return whether metrics are being collected."""
+    return _enabled
+
+
+@contextmanager
+def timed(component: str, operation: str) -> Iterator[None]:
+    """
+    Measure the enclosed block (or decorated function) as one operation.
+
+    The duration goes to the operation histogram, failures to the error
+    counter, and the request's StageTimer receives it as "component.operation".
+    """
+    if not _enabled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        OPERATION_ERRORS.inc(component=component, operation=operation)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        OPERATION_SECONDS.observe(elapsed, component=component, operation=operation)
+        timer = current_timer()
+        if timer is not None:
+            timer.add(f"{component}.{operation}", elapsed)
+
+
+def observe_request(endpoint: str, outcome: str, timings: Dict[str, float]) -> None:
+    """Record a finished request's stage timings (in ms) and outcome."""
+    if not _enabled:
+        return
+    REQUESTS.inc(endpoint=endpoint, outcome=outcome)
+    for stage, duration_ms in timings.items():
+        REQUEST_STAGE_SECONDS.observe(
+            duration_ms / 1000, endpoint=endpoint, stage=stage
+        )
+
+
+def instrument_tool(tool):
+    """
+    Time every invocation of a StructuredTool under component "tool".
+
+    Both the sync and the async implementation are wrapped. The tool is
+    modified in place.
+    """
+    func, coroutine = tool.func, tool.coroutine
+
+    if func is not None:
+
+        @functools.wraps(func)
+        def timed_func(*args, **kwargs):
+            with timed("tool", tool.name):
+                return func(*args, **kwargs)
+
+        tool.func = timed_func
+
+    if coroutine is not None:
+
+        @functools.wraps(coroutine)
+        async def timed_coroutine(*args, **kwargs):
+            with timed("tool", tool.name):
+                return await coroutine(*args, **kwargs)
+
+        tool.coroutine = timed_coroutine
+    return tool
@@ -5,7 +5,7 @@ using the Tavily search engine, including attractions, restaurants, activities,
 and transportation options.
 """
 
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Union
 
 from langchain_tavily import TavilySearch
 
@@ -17,61 +17,87 @@ class TavilyPlaceSearchTool:
         if not tavily_api_key:
             raise ValueError("Tavily API key not provided.")
         self.tavily_api_key = tavily_api_key
+        self._tavily_tool: Optional[TavilySearch] = None
+
+    @property
+    def tavily_tool(self) -> TavilySearch:
+        """Lazily created TavilySearch instance shared by all searches."""
+        if self._tavily_tool is None:
+            self._tavily_tool = TavilySearch(
+                api_key=self.tavily_api_key, topic="general", include_answer="advanced"
+            )
+        return self._tavily_tool
+
+    @staticmethod
+    def _extract_answer(result: Any) -> Union[str, Dict[str, Any]]:
+        if isinstance(result, dict) and result.get("answer"):
+            return result["answer"]
+        return result
+
+    def _search(self, query: str) -> Union[str, Dict[str, Any]]:
+        return self._extract_answer(self.tavily_tool.invoke({"query": query}))
+
+    async def _asearch(self, query: str) -> Union[str, Dict[str, Any]]:
+        return self._extract_answer(await self.tavily_tool.ainvoke({"query": query}))
+
+    @staticmethod
+    def _attractions_query(place: str) -> str:
+        return f"top attractive places in and around {place}"
+
+    @staticmethod
+    def _restaurants_query(place: str) -> str:
+        return f"what are the top 10 restaurants and eateries in and around {place}."
+
+    @staticmethod
+    def _activity_query(place: str) -> str:
+        return f"activities in and around {place}"
+
+    @staticmethod
+    def _transportation_query(place: str) -> str:
+        return f"What are the different modes of transportations available in {place}"
 
     def tavily_search_attractions(self, place: str) -> Union[str, Dict[str, Any]]:
         """
         Searches for attractions in the specified place using TavilySearch.
         """
-        tavily_tool = TavilySearch(
-            api_key=self.tavily_api_key, topic="general", include_answer="advanced"
-        )
-        result = tavily_tool.invoke(
-            {"query": f"top attractive places in and around {place}"}
-        )
-        if isinstance(result, dict) and result.get("answer"):
-            return result["answer"]
-        return result
+        return self._search(self._attractions_query(place))
 
     def tavily_search_restaurants(self, place: str) -> Union[str, Dict[str, Any]]:
         """
         Searches for available restaurants in the specified place using TavilySearch.
         """
-        tavily_tool = TavilySearch(
-            api_key=self.tavily_api_key, topic="general", include_answer="advanced"
-        )
-        result = tavily_tool.invoke(
-            {
-                "query": f"what are the top 10 restaurants and eateries in and around {place}."
-            }
-        )
-        if isinstance(result, dict) and result.get("answer"):
-            return result["answer"]
-        return result
+        return self._search(self._restaurants_query(place))
 
     def tavily_search_activity(self, place: str) -> Union[str, Dict[str, Any]]:
         """
         Searches for popular activities in the specified place using TavilySearch.
         """
-        tavily_tool = TavilySearch(
-            api_key=self.tavily_api_key, topic="general", include_answer="advanced"
-        )
-        result = tavily_tool.invoke({"query": f"activities in and around {place}"})
-        if isinstance(result, dict) and result.get("answer"):
-            return result["answer"]
-        return result
+        return self._search(self._activity_query(place))
 
     def tavily_search_transportation(self, place: str) -> Union[str, Dict[str, Any]]:
         """
         Searches for available modes of transportation in the specified place using TavilySearch.
         """
-        tavily_tool = TavilySearch(
-            api_key=self.tavily_api_key, topic="general", include_answer="advanced"
-        )
-        result = tavily_tool.invoke(
-            {
-                "query": f"What are the different modes of transportations available in {place}"
-            }
-        )
-        if isinstance(result, dict) and result.get("answer"):
-            return result["answer"]
-        return result
+        return self._search(self._transportation_query(place))
+
+    async def atavily_search_attractions(
+        self, place: str
+    ) -> Union[str, Dict[str, Any]]:
+        """Async variant of tavily_search_attractions."""
+        return await self._asearch(self._attractions_query(place))
+
+    async def atavily_search_restaurants(
+        self, place: str
+    ) -> Union[str, Dict[str, Any]]:
+        """Async variant of tavily_search_restaurants."""
+        return await self._asearch(self._restaurants_query(place))
+
+    async def atavily_search_activity(self, place: str) -> Union[str, Dict[str, Any]]:
+        """Async variant of tavily_search_activity."""
+        return await self._asearch(self._activity_query(place))
+
+    async def atavily_search_transportation(
+        self, place: str
+    ) -> Union[str, Dict[str, Any]]:
+        """Async variant of tavily_search_transportation."""
+        return await self._asearch(self._transportation_query(place))
@@ -0,0 +1,130 @@
+"""Travel plan response cache utility module.
+
+This module provides a ResponseCache class that stores finished /query answers
+keyed on the normalized query text and trip parameters, so near-identical
+requests are answered without re-running the agent.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Optional
+
+from utils.config_loaders import get_config_value
+from utils.ttl_cache import TTLCache
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?]+$")
+
+
+def normalize_query_text(text: Optional[str]) -> str:
+    """Lower-case, collapse whitespace and drop trailing punctuation."""
+    if not text:
+        return ""
+    text = _WHITESPACE.sub(" ", text.strip().lower())
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+def _normalize_code(code: Optional[str]) -> str:
+    return (code or "").strip().upper()
+
+
+def _normalize_city(city: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", (city or "").strip().lower())
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def build_cache_key(
+    query_text: Optional[str],
+    budget_preference: str,
+    start_location_code: Optional[str] = None,
+    end_location_code: Optional[str] = None,
+    start_city: Optional[str] = None,
+    end_city: Optional[str] = None,
+) -> str:
+    """Build a stable cache key from the normalized trip parameters."""
+    parts = [
+        normalize_query_text(query_text),
+        (budget_preference or "").strip().lower(),
+        _normalize_code(start_location_code),
+        _normalize_code(end_location_code),
+        _normalize_city(start_city),
+        _normalize_city(end_city),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """TTL + LRU cache of travel plan answers with bypass/refresh accounting."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        ttl_seconds: float = 3600,
+        max_entries: int = 512,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+    ):
+        self.enabled = enabled
+        self._cache: TTLCache[str] = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            sizeof=lambda answer: len(answer.encode("utf-8")),
+        )
+        self.bypasses = 0
+        self.refreshes = 0
+
+    @classmethod
+    def from_config(cls) -> "ResponseCache":
+        """Create a cache from the response_cache section of config.yaml."""
+        return cls(
+            enabled=bool(get_config_value("response_cache", "enabled", default=True)),
+            ttl_seconds=float(
+                get_config_value("response_cache", "ttl_seconds", default=3600)
+            ),
+            max_entries=int(
+                get_config_value("response_cache", "max_entries", default=512)
+            ),
+            max_bytes=get_config_value(
+                "response_cache", "max_bytes", default=64 * 1024 * 1024
+            ),
+        )
+
+    def lookup(self, key: str, bypass: bool = False, refresh: bool = False):
+        """
+        Return the cached answer for key, honouring the bypass/refresh flags.
+
+        Args:
+            key (str): Cache key from build_cache_key()
+            bypass (bool): Skip the cache entirely for this request
+            refresh (bool): Ignore the cached answer but store the new one
+
+        Returns:
+            str: The cached answer, or None when the agent must run
+        """
+        if not self.enabled:
+            return None
+        if bypass:
+            self.bypasses += 1
+            return None
+        if refresh:
+            self.refreshes += 1
+            return None
+        return self._cache.get(key)
+
+    def store(self, key: str, answer: str, bypass: bool = False) -> None:
+        """Store an answer unless the cache is disabled or bypassed."""
+        if self.enabled and not bypass:
+            self._cache.set(key, answer)
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, bypass/refresh counts and occupancy."""
+        return {
+            "enabled": self.enabled,
+            **self._cache.stats(),
+            "bypasses": self.bypasses,
+            "refreshes": self.refreshes,
+        }
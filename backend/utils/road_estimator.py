@@ -0,0 +1,215 @@
+"""Offline road distance estimator utility module.
+
+This module provides a RoadEstimator class that turns the great-circle
+distance between two points into an estimated driving distance and duration
+without any network call. The circuity factor (road length over straight-line
+length) and the average speed depend on the region, found from the country of
+the nearest airport, and on whether the trip is urban or intercity.
+
+The factors below are starting values; accuracy_report() compares estimates
+with the real routes in the route cache so they can be tuned.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.airport_store import get_airport_store
+from utils.config_loaders import get_config_value
+from utils.geodesic import distance_km
+from utils.route_cache import RouteCache
+from utils.spatial_index import get_spatial_index
+
+Coordinates = Tuple[float, float]  # (lat, lon)
+
+# "exact" routes with OpenRouteService; "estimate" never leaves the process
+ROUTING_MODES = ("exact", "estimate")
+# Trips shorter than this (straight-line) use the urban profile
+DEFAULT_URBAN_RADIUS_KM = 25.0
+
+
+@dataclass(frozen=True)
+class RoadProfile:
+    """Circuity factors and average speeds (km/h) of one region."""
+
+    urban_circuity: float
+    intercity_circuity: float
+    urban_speed_kmh: float
+    intercity_speed_kmh: float
+
+
+REGION_PROFILES: Dict[str, RoadProfile] = {
+    "north_america": RoadProfile(1.35, 1.20, 35, 85),
+    "europe": RoadProfile(1.40, 1.25, 30, 80),
+    "east_asia": RoadProfile(1.40, 1.25, 28, 75),
+    "southeast_asia": RoadProfile(1.45, 1.30, 22, 55),
+    "south_asia": RoadProfile(1.50, 1.35, 20, 50),
+    "middle_east": RoadProfile(1.35, 1.25, 35, 85),
+    "africa": RoadProfile(1.50, 1.35, 22, 55),
+    "latin_america": RoadProfile(1.45, 1.30, 25, 65),
+    "oceania": RoadProfile(1.40, 1.25, 35, 85),
+    "default": RoadProfile(1.40, 1.30, 30, 70),
+}
+
+_REGION_COUNTRIES = {
+    "north_america": "US CA GL PM BM UM",
+    "europe": (
+        "AL AT BA BE BG BY CH CY CZ DE DK EE ES FI FO FR GB GG GI GR HR HU IE "
+        "IM IS IT JE LT LU LV MD ME MK MT NL NO PL PT RO RS RU SE SI SK UA XK"
+    ),
+    "east_asia": "CN HK JP KP KR MN MO TW",
+    "southeast_asia": "BN ID KH LA MM MY PH SG TH TL VN",
+    "south_asia": "AF BD BT IN LK MV NP PK",
+    "middle_east": "AE AM AZ BH GE IL IQ IR JO KW LB OM QA SA SY TR YE",
+    "africa": (
+        "AO BF BI BJ BW CD CF CG CI CM CV DJ DZ EG EH ER ET GA GH GM GN GQ GW "
+        "KE KM LR LS LY MA MG ML MR MU MW MZ NA NE NG RE RW SC SD SH SL SN SO "
+        "SS ST SZ TD TG TN TZ UG YT ZA ZM ZW"
+    ),
+    "latin_america": (
+        "AG AI AR AW BB BL BO BQ BR BS BZ CL CO CR CU CW DM DO EC FK GD GF GP "
+        "GT GY HN HT JM KN KY LC MF MQ MS MX NI PA PE PY SR SV SX TC TT UY VC "
+        "VE VG"
+    ),
+    "oceania": (
+        "AS AU CC CK CX FJ FM GU KI MH MP NC NF NR NU NZ PF PG PW SB TO TV VU WF WS"
+    ),
+}
+COUNTRY_REGIONS: Dict[str, str] = {
+    country: region
+    for region, countries in _REGION_COUNTRIES.items()
+    for country in countries.split()
+}
+
+
+@dataclass(frozen=True)
+class RoadEstimate:
+    """Estimated driving distance (km) and duration (s) between two points."""
+
+    distance_km: float
+    duration_s: float
+    region: str
+    urban: bool
+
+
+class RoadEstimator:
+    """Region-aware straight-line to road distance and duration estimator.
+
+    Attributes:
+        urban_radius_km (float): Straight-line length below which a trip is urban
+    """
+
+    def __init__(self, urban_radius_km: float = DEFAULT_URBAN_RADIUS_KM):
+        self.urban_radius_km = urban_radius_km
+        self._store = get_airport_store()
+        self._spatial_index = get_spatial_index()
+
+    def region(self, point: Coordinates) -> str:
+        """Region of a point, from the country of its nearest airport."""
+        nearest = self._spatial_index.nearest(*point, k=1)
+        if not nearest:
+            return "default"
+        country = self._store.value(nearest[0][0], "country")
+        return COUNTRY_REGIONS.get(country, "default")
+
+    def estimate(self, start: Coordinates, end: Coordinates) -> RoadEstimate:
+        """Estimate the driving distance and duration between two points."""
+        region = self.region(start)
+        profile = REGION_PROFILES[region]
+        straight_km = distance_km(start, end)
+        urban = straight_km <= self.urban_radius_km
+        if urban:
+            circuity, speed = profile.urban_circuity, profile.urban_speed_kmh
+        else:
+            circuity, speed = profile.intercity_circuity, profile.intercity_speed_kmh
+        road_km = straight_km * circuity
+        return RoadEstimate(
+            distance_km=round(road_km, 2),
+            duration_s=round(road_km / speed * 3600, 1),
+            region=region,
+            urban=urban,
+        )
+
+    def offline_route(
+        self, start: Coordinates, end: Coordinates, route_cache: RouteCache
+    ) -> Tuple[float, float]:
+        """
+        Best answer available without a routing call.
+
+        A real route from the route cache wins; otherwise the estimate is used.
+
+        Returns:
+            tuple: (distance in km, duration in seconds)
+        """
+        estimate = self.estimate(start, end)
+        cached = route_cache.get(start, end, estimates=False)
+        if cached is None:
+            return estimate.distance_km, estimate.duration_s
+        return cached.distance_km, cached.duration_s or estimate.duration_s
+
+    def accuracy_report(self, route_cache: RouteCache) -> Dict[str, Any]:
+        """
+        Compare estimates with the real routes currently in the route cache.
+
+        Errors are relative to the routed value: mean absolute error (mape)
+        and mean signed error (bias, positive when estimates run long), in %.
+
+        Returns:
+            dict: Overall and per-region/profile error summaries
+        """
+        groups: Dict[str, List[Tuple[float, Optional[float]]]] = {}
+        overall: List[Tuple[float, Optional[float]]] = []
+        for start, end, route in route_cache.routes():
+            if route.distance_km <= 0:
+                continue
+            estimate = self.estimate(start, end)
+            distance_error = estimate.distance_km / route.distance_km - 1
+            duration_error = (
+                estimate.duration_s / route.duration_s - 1 if route.duration_s else None
+            )
+            sample = (distance_error, duration_error)
+            profile = "urban" if estimate.urban else "intercity"
+            groups.setdefault(f"{estimate.region}/{profile}", []).append(sample)
+            overall.append(sample)
+        return {
+            **_summarize(overall),
+            "groups": {name: _summarize(group) for name, group in groups.items()},
+        }
+
+
+def _summarize(samples: List[Tuple[float, Optional[float]]]) -> Dict[str, Any]:
+    def percent(errors: List[float]) -> Dict[str, Optional[float]]:
+        if not errors:
+            return {"mape": None, "bias": None}
+        return {
+            "mape": round(100 * sum(abs(e) for e in errors) / len(errors), 1),
+            "bias": round(100 * sum(errors) / len(errors), 1),
+        }
+
+    return {
+        "routes": len(samples),
+        "distance": percent([d for d, _ in samples]),
+        "duration": percent([t for _, t in samples if t is not None]),
+    }
+
+
+_estimator: Optional[RoadEstimator] = None
+_estimator_lock = threading.Lock()
+
+
+def get_road_estimator() -> RoadEstimator:
+    """Return the process-wide road estimator, creating it on first use."""
+    global _estimator  # pylint: disable=global-statement
+    if _estimator is None:
+        with _estimator_lock:
+            if _estimator is None:
+                _estimator = RoadEstimator(
+                    urban_radius_km=float(
+                        get_config_value(
+                            "road_estimator",
+                            "urban_radius_km",
+                            default=DEFAULT_URBAN_RADIUS_KM,
+                        )
+                    )
+                )
+    return _estimator
@@ -0,0 +1,151 @@
+"""Driving route cache utility module.
+
+This module provides a RouteCache class that remembers driving distances and
+durations between coordinate pairs. Keys are the two points rounded to a
+configurable number of decimals and put in a fixed order, so A -> B and B -> A,
+and points a few metres apart, share one entry.
+
+Offline estimates used when routing fails are kept in a separate,
+shorter-lived cache: they stop a failing pair from being retried on every
+request, but a real route always takes precedence over them.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.config_loaders import get_config_value
+from utils.ttl_cache import TTLCache
+
+Coordinates = Tuple[float, float]  # (lat, lon)
+RouteKey = Tuple[Coordinates, Coordinates]
+
+
+@dataclass(frozen=True)
+class CachedRoute:
+    """A cached driving distance (km) and duration (s, None if unknown)."""
+
+    distance_km: float
+    duration_s: Optional[float] = None
+    estimated: bool = False
+
+
+class RouteCache:
+    """TTL + LRU cache of driving routes keyed by quantized, unordered endpoints.
+
+    Attributes:
+        enabled (bool): When False every lookup misses and nothing is stored
+        precision (int): Decimals coordinates are rounded to (3 is about 100 m)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        enabled: bool = True,
+        precision: int = 3,
+        ttl_seconds: float = 7 * 24 * 3600,
+        estimate_ttl_seconds: float = 600,
+        max_entries: int = 10000,
+    ):
+        self.enabled = enabled
+        self.precision = precision
+        self._routes: TTLCache[CachedRoute] = TTLCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        self._estimates: TTLCache[CachedRoute] = TTLCache(
+            max_entries=max_entries, ttl_seconds=estimate_ttl_seconds
+        )
+
+    @classmethod
+    def from_config(cls) -> "RouteCache":
+        """Create a cache from the route_cache section of config.yaml."""
+        return cls(
+            enabled=bool(get_config_value("route_cache", "enabled", default=True)),
+            precision=int(get_config_value("route_cache", "precision", default=3)),
+            ttl_seconds=float(
+                get_config_value("route_cache", "ttl_seconds", default=7 * 24 * 3600)
+            ),
+            estimate_ttl_seconds=float(
+                get_config_value("route_cache", "estimate_ttl_seconds", default=600)
+            ),
+            max_entries=int(
+                get_config_value("route_cache", "max_entries", default=10000)
+            ),
+        )
+
+    def key(self, start: Coordinates, end: Coordinates) -> RouteKey:
+        """Round both points and order them so the key ignores direction."""
+        a, b = (
+            (round(float(lat), self.precision), round(float(lon), self.precision))
+            for lat, lon in (start, end)
+        )
+        return (a, b) if a <= b else (b, a)
+
+    def get(
+        self, start: Coordinates, end: Coordinates, estimates: bool = True
+    ) -> Optional[CachedRoute]:
+        """Return the cached route, else (if estimates) a cached estimate, else None."""
+        if not self.enabled:
+            return None
+        key = self.key(start, end)
+        route = self._routes.get(key)
+        if route is None and estimates:
+            route = self._estimates.get(key)
+        return route
+
+    def store(
+        self,
+        start: Coordinates,
+        end: Coordinates,
+        distance_km: float,
+        duration_s: Optional[float] = None,
+    ) -> None:
+        """Store a routed distance; it replaces any estimate for the pair."""
+        if self.enabled:
+            key = self.key(start, end)
+            self._routes.set(key, CachedRoute(distance_km, duration_s))
+            self._estimates.delete(key)
+
+    def store_estimate(
+        self,
+        start: Coordinates,
+        end: Coordinates,
+        distance_km: float,
+        duration_s: Optional[float] = None,
+    ) -> None:
+        """Store an offline estimate; routed distances are never overwritten."""
+        if self.enabled:
+            self._estimates.set(
+                self.key(start, end),
+                CachedRoute(distance_km, duration_s, estimated=True),
+            )
+
+    def routes(self) -> List[Tuple[Coordinates, Coordinates, CachedRoute]]:
+        """Return the cached real routes as (start, end, route), estimates excluded."""
+        return [(start, end, route) for (start, end), route in self._routes.items()]
+
+    def clear(self) -> None:
+        """Drop every cached route and estimate."""
+        self._routes.clear()
+        self._estimates.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and occupancy of both caches."""
+        return {
+            "enabled": self.enabled,
+            "routes": self._routes.stats(),
+            "estimates": self._estimates.stats(),
+        }
+
+
+_cache: Optional[RouteCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_route_cache() -> RouteCache:
+    """Return the process-wide route cache, creating it on first use."""
+    global _cache  # pylint: disable=global-statement
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RouteCache.from_config()
+    return _cache
@@ -0,0 +1,140 @@
+"""Route matrix utility module.
+
+This module provides a RouteMatrixClient class for the OpenRouteService matrix
+endpoint. One request returns driving distances and durations for every
+source/destination pair, replacing one directions request (and a retry on
+404) per pair.
+
+The service URL defaults to the public API and can be pointed elsewhere (a
+self-hosted instance or a local stand-in for tests) with OPENROUTE_BASE_URL.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import httpx
+import requests
+
+from utils.http_client import get_async_client, get_session
+from utils.metrics import timed
+
+DEFAULT_OPENROUTE_BASE_URL = "https://api.openrouteservice.org"
+
+Coordinates = Tuple[float, float]  # (lat, lon)
+
+
+def openroute_base_url() -> str:
+    """Return the OpenRouteService base URL, honouring OPENROUTE_BASE_URL."""
+    return os.getenv("OPENROUTE_BASE_URL", DEFAULT_OPENROUTE_BASE_URL).rstrip("/")
+
+
+@dataclass(frozen=True)
+class RouteMatrix:
+    """Distances (km) and durations (s) indexed [source][destination].
+
+    Entries are None where the service found no route between the points.
+    """
+
+    distances_km: List[List[Optional[float]]]
+    durations_s: List[List[Optional[float]]]
+
+    def row(self, source: int = 0) -> List[Optional[float]]:
+        """Return the distances from one source to every destination."""
+        return self.distances_km[source]
+
+
+class RouteMatrixClient:
+    """Client for the OpenRouteService /v2/matrix endpoint."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        profile: str = "driving-car",
+        timeout: float = 20,
+    ):
+        self.api_key = api_key
+        self.base_url = (base_url or openroute_base_url()).rstrip("/")
+        self.profile = profile
+        self.timeout = timeout
+
+    @property
+    def url(self) -> str:
+        """Matrix endpoint for the configured profile."""
+        return f"{self.base_url}/v2/matrix/{self.profile}"
+
+    @staticmethod
+    def _body(
+        sources: Sequence[Coordinates], destinations: Sequence[Coordinates]
+    ) -> dict:
+        locations = [[lon, lat] for lat, lon in [*sources, *destinations]]
+        return {
+            "locations": locations,
+            "sources": list(range(len(sources))),
+            "destinations": list(range(len(sources), len(locations))),
+            "metrics": ["distance", "duration"],
+            "units": "km",
+        }
+
+    @staticmethod
+    def _parse(data: dict) -> RouteMatrix:
+        def rounded(rows, digits):
+            return [
+                [None if value is None else round(value, digits) for value in row]
+                for row in rows
+            ]
+
+        return RouteMatrix(
+            distances_km=rounded(data["distances"], 2),
+            durations_s=rounded(data["durations"], 1),
+        )
+
+    @timed("openroute", "matrix")
+    def matrix(
+        self, sources: Sequence[Coordinates], destinations: Sequence[Coordinates]
+    ) -> Optional[RouteMatrix]:
+        """
+        Route every source to every destination in a single request.
+
+        Returns:
+            RouteMatrix: The distances and durations, or None if the call failed
+        """
+        if not sources or not destinations:
+            return RouteMatrix([[] for _ in sources], [[] for _ in sources])
+        try:
+            response = get_session().post(
+                self.url,
+                json=self._body(sources, destinations),
+                headers={"Authorization": self.api_key},
+                timeout=self.timeout,
+            )
+            if response.status_code == 200:
+                return self._parse(response.json())
+            print(f"Route matrix request failed: {response.status_code}")
+            return None
+        except (requests.RequestException, KeyError, ValueError, TypeError) as e:
+            print(f"Error requesting route matrix: {e}")
+            return None
+
+    async def amatrix(
+        self, sources: Sequence[Coordinates], destinations: Sequence[Coordinates]
+    ) -> Optional[RouteMatrix]:
+        """Async variant of matrix"""
+        if not sources or not destinations:
+            return RouteMatrix([[] for _ in sources], [[] for _ in sources])
+        try:
+            with timed("openroute", "matrix"):
+                response = await get_async_client().post(
+                    self.url,
+                    json=self._body(sources, destinations),
+                    headers={"Authorization": self.api_key},
+                    timeout=self.timeout,
+                )
+            if response.status_code == 200:
+                return self._parse(response.json())
+            print(f"Route matrix request failed: {response.status_code}")
+            return None
+        except (httpx.HTTPError, KeyError, ValueError, TypeError) as e:
+            print(f"Error requesting route matrix: {e}")
+            return None
@@ -0,0 +1,52 @@
+"""Single-flight request coalescing utility module.
+
+This module provides a SingleFlight class that lets concurrent callers with the
+same key share one execution of an expensive coroutine instead of each
+starting their own.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into a single execution.
+
+    The shared execution runs in its own task, so a caller that disconnects or
+    is cancelled does not abort the work other callers are waiting on.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(
+        self, key: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """
+        Run func for key, or join an execution already in flight for key.
+
+        Returns:
+            tuple: The result and True if it was shared from another caller
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if shared:
+            self.coalesced += 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task), shared
+
+    def stats(self) -> Dict[str, int]:
+        """Return execution and coalescing counters."""
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
@@ -0,0 +1,397 @@
+"""Routable point cache utility module.
+
+This module provides a SnapCache class that remembers where OpenRouteService
+snaps each input point onto the road network, or that a point has no road
+within the widest search radius. Directions requests can then start from a
+known-good point instead of climbing the 1 km -> 5 km radius retry ladder, and
+points known to be unroutable go straight to the offline estimate.
+
+Snapped points are learned from the routes themselves, including the one
+widened retry after a 404, and unroutable points from that retry's error. They
+are kept in SQLite like the geocode cache and can be seeded for every IATA
+airport ahead of time through the snap endpoint, e.g. against a local
+OpenRouteService instance:
+
+    OPENROUTE_BASE_URL=http://localhost:8080/ors python -m utils.snap_cache
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import requests
+
+from utils.airport_store import get_airport_store
+from utils.config_loaders import get_config_value
+from utils.http_client import get_session
+from utils.metrics import timed
+from utils.route_matrix import openroute_base_url
+
+Coordinates = Tuple[float, float]  # (lat, lon)
+
+DEFAULT_PATH = ".cache/snap.sqlite3"
+DEFAULT_TTL_SECONDS = 90 * 24 * 3600
+DEFAULT_NEGATIVE_TTL_SECONDS = 7 * 24 * 3600
+# Widest search for a road, the radius the old directions retry used
+SNAP_RADIUS_M = 5000
+# Radius for unknown points in a first directions attempt
+ROUTE_RADIUS_M = 1000
+# Radius for points that are already on the road network
+SNAPPED_RADIUS_M = 50
+SEED_BATCH_SIZE = 500
+# OpenRouteService error code for "Could not find routable point within a
+# radius of ... meters of specified coordinate <i>"
+POINT_NOT_FOUND_CODE = 2010
+_COORDINATE_INDEX = re.compile(r"coordinate (\d+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snap (
+    key TEXT PRIMARY KEY,
+    lat REAL,
+    lon REAL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class SnapCache:
+    """SQLite-backed map from input points to their routable snapped points.
+
+    Attributes:
+        enabled (bool): When False every lookup misses and nothing is stored
+        path (str): Database file, or ":memory:" for a private in-process cache
+        precision (int): Decimals input points are rounded to (4 is about 10 m)
+        ttl_seconds (float): Lifetime of a snapped point
+        negative_ttl_seconds (float): Lifetime of a point with no road nearby
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str = DEFAULT_PATH,
+        enabled: bool = True,
+        precision: int = 4,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+    ):
+        self.enabled = enabled
+        self.path = str(path)
+        self.precision = precision
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+        self._db = self._connect()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(_SCHEMA)
+        db.execute("DELETE FROM snap WHERE expires_at <= ?", (time.time(),))
+        db.commit()
+        return db
+
+    @classmethod
+    def from_config(cls) -> "SnapCache":
+        """Create a cache from the snap_cache section of config.yaml."""
+        return cls(
+            path=get_config_value("snap_cache", "path", default=DEFAULT_PATH),
+            enabled=bool(get_config_value("snap_cache", "enabled", default=True)),
+            precision=int(get_config_value("snap_cache", "precision", default=4)),
+            ttl_seconds=float(
+                get_config_value(
+                    "snap_cache", "ttl_seconds", default=DEFAULT_TTL_SECONDS
+                )
+            ),
+            negative_ttl_seconds=float(
+                get_config_value(
+                    "snap_cache",
+                    "negative_ttl_seconds",
+                    default=DEFAULT_NEGATIVE_TTL_SECONDS,
+                )
+            ),
+        )
+
+    def key(self, point: Coordinates) -> str:
+        """Round a point so that inputs a few metres apart share an entry."""
+        lat, lon = (round(float(value), self.precision) for value in point)
+        return f"{lat},{lon}"
+
+    def get(self, point: Coordinates) -> Optional[Tuple[Optional[Coordinates]]]:
+        """
+        Look up an input point.
+
+        Returns:
+            tuple: (snapped point,) where the point is None when no road is
+            within reach, or None when the point has not been seen
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT lat, lon, expires_at FROM snap WHERE key = ?",
+                (self.key(point),),
+            ).fetchone()
+        if row is None or row[2] <= time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return (None,) if row[0] is None else ((row[0], row[1]),)
+
+    def learn_many(
+        self, snaps: Iterable[Tuple[Coordinates, Optional[Coordinates]]]
+    ) -> None:
+        """Store (input point, snapped point or None if unroutable) pairs."""
+        if not self.enabled:
+            return
+        now = time.time()
+        rows = []
+        for point, snapped in snaps:
+            if snapped is None:
+                rows.append(
+                    (self.key(point), None, None, now + self.negative_ttl_seconds)
+                )
+            else:
+                rows.append((self.key(point), *snapped, now + self.ttl_seconds))
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO snap VALUES (?, ?, ?, ?)", rows
+            )
+            self._db.commit()
+
+    def learn(self, point: Coordinates, snapped: Optional[Coordinates]) -> None:
+        """Store where a point snaps to; None records that it is unroutable."""
+        self.learn_many([(point, snapped)])
+
+    def clear(self) -> None:
+        """Drop every learned point."""
+        with self._lock:
+            self._db.execute("DELETE FROM snap")
+            self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the number of routable/unroutable points."""
+        with self._lock:
+            routable, unroutable = self._db.execute(
+                "SELECT COUNT(lat), COUNT(*) - COUNT(lat) FROM snap"
+            ).fetchone()
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "routable": routable,
+            "unroutable": unroutable,
+        }
+
+
+class SnapClient:
+    """Client for the OpenRouteService /v2/snap endpoint."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        profile: str = "driving-car",
+        radius_m: int = SNAP_RADIUS_M,
+        timeout: float = 20,
+    ):
+        self.api_key = api_key
+        self.base_url = (base_url or openroute_base_url()).rstrip("/")
+        self.profile = profile
+        self.radius_m = radius_m
+        self.timeout = timeout
+
+    @property
+    def url(self) -> str:
+        """Snap endpoint for the configured profile."""
+        return f"{self.base_url}/v2/snap/{self.profile}"
+
+    def _body(self, points: Sequence[Coordinates]) -> dict:
+        return {
+            "locations": [[lon, lat] for lat, lon in points],
+            "radius": self.radius_m,
+        }
+
+    @staticmethod
+    def _parse(data: dict) -> List[Optional[Coordinates]]:
+        return [
+            None if found is None else (found["location"][1], found["location"][0])
+            for found in data["locations"]
+        ]
+
+    @timed("openroute", "snap")
+    def snap(
+        self, points: Sequence[Coordinates]
+    ) -> Optional[List[Optional[Coordinates]]]:
+        """
+        Snap points onto the road network in a single request.
+
+        Returns:
+            list: The snapped point of each input, None where no road is within
+            radius_m; or None if the call failed
+        """
+        if not points:
+            return []
+        try:
+            response = get_session().post(
+                self.url,
+                json=self._body(points),
+                headers={"Authorization": self.api_key},
+                timeout=self.timeout,
+            )
+            if response.status_code == 200:
+                return self._parse(response.json())
+            print(f"Snap request failed: {response.status_code}")
+            return None
+        except (requests.RequestException, KeyError, ValueError, TypeError) as e:
+            print(f"Error requesting snapped points: {e}")
+            return None
+
+
+def route_endpoints(
+    snap_cache: SnapCache, points: Sequence[Coordinates]
+) -> Optional[List[Tuple[Coordinates, int]]]:
+    """
+    Points and search radiuses for a directions request.
+
+    Known points are replaced by their snapped point with a tight radius and
+    unknown ones keep a 1 km radius.
+
+    Returns:
+        list: (point, radius in metres) per input, or None if one of the
+        points is known to have no road within reach
+    """
+    endpoints = []
+    for point in points:
+        entry = snap_cache.get(point)
+        if entry is None:
+            endpoints.append((point, ROUTE_RADIUS_M))
+        elif entry[0] is None:
+            return None
+        else:
+            endpoints.append((entry[0], SNAPPED_RADIUS_M))
+    return endpoints
+
+
+def learn_from_route(
+    snap_cache: SnapCache, points: Sequence[Coordinates], data: dict
+) -> None:
+    """Learn the snapped start and end from a GeoJSON directions answer."""
+    geometry = data["features"][0].get("geometry") or {}
+    line = geometry.get("coordinates") or []
+    if len(line) >= 2 and len(points) == 2:
+        snap_cache.learn_many(
+            [
+                (points[0], (line[0][1], line[0][0])),
+                (points[1], (line[-1][1], line[-1][0])),
+            ]
+        )
+
+
+def widen_unknown(
+    endpoints: Sequence[Tuple[Coordinates, int]],
+) -> Optional[List[Tuple[Coordinates, int]]]:
+    """
+    Endpoints for the one retry after a directions 404.
+
+    Points not seen before search for a road up to SNAP_RADIUS_M away; the
+    route answered then starts and ends at their snapped points, which
+    learn_from_route remembers.
+
+    Returns:
+        list: The widened endpoints, or None if every point was already
+        snapped, in which case a retry cannot help
+    """
+    if all(radius != ROUTE_RADIUS_M for _, radius in endpoints):
+        return None
+    return [
+        (point, SNAP_RADIUS_M if radius == ROUTE_RADIUS_M else radius)
+        for point, radius in endpoints
+    ]
+
+
+def learn_from_failed_route(
+    snap_cache: SnapCache,
+    points: Sequence[Coordinates],
+    endpoints: Sequence[Tuple[Coordinates, int]],
+    response: Any,
+) -> None:
+    """
+    Remember the point a widened directions request found no road for.
+
+    OpenRouteService names the failing coordinate in its error message; it
+    is recorded as unroutable only if it was searched at SNAP_RADIUS_M.
+    Other failures (no route between two roads) teach nothing.
+
+    Args:
+        response: The failed requests or httpx response
+    """
+    try:
+        error = response.json()
+    except ValueError:
+        return
+    details = error.get("error") if isinstance(error, dict) else None
+    if not isinstance(details, dict) or details.get("code") != POINT_NOT_FOUND_CODE:
+        return
+    match = _COORDINATE_INDEX.search(str(details.get("message") or ""))
+    if match is None:
+        return
+    index = int(match.group(1))
+    if index < len(points) and endpoints[index][1] == SNAP_RADIUS_M:
+        snap_cache.learn(points[index], None)
+
+
+def seed_airports(
+    snap_cache: SnapCache, client: SnapClient, batch_size: int = SEED_BATCH_SIZE
+) -> Dict[str, int]:
+    """
+    Snap every airport of the IATA table that the cache does not know yet.
+
+    Returns:
+        dict: Number of airports snapped, found unroutable and left unknown
+    """
+    store = get_airport_store()
+    airports = [
+        (float(lat), float(lon))
+        for lat, lon in zip(store.lat, store.lon)
+        if lat == lat and lon == lon  # skip NaN
+    ]
+    pending = [point for point in airports if snap_cache.get(point) is None]
+    counts = {"snapped": 0, "unroutable": 0, "failed": 0}
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+        snapped = client.snap(batch)
+        if snapped is None:
+            counts["failed"] += len(batch)
+            continue
+        snap_cache.learn_many(zip(batch, snapped))
+        counts["unroutable"] += sum(point is None for point in snapped)
+        counts["snapped"] += sum(point is not None for point in snapped)
+    return counts
+
+
+_cache: Optional[SnapCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_snap_cache() -> SnapCache:
+    """Return the process-wide snap cache, opening it on first use."""
+    global _cache  # pylint: disable=global-statement
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SnapCache.from_config()
+    return _cache
+
+
+if __name__ == "__main__":
+    print(
+        seed_airports(get_snap_cache(), SnapClient(os.getenv("OPENROUTE_API_KEY", "")))
+    )
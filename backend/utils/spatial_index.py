@@ -0,0 +1,119 @@
+"""Airport spatial index utility module.
+
+This module provides an AirportSpatialIndex class that answers "which airports
+are closest to this point" by great-circle distance. Airport coordinates are
+stored once as unit vectors on the sphere, so a query is a single matrix-vector
+product followed by a partial sort, which takes microseconds for the whole
+IATA table and needs no network calls.
+"""
+
+import threading
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.airport_store import AirportStore, get_airport_store
+from utils.geodesic import EARTH_RADIUS_KM, haversine_km
+
+
+def to_unit_vectors(lat_deg: np.ndarray, lon_deg: np.ndarray) -> np.ndarray:
+    """Convert latitudes and longitudes in degrees to 3D unit vectors."""
+    lat = np.radians(lat_deg)
+    lon = np.radians(lon_deg)
+    cos_lat = np.cos(lat)
+    return np.stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)), -1)
+
+
+class AirportSpatialIndex:
+    """Exact k-nearest-neighbour search over airport coordinates.
+
+    Attributes:
+        codes (np.ndarray): IATA codes in index order
+    """
+
+    def __init__(
+        self, codes: np.ndarray, latitudes: np.ndarray, longitudes: np.ndarray
+    ):
+        known = ~(np.isnan(latitudes) | np.isnan(longitudes))
+        self.codes = codes[known]
+        self._lat = latitudes[known]
+        self._lon = longitudes[known]
+        self._vectors = to_unit_vectors(self._lat, self._lon)
+
+    @classmethod
+    def from_store(cls, store: AirportStore) -> "AirportSpatialIndex":
+        """Build the index straight from the store's coordinate columns."""
+        return cls(store.codes, store.lat, store.lon)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 5,
+        max_km: Optional[float] = None,
+        include: Optional[Callable[[str], bool]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Return the k airports closest to a point by great-circle distance.
+
+        Args:
+            lat: Latitude of the point in degrees
+            lon: Longitude of the point in degrees
+            k: Maximum number of airports to return
+            max_km: Ignore airports further away than this
+            include: Optional predicate on the IATA code to filter candidates
+
+        Returns:
+            list: (IATA code, distance in km) pairs, nearest first
+        """
+        if k <= 0 or not len(self):
+            return []
+        # cos(central angle) == dot product of unit vectors; larger is closer
+        cosines = self._vectors @ to_unit_vectors(np.float64(lat), np.float64(lon))
+        if max_km is not None:
+            candidates = np.flatnonzero(cosines >= np.cos(max_km / EARTH_RADIUS_KM))
+        else:
+            candidates = np.arange(len(cosines))
+
+        # A filter may reject candidates, so rank more of them than requested
+        wanted = k if include is None else max(k * 4, 32)
+        while True:
+            if len(candidates) > wanted:
+                top = np.argpartition(-cosines[candidates], wanted)[:wanted]
+                ranked = candidates[top]
+            else:
+                ranked = candidates
+            ranked = ranked[np.argsort(-cosines[ranked], kind="stable")]
+
+            selected = [
+                i for i in ranked if include is None or include(str(self.codes[i]))
+            ][:k]
+            if len(selected) == k or len(ranked) == len(candidates):
+                return self._with_distances(lat, lon, selected)
+            wanted *= 4
+
+    def _with_distances(
+        self, lat: float, lon: float, selected: List[int]
+    ) -> List[Tuple[str, float]]:
+        distances = haversine_km(lat, lon, self._lat[selected], self._lon[selected])
+        return [
+            (str(self.codes[i]), round(float(km), 2))
+            for i, km in zip(selected, distances)
+        ]
+
+
+_index: Optional[AirportSpatialIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_spatial_index() -> AirportSpatialIndex:
+    """Return the process-wide airport spatial index, building it on first use."""
+    global _index  # pylint: disable=global-statement
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = AirportSpatialIndex.from_store(get_airport_store())
+    return _index
@@ -0,0 +1,80 @@
+"""Stage timing utility module.
+
+This module provides a StageTimer class for recording how long each stage of a
+request (graph lookup, agent run, enrichments) takes, including stages that
+run concurrently. A timer can be bound to the current context so that code
+deeper in the call stack (LLM calls, tools, external APIs) adds its own
+timings to the request that triggered it.
+"""
+
+import contextvars
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_current_timer: contextvars.ContextVar[Optional["StageTimer"]] = contextvars.ContextVar(
+    "current_stage_timer", default=None
+)
+
+
+class StageTimer:
+    """Collects wall-clock durations of named request stages in milliseconds."""
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.timings: Dict[str, float] = {}
+
+    def record(self, name: str, elapsed_seconds: float) -> None:
+        """Record a stage duration measured elsewhere."""
+        self.timings[name] = round(elapsed_seconds * 1000, 1)
+
+    def add(self, name: str, elapsed_seconds: float) -> None:
+        """Add to a stage that may run several times (e.g. one entry per tool)."""
+        with self._lock:
+            total = self.timings.get(name, 0.0) + elapsed_seconds * 1000
+            self.timings[name] = round(total, 1)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage `name`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    async def atime(self, name: str, awaitable: Awaitable[T]) -> T:
+        """Await `awaitable` and record its duration as stage `name`."""
+        with self.stage(name):
+            return await awaitable
+
+    @contextmanager
+    def bind(self) -> Iterator["StageTimer"]:
+        """Make this timer the current request's timer for the enclosed block."""
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+    def summary(self) -> Dict[str, float]:
+        """Return all stage timings plus the total elapsed time so far."""
+        total = round((time.perf_counter() - self._started) * 1000, 1)
+        return {**self.timings, "total": total}
+
+    def server_timing(self) -> str:
+        """Format the summary as a Server-Timing header value."""
+        return ", ".join(
+            f"{re.sub(r'[^A-Za-z0-9_.-]', '_', name)};dur={duration}"
+            for name, duration in self.summary().items()
+        )
+
+
+def current_timer() -> Optional[StageTimer]:
+    """Return the timer bound to the current request, if any."""
+    return _current_timer.get()
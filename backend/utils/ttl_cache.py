@@ -0,0 +1,130 @@
+"""In-memory TTL + LRU cache utility module.
+
+This module provides a thread-safe TTLCache class that expires entries after a
+time-to-live and evicts the least recently used entries when either the entry
+count or the estimated memory footprint exceeds its bounds.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):  # pylint: disable=too-many-instance-attributes
+    """Thread-safe cache with per-entry expiry and LRU eviction.
+
+    Attributes:
+        max_entries (int): Maximum number of entries kept
+        ttl_seconds (float): Default time-to-live of an entry
+        max_bytes (int): Optional bound on the summed sizeof() of all values
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[V], int] = lambda value: 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[V, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting least recently used entries if over bounds."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return  # larger than the whole cache; never stored
+            self._entries[key] = (value, self._clock() + ttl, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def items(self) -> List[Tuple[Hashable, V]]:
+        """Return a snapshot of the unexpired entries, least recently used first."""
+        now = self._clock()
+        with self._lock:
+            return [
+                (key, value)
+                for key, (value, expires_at, _) in self._entries.items()
+                if expires_at > now
+            ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
@@ -0,0 +1,298 @@
+"""Weather response cache utility module.
+
+This module provides a WeatherCache class that keeps OpenWeatherMap answers
+keyed on endpoint, normalized place and units. Each endpoint has its own
+freshness window (minutes for current conditions, hours for forecasts) and a
+longer stale window during which the cached answer is returned at once while
+a single background refresh fetches a new one.
+
+Answers are kept in a SQLite database in WAL mode shared by every worker
+process on the host, with a small in-memory LRU in front. A refresh lease
+stored next to each answer makes sure only one worker refreshes it at a time.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Set, Tuple
+
+from utils.config_loaders import get_config_value
+from utils.executor import get_executor, run_blocking
+from utils.geocode_cache import normalize_address
+from utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = ".cache/weather.sqlite3"
+DEFAULT_TTL_SECONDS = {"weather": 600, "forecast": 3 * 3600}
+DEFAULT_STALE_SECONDS = {"weather": 3600, "forecast": 12 * 3600}
+# How long one worker may take to refresh an answer before another may try
+REFRESH_LEASE_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weather (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    refreshing_until REAL NOT NULL DEFAULT 0
+)
+"""
+
+Entry = Tuple[dict, float]  # (payload, fetched_at)
+
+
+class WeatherCache:  # pylint: disable=too-many-instance-attributes
+    """SQLite-backed stale-while-revalidate cache of weather API answers.
+
+    Attributes:
+        path (str): Database file, or ":memory:" for a private in-process cache
+        ttl_seconds (dict): Seconds an answer stays fresh, per endpoint
+        stale_seconds (dict): Further seconds a stale answer may be served
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str = DEFAULT_PATH,
+        ttl_seconds: Optional[Mapping[str, float]] = None,
+        stale_seconds: Optional[Mapping[str, float]] = None,
+        memory_entries: int = 1024,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = str(path)
+        self.ttl_seconds = {**DEFAULT_TTL_SECONDS, **(ttl_seconds or {})}
+        self.stale_seconds = {**DEFAULT_STALE_SECONDS, **(stale_seconds or {})}
+        self._clock = clock
+        # Longest time any answer may still be served, fresh or stale
+        self.max_age_seconds = max(
+            ttl + self.stale_seconds.get(endpoint, 0)
+            for endpoint, ttl in self.ttl_seconds.items()
+        )
+        self._memory: TTLCache[Entry] = TTLCache(
+            max_entries=memory_entries, ttl_seconds=self.max_age_seconds, clock=clock
+        )
+        self._lock = threading.Lock()
+        self._db = self._connect()
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Other workers may be writing; wait for their lock instead of failing
+        db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(_SCHEMA)
+        db.execute(
+            "DELETE FROM weather WHERE fetched_at < ?",
+            (self._clock() - self.max_age_seconds,),
+        )
+        db.commit()
+        return db
+
+    @classmethod
+    def from_config(cls) -> "WeatherCache":
+        """Create a cache from the weather_cache section of config.yaml."""
+        return cls(
+            path=get_config_value("weather_cache", "path", default=DEFAULT_PATH),
+            ttl_seconds=get_config_value("weather_cache", "ttl_seconds", default={}),
+            stale_seconds=get_config_value(
+                "weather_cache", "stale_seconds", default={}
+            ),
+            memory_entries=int(
+                get_config_value("weather_cache", "memory_entries", default=1024)
+            ),
+        )
+
+    @staticmethod
+    def key(endpoint: str, place: str, units: str) -> str:
+        """Build the cache key from the endpoint, normalized place and units."""
+        return f"{endpoint}|{normalize_address(place)}|{units}"
+
+    def _age(self, entry: Entry) -> float:
+        return self._clock() - entry[1]
+
+    def _load(self, key: str, ttl: float) -> Optional[Entry]:
+        entry = self._memory.get(key)
+        if entry is not None and self._age(entry) < ttl:
+            return entry
+        # Missing or stale here: another worker may have refreshed it already
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload, fetched_at FROM weather WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return entry
+        if entry is None or row[1] > entry[1]:
+            entry = (json.loads(row[0]), row[1])
+            self._memory.set(key, entry)
+        return entry
+
+    def _store(self, key: str, payload: dict) -> None:
+        fetched_at = self._clock()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO weather VALUES (?, ?, ?, 0)",
+                (key, json.dumps(payload), fetched_at),
+            )
+            self._db.commit()
+        self._memory.set(key, (payload, fetched_at))
+
+    def _claim_refresh(self, key: str, fetched_at: float) -> bool:
+        """
+        Take the refresh lease of a stale answer.
+
+        Fails if a worker already holds the lease, or has replaced the answer
+        since it was read.
+        """
+        now = self._clock()
+        with self._lock:
+            claimed = self._db.execute(
+                "UPDATE weather SET refreshing_until = ? "
+                "WHERE key = ? AND fetched_at = ? AND refreshing_until <= ?",
+                (now + REFRESH_LEASE_SECONDS, key, fetched_at, now),
+            ).rowcount
+            self._db.commit()
+        if claimed:
+            self.refreshes += 1
+        return bool(claimed)
+
+    def _ttl(self, endpoint: str) -> float:
+        return self.ttl_seconds.get(endpoint, DEFAULT_TTL_SECONDS["weather"])
+
+    def _fresh_in_memory(self, endpoint: str, key: str) -> Optional[dict]:
+        """Return a fresh answer from the in-memory LRU without touching SQLite."""
+        entry = self._memory.get(key)
+        if entry is None or self._age(entry) >= self._ttl(endpoint):
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def _cached(self, endpoint: str, key: str) -> Tuple[Optional[dict], bool]:
+        """
+        Return the usable cached payload and whether it needs a refresh.
+
+        Returns:
+            tuple: (payload or None when a fetch must block, refresh needed)
+        """
+        ttl = self._ttl(endpoint)
+        entry = self._load(key, ttl)
+        if entry is not None:
+            age = self._age(entry)
+            if age < ttl:
+                self.hits += 1
+                return entry[0], False
+            if age < ttl + self.stale_seconds.get(endpoint, 0):
+                self.stale_hits += 1
+                return entry[0], self._claim_refresh(key, entry[1])
+        self.misses += 1
+        return None, False
+
+    def _refresh(self, key: str, fetch: Callable[[], dict]) -> None:
+        try:
+            payload = fetch()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning("Weather refresh failed for %s", key, exc_info=True)
+            return
+        if payload:
+            self._store(key, payload)
+
+    async def _arefresh(self, key: str, fetch: Callable[[], Awaitable[dict]]) -> None:
+        try:
+            payload = await fetch()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning("Weather refresh failed for %s", key, exc_info=True)
+            return
+        if payload:
+            await run_blocking(self._store, key, payload)
+
+    def get_or_fetch(
+        self, endpoint: str, place: str, units: str, fetch: Callable[[], dict]
+    ) -> dict:
+        """
+        Return the cached answer for a place, fetching it only when needed.
+
+        A fresh answer is returned as is. A stale one is returned at once and
+        refreshed on the shared executor. Without a usable answer the call
+        blocks on fetch. Empty answers (failed calls) are never cached.
+        """
+        key = self.key(endpoint, place, units)
+        payload, refresh = self._cached(endpoint, key)
+        if refresh:
+            get_executor().submit(self._refresh, key, fetch)
+        if payload is not None:
+            return payload
+        payload = fetch()
+        if payload:
+            self._store(key, payload)
+        return payload
+
+    async def aget_or_fetch(
+        self,
+        endpoint: str,
+        place: str,
+        units: str,
+        fetch: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """
+        Async variant of get_or_fetch; refreshes run as event loop tasks.
+
+        Only the in-memory LRU is checked on the event loop. SQLite reads,
+        lease claims and writes may wait up to 5s for another worker's lock,
+        so they run on the shared executor.
+        """
+        key = self.key(endpoint, place, units)
+        payload, refresh = self._fresh_in_memory(endpoint, key), False
+        if payload is None:
+            payload, refresh = await run_blocking(self._cached, endpoint, key)
+        if refresh:
+            task = asyncio.get_running_loop().create_task(self._arefresh(key, fetch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if payload is not None:
+            return payload
+        payload = await fetch()
+        if payload:
+            await run_blocking(self._store, key, payload)
+        return payload
+
+    def clear(self) -> None:
+        """Drop every cached answer, in memory and on disk."""
+        with self._lock:
+            self._db.execute("DELETE FROM weather")
+            self._db.commit()
+        self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/stale/miss counters and the number of stored answers."""
+        with self._lock:
+            stored = self._db.execute("SELECT COUNT(*) FROM weather").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "stored": stored,
+            "memory": self._memory.stats(),
+        }
+
+
+_cache: Optional[WeatherCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_weather_cache() -> WeatherCache:
+    """Return the process-wide weather cache, opening it on first use."""
+    global _cache  # pylint: disable=global-statement
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = WeatherCache.from_config()
+    return _cache
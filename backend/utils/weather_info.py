@@ -1,10 +1,96 @@
 """Weather information utility module.
 
 This module provides a WeatherForecastTool class for retrieving current weather
-and forecast information using the OpenWeatherMap API.
+and forecast information using the OpenWeatherMap API. Answers are served from
+the shared weather cache, so repeated questions about a city rarely wait on
+the API. daily_forecast() condenses the 3-hour forecast slots into one
+summary per local day.
 """
 
-import requests
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from utils.config_loaders import get_config_value
+from utils.http_client import get_async_client, get_session
+from utils.weather_cache import get_weather_cache
+
+# Current conditions and forecasts are both reported in °C
+CURRENT_PARAMS = {"units": "metric"}
+# Every slot of the 5-day/3-hour forecast (the API maximum), so one cached
+# answer serves any horizon
+FORECAST_PARAMS = {"cnt": 40, "units": "metric"}
+DEFAULT_FORECAST_DAYS = 5
+
+
+def forecast_days() -> int:
+    """Number of days forecast summaries cover."""
+    return int(
+        get_config_value("weather", "forecast_days", default=DEFAULT_FORECAST_DAYS)
+    )
+
+
+@dataclass(frozen=True)
+class DailyForecast:
+    """Summary of one local day of 3-hour forecast slots (metric units)."""
+
+    date: str
+    temp_min: float
+    temp_max: float
+    precipitation_mm: float
+    precipitation_chance: float  # highest slot probability, 0-1
+    condition: str  # most frequent slot description
+
+
+def _local_date(item: dict, utc_offset: timedelta) -> str:
+    if "dt" in item:
+        moment = datetime.fromtimestamp(item["dt"], tz=timezone.utc) + utc_offset
+        return moment.date().isoformat()
+    return item["dt_txt"].split(" ")[0]
+
+
+def daily_forecast(
+    forecast_data: dict, days: int = DEFAULT_FORECAST_DAYS
+) -> List[DailyForecast]:
+    """
+    Aggregate forecast slots into per-day summaries, in the city's local time.
+
+    Returns:
+        list: One DailyForecast for each of the first `days` dates
+    """
+    utc_offset = timedelta(seconds=forecast_data.get("city", {}).get("timezone", 0))
+    slots: Dict[str, List[dict]] = {}
+    for item in forecast_data.get("list", []):
+        date = _local_date(item, utc_offset)
+        if date not in slots and len(slots) == days:
+            break
+        slots.setdefault(date, []).append(item)
+
+    summaries = []
+    for date, items in slots.items():
+        mains = [item.get("main", {}) for item in items]
+        conditions = Counter(
+            item.get("weather", [{}])[0].get("description", "N/A") for item in items
+        )
+        summaries.append(
+            DailyForecast(
+                date=date,
+                temp_min=min(m.get("temp_min", m.get("temp", 0)) for m in mains),
+                temp_max=max(m.get("temp_max", m.get("temp", 0)) for m in mains),
+                precipitation_mm=round(
+                    sum(
+                        item.get(kind, {}).get("3h", 0)
+                        for item in items
+                        for kind in ("rain", "snow")
+                    ),
+                    1,
+                ),
+                precipitation_chance=max(item.get("pop", 0) for item in items),
+                condition=conditions.most_common(1)[0][0],
+            )
+        )
+    return summaries
 
 
 class WeatherForecastTool:
@@ -13,26 +99,48 @@ class WeatherForecastTool:
     def __init__(self, api_key: str, base_url: str):
         self.api_key = api_key
         self.base_url = base_url
+        self.cache = get_weather_cache()
+
+    def _fetch(self, endpoint: str, place: str, params: dict) -> dict:
+        url = f"{self.base_url}/{endpoint}"
+        params = {"q": place, "appid": self.api_key, **params}
+        response = get_session().get(url, params=params)
+        return response.json() if response.status_code == 200 else {}
+
+    async def _afetch(self, endpoint: str, place: str, params: dict) -> dict:
+        url = f"{self.base_url}/{endpoint}"
+        params = {"q": place, "appid": self.api_key, **params}
+        response = await get_async_client().get(url, params=params)
+        return response.json() if response.status_code == 200 else {}
+
+    def _cached(self, endpoint: str, place: str, params: dict) -> dict:
+        return self.cache.get_or_fetch(
+            endpoint,
+            place,
+            params["units"],
+            lambda: self._fetch(endpoint, place, params),
+        )
+
+    async def _acached(self, endpoint: str, place: str, params: dict) -> dict:
+        return await self.cache.aget_or_fetch(
+            endpoint,
+            place,
+            params["units"],
+            lambda: self._afetch(endpoint, place, params),
+        )
 
     def get_current_weather(self, place: str):
         """Get current weather of a place"""
-        try:
-            url = f"{self.base_url}/weather"
-            params = {
-                "q": place,
-                "appid": self.api_key,
-            }
-            response = requests.get(url, params=params, timeout=10)
-            return response.json() if response.status_code == 200 else {}
-        except Exception as e:
-            raise e
+        return self._cached("weather", place, CURRENT_PARAMS)
 
     def get_forecast_weather(self, place: str):
         """Get weather forecast of a place"""
-        try:
-            url = f"{self.base_url}/forecast"
-            params = {"q": place, "appid": self.api_key, "cnt": 10, "units": "metric"}
-            response = requests.get(url, params=params, timeout=10)
-            return response.json() if response.status_code == 200 else {}
-        except Exception as e:
-            raise e
+        return self._cached("forecast", place, FORECAST_PARAMS)
+
+    async def aget_current_weather(self, place: str):
+        """Get current weather of a place without blocking the event loop"""
+        return await self._acached("weather", place, CURRENT_PARAMS)
+
+    async def aget_forecast_weather(self, place: str):
+        """Get weather forecast of a place without blocking the event loop"""
+        return await self._acached("forecast", place, FORECAST_PARAMS)